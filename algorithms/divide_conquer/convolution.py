@@ -0,0 +1,319 @@
+"""Transform-based polynomial multiplication (convolution) of Matrix vectors.
+
+- ntt_multiply: exact product of integer coefficient vectors. The number
+  theoretic transform runs modulo one or more NTT-friendly primes, as many
+  as the largest possible output coefficient needs, and the residues are
+  joined with the Chinese remainder theorem. NTT_PRIMES covers outputs up
+  to about 2**240, and further primes are generated on demand.
+- fft_multiply: floating-point product through a complex FFT. Both inputs
+  are packed into one complex signal, so the product costs two transforms
+  instead of three. Results carry rounding error of roughly
+  1e-16 * log2(n) * sum|a| * max|b|.
+- convolve: picks schoolbook, Karatsuba, NTT or FFT from the sizes and the
+  coefficient types.
+
+Transforms are iterative and radix-2 over Python lists, with no bit
+reversal: the forward pass is decimation in frequency and the inverse is
+decimation in time. Each stage runs either per block or per twiddle
+factor, whichever needs fewer interpreter-level iterations, so the inner
+work happens in list comprehensions. With the numpy backend active, typed
+inputs to fft_multiply use numpy.fft instead.
+"""
+
+from cmath import exp, pi
+
+from algorithms.divide_conquer.polynomial_multiplication import (
+    KARATSUBA_CUTOFF, karatsuba_multiply, schoolbook_multiply,
+)
+from data_structures import backend
+from data_structures.matrix import INTEGER_DTYPES, Matrix
+
+
+# (prime, primitive root); every prime is c * 2**k + 1 with k >= 23, so
+# products of up to 2**23 coefficients fit in one transform. Larger values
+# take extra primes from _ntt_primes().
+NTT_PRIMES = (
+    (2130706433, 3), (2113929217, 5), (2088763393, 5), (2013265921, 31),
+    (1811939329, 13), (1711276033, 29), (1484783617, 5), (1300234241, 3),
+)
+NTT_MAX_SIZE = 1 << 23
+NTT_THRESHOLD = 256
+FFT_THRESHOLD = 128
+
+
+def convolve(A: Matrix, B: Matrix, method: str = "auto") -> Matrix:
+    """Product of two polynomials given as 1xN coefficient vectors.
+
+    With method="auto": schoolbook when the shorter operand has at most
+    KARATSUBA_CUTOFF coefficients. Otherwise, for integer coefficients,
+    Karatsuba below NTT_THRESHOLD and NTT above it (Karatsuba also when the
+    values need more moduli than NTT_PRIMES holds). For other coefficients,
+    Karatsuba below FFT_THRESHOLD and FFT above it.
+
+    Args:
+        A: 1xN coefficients, constant term first
+        B: 1xM coefficients, constant term first
+        method: "auto", "schoolbook", "karatsuba", "ntt" or "fft"
+    Returns:
+        1x(N+M-1) product coefficients (1x0 if either input is empty)
+    """
+    if method == "auto":
+        method = choose_convolution(A, B)
+    if method == "schoolbook":
+        return schoolbook_multiply(A, B)
+    if method == "karatsuba":
+        return karatsuba_multiply(A, B)
+    if method == "ntt":
+        return ntt_multiply(A, B)
+    if method == "fft":
+        return fft_multiply(A, B)
+    raise ValueError("method must be 'auto', 'schoolbook', 'karatsuba', 'ntt' or 'fft'")
+
+
+def choose_convolution(A: Matrix, B: Matrix) -> str:
+    """The algorithm convolve(A, B) uses with method="auto"."""
+    a, b = _coefficients(A), _coefficients(B)
+    shorter = min(len(a), len(b))
+    if shorter <= KARATSUBA_CUTOFF:
+        return "schoolbook"
+    if _is_integer(A, a) and _is_integer(B, b):
+        size = len(a) + len(b) - 1
+        if shorter < NTT_THRESHOLD or len(_ntt_moduli(a, b, _transform_size(size))) > len(NTT_PRIMES):
+            return "karatsuba"
+        return "ntt"
+    return "karatsuba" if shorter < FFT_THRESHOLD else "fft"
+
+
+def ntt_multiply(A: Matrix, B: Matrix) -> Matrix:
+    """Exact product of integer coefficient vectors via NTT and CRT.
+
+    Args:
+        A: 1xN integer coefficients
+        B: 1xM integer coefficients
+    Returns:
+        1x(N+M-1) product coefficients, dtype kept when A and B share it
+    """
+    a, b = _coefficients(A), _coefficients(B)
+    if not (_is_integer(A, a) and _is_integer(B, b)):
+        raise ValueError("ntt_multiply needs integer coefficients")
+    if not a or not b:
+        return Matrix.vector([], dtype=A._result_dtype(B))
+    size = len(a) + len(b) - 1
+    n = _transform_size(size)
+    result, modulus = None, 1
+    for p, g in _ntt_moduli(a, b, n):
+        fa = _ntt([x % p for x in a] + [0] * (n - len(a)), p, g)
+        fb = _ntt([x % p for x in b] + [0] * (n - len(b)), p, g)
+        residues = _intt([x * y % p for x, y in zip(fa, fb)], p, g)[:size]
+        result, modulus = _crt(result, modulus, residues, p)
+    half = modulus // 2
+    result = [x - modulus if x > half else x for x in result]
+    return Matrix.vector(result, dtype=A._result_dtype(B))
+
+
+def fft_multiply(A: Matrix, B: Matrix) -> Matrix:
+    """Floating-point product via one forward and one inverse complex FFT.
+
+    The signal z = a + ib satisfies z * z = (a*a - b*b) + 2i (a*b), so the
+    product is half the imaginary part of IFFT(FFT(z)**2).
+
+    Args:
+        A: 1xN real coefficients
+        B: 1xM real coefficients
+    Returns:
+        1x(N+M-1) product coefficients as floats ('d' when both are typed)
+    """
+    a, b = _coefficients(A), _coefficients(B)
+    dtype = 'd' if A.dtype is not None and B.dtype is not None else None
+    if not a or not b:
+        return Matrix.vector([], dtype=dtype)
+    if backend.uses_numpy(A, B):
+        return Matrix.vector(backend.fft_convolve(A, B).tolist(), dtype=dtype)
+    size = len(a) + len(b) - 1
+    n = _transform_size(size)
+    z = [complex(x) for x in a] + [0j] * (n - len(a))
+    for i, y in enumerate(b):
+        z[i] += 1j * y
+    z = _fft(z, False)
+    z = _fft([x * x for x in z], True)
+    return Matrix.vector([x.imag / (2 * n) for x in z[:size]], dtype=dtype)
+
+
+def _coefficients(v):
+    if v.rows != 1:
+        raise ValueError("Polynomials must be represented as 1xN vectors")
+    return v.row(0)
+
+
+def _is_integer(v, values):
+    if v.dtype is not None:
+        return v.dtype in INTEGER_DTYPES
+    return all(type(x) is int for x in values)
+
+
+def _transform_size(size):
+    return 1 << (size - 1).bit_length()
+
+
+def _ntt_moduli(a, b, n):
+    """The fewest NTT primes (for length n) whose product exceeds twice the largest |coefficient|."""
+    bound = 2 * min(len(a), len(b)) * max(map(abs, a)) * max(map(abs, b))
+    moduli, modulus = [], 1
+    for p, g in _ntt_primes(n):
+        moduli.append((p, g))
+        modulus *= p
+        if modulus > bound:
+            return moduli
+
+
+def _ntt_primes(n):
+    """Yield (prime, primitive root) pairs with p = 1 (mod n), NTT_PRIMES first."""
+    if n <= NTT_MAX_SIZE:
+        yield from NTT_PRIMES
+    c = (1 << 31) // n + 1
+    while True:
+        p = c * n + 1
+        if _is_prime(p):
+            yield p, _primitive_root(p)
+        c += 1
+
+
+def _is_prime(n):
+    """Deterministic Miller-Rabin for n < 3.3e24."""
+    bases = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+    if n < 2:
+        return False
+    for q in bases:
+        if n % q == 0:
+            return n == q
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for q in bases:
+        x = pow(q, d, n)
+        if x in (1, n - 1):
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def _primitive_root(p):
+    factors, m, q = set(), p - 1, 2
+    while q * q <= m:
+        while m % q == 0:
+            factors.add(q)
+            m //= q
+        q += 1
+    if m > 1:
+        factors.add(m)
+    g = 2
+    while any(pow(g, (p - 1) // q, p) == 1 for q in factors):
+        g += 1
+    return g
+
+
+def _crt(result, modulus, residues, p):
+    """Extend `result` (mod modulus) with `residues` (mod p) by Garner's step."""
+    if result is None:
+        return residues, p
+    inverse = pow(modulus, -1, p)
+    result = [x + modulus * ((r - x) * inverse % p) for x, r in zip(result, residues)]
+    return result, modulus * p
+
+
+def _stages(n):
+    """Half-lengths n/2, n/4, ..., 1 with each stage's twiddle stride."""
+    h = n // 2
+    while h:
+        yield h, n // (2 * h)
+        h //= 2
+
+
+def _ntt(a, p, g):
+    """Forward NTT mod p, decimation in frequency (output in bit-reversed order)."""
+    n = len(a)
+    w = pow(g, (p - 1) // n, p)
+    powers = _powers(w, n // 2, p)
+    for h, stride in _stages(n):
+        twiddles = powers[::stride]
+        if 2 * h * h >= n:
+            for s in range(0, n, 2 * h):
+                u, v = a[s:s + h], a[s + h:s + 2 * h]
+                a[s:s + h] = [(x + y) % p for x, y in zip(u, v)]
+                a[s + h:s + 2 * h] = [(x - y) * t % p for x, y, t in zip(u, v, twiddles)]
+        else:
+            for j in range(h):
+                t = twiddles[j]
+                u, v = a[j::2 * h], a[j + h::2 * h]
+                a[j::2 * h] = [(x + y) % p for x, y in zip(u, v)]
+                a[j + h::2 * h] = [(x - y) * t % p for x, y in zip(u, v)]
+    return a
+
+
+def _intt(a, p, g):
+    """Inverse NTT mod p, decimation in time (input in bit-reversed order)."""
+    n = len(a)
+    w = pow(g, (p - 1) - (p - 1) // n, p)
+    powers = _powers(w, n // 2, p)
+    for h, stride in reversed(list(_stages(n))):
+        twiddles = powers[::stride]
+        if 2 * h * h >= n:
+            for s in range(0, n, 2 * h):
+                u = a[s:s + h]
+                v = [y * t % p for y, t in zip(a[s + h:s + 2 * h], twiddles)]
+                a[s:s + h] = [(x + y) % p for x, y in zip(u, v)]
+                a[s + h:s + 2 * h] = [(x - y) % p for x, y in zip(u, v)]
+        else:
+            for j in range(h):
+                t = twiddles[j]
+                u = a[j::2 * h]
+                v = [y * t % p for y in a[j + h::2 * h]]
+                a[j::2 * h] = [(x + y) % p for x, y in zip(u, v)]
+                a[j + h::2 * h] = [(x - y) % p for x, y in zip(u, v)]
+    scale = pow(n, -1, p)
+    return [x * scale % p for x in a]
+
+
+def _powers(w, count, p):
+    out = [1] * count
+    for i in range(1, count):
+        out[i] = out[i - 1] * w % p
+    return out
+
+
+def _fft(a, inverse):
+    """Unnormalized complex FFT: forward by decimation in frequency, inverse in time."""
+    n = len(a)
+    sign = 1 if inverse else -1
+    roots = [exp(sign * 2j * pi * k / n) for k in range(n // 2)]
+    stages = list(_stages(n))
+    for h, stride in (reversed(stages) if inverse else stages):
+        twiddles = roots[::stride]
+        if 2 * h * h >= n:
+            for s in range(0, n, 2 * h):
+                u, v = a[s:s + h], a[s + h:s + 2 * h]
+                if inverse:
+                    v = [y * t for y, t in zip(v, twiddles)]
+                    a[s:s + h] = [x + y for x, y in zip(u, v)]
+                    a[s + h:s + 2 * h] = [x - y for x, y in zip(u, v)]
+                else:
+                    a[s:s + h] = [x + y for x, y in zip(u, v)]
+                    a[s + h:s + 2 * h] = [(x - y) * t for x, y, t in zip(u, v, twiddles)]
+        else:
+            for j in range(h):
+                t = twiddles[j]
+                u, v = a[j::2 * h], a[j + h::2 * h]
+                if inverse:
+                    v = [y * t for y in v]
+                    a[j::2 * h] = [x + y for x, y in zip(u, v)]
+                    a[j + h::2 * h] = [x - y for x, y in zip(u, v)]
+                else:
+                    a[j::2 * h] = [x + y for x, y in zip(u, v)]
+                    a[j + h::2 * h] = [(x - y) * t for x, y in zip(u, v)]
+    return a
@@ -1,24 +1,427 @@
-from data_structures.matrix import Matrix
+from array import array
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from heapq import merge as kway_merge
+from itertools import islice
+import os
+import tempfile
+
+from data_structures.matrix import Matrix, pack_file_header
+from data_structures.parallel import SHAREABLE_DTYPES, attach_block, create_block, release_block
+
+
+MIN_RUN = 32
+MIN_GALLOP = 7
+EXTERNAL_SORT_MEMORY = 64 * 2**20
+MIN_MERGE_BLOCK = 4096
+
 
 def merge(matrix1: Matrix, matrix2: Matrix) -> Matrix:
+    """Concatenate two matrices side by side (row i = row i of matrix1 + row i of matrix2)."""
     if matrix1.rows != matrix2.rows:
         raise ValueError("Matrices must have the same number of rows to merge")
-    merged = Matrix(matrix1.rows, matrix1.cols + matrix2.cols)
-    for i in range(matrix1.rows):
-        for j in range(matrix1.cols):
-            merged.set(i, j, matrix1.get(i, j))
-        for j in range(matrix2.cols):
-            merged.set(i, j + matrix1.cols, matrix2.get(i, j))
+    dtype = matrix1.dtype if matrix1.dtype == matrix2.dtype else None
+    rows, cols1 = matrix1.rows, matrix1.cols
+    merged = Matrix(rows, cols1 + matrix2.cols, dtype=dtype)
+    merged.set_submatrix(0, rows, 0, cols1, matrix1)
+    merged.set_submatrix(0, rows, cols1, merged.cols, matrix2)
     return merged
 
-def merge_sort_vector(v: Matrix) -> Matrix:
+def merge_sort_vector(v: Matrix, workers: int | None = None) -> Matrix:
     """Return a sorted copy of a 1xN vector using merge sort.
 
     Args:
         v: Matrix with shape 1xN
+        workers: with N > 1, sort a typed vector on N processes (parallel_sort)
     Returns:
         new Matrix(1xN) sorted non-decreasing
     """
+    if workers is not None and workers > 1:
+        return parallel_sort(v, workers)
     return v.merge_sort()
 
 
+def parallel_sort(v: Matrix, workers: int) -> Matrix:
+    """Stable sort of a typed 1xN vector on `workers` processes.
+
+    Parallel sorting by regular sampling over one shared-memory block
+    holding the input and the output region:
+    1. The input is cut into `workers` chunks. Each worker sorts one chunk
+       in place with merge_sort_buffer() and returns workers - 1 evenly
+       spaced samples.
+    2. The parent sorts the samples, picks workers - 1 splitters and cuts
+       every sorted chunk at them (see _cuts; runs of items equal to a
+       splitter are split by position, so repeated keys still balance).
+       This yields one bucket of pieces per worker, and each bucket's final
+       offset in the output.
+    3. Each worker k-way merges its pieces straight into the output region.
+    Equal items keep their input order. The result is copied out once.
+
+    Args:
+        v: Matrix with shape 1xN and a dtype from data_structures.parallel.SHAREABLE_DTYPES
+        workers: number of worker processes
+    Returns:
+        new Matrix(1xN) sorted non-decreasing
+    """
+    if v.rows != 1:
+        raise ValueError("Parallel sort works only for 1xN matrices")
+    dtype = v.dtype
+    if dtype is None or dtype not in SHAREABLE_DTYPES:
+        raise ValueError(f"workers= needs a vector typed with a dtype from {SHAREABLE_DTYPES!r}")
+    n = v.cols
+    if workers < 2 or n < 2 * workers:
+        return v.merge_sort()
+    size = 2 * n
+    shm, buf = create_block(dtype, size)
+    try:
+        buf[:n] = array(dtype, v.row(0))
+        step = -(-n // workers)
+        chunks = [(lo, min(lo + step, n)) for lo in range(0, n, step)]
+        parts = len(chunks)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_sort_chunk, shm.name, dtype, size, lo, hi, parts)
+                       for lo, hi in chunks]
+            samples = sorted(x for future in futures for x in future.result())
+            splitters = [samples[i * len(samples) // parts] for i in range(1, parts)]
+            cuts = _cuts(buf, chunks, splitters, n)
+            jobs, out = [], n
+            for b in range(parts):
+                pieces = [(c[b], c[b + 1]) for c in cuts]
+                jobs.append(pool.submit(_merge_bucket, shm.name, dtype, size, pieces, out))
+                out += sum(hi - lo for lo, hi in pieces)
+            for future in jobs:
+                future.result()
+        result = Matrix.from_buffer(buf[n:], 1, n, dtype)
+    finally:
+        release_block(shm, buf, unlink=True)
+    return result
+
+
+def _cuts(buf, chunks, splitters, n):
+    """Bucket boundaries in every sorted chunk of buf: [lo, cut_1, ..., hi] per chunk.
+
+    Items below splitter i go left of cut i and items above it go right.
+    Items equal to it fill the left side, in input order (chunk by chunk),
+    until i * n / parts items precede the cut, so a dominant key is shared
+    between buckets instead of filling one of them.
+    """
+    parts = len(splitters) + 1
+    cuts = [[lo] for lo, _ in chunks]
+    for i, x in enumerate(splitters, 1):
+        low = [bisect_left(buf, x, lo, hi) for lo, hi in chunks]
+        high = [bisect_right(buf, x, lo, hi) for lo, hi in chunks]
+        take = i * n // parts - sum(l - lo for l, (lo, _) in zip(low, chunks))
+        for c in range(len(chunks)):
+            equal = min(max(take, 0), high[c] - low[c])
+            cuts[c].append(low[c] + equal)
+            take -= equal
+    for c, (_, hi) in enumerate(chunks):
+        cuts[c].append(hi)
+    return cuts
+
+
+def _sort_chunk(name, dtype, size, lo, hi, parts):
+    """Worker: sort buf[lo:hi] in place; return parts - 1 regular samples."""
+    shm, buf = attach_block(name, dtype, size)
+    try:
+        values = merge_sort_buffer(buf[lo:hi].tolist())
+        buf[lo:hi] = array(dtype, values)
+        return [values[i * len(values) // parts] for i in range(1, parts)]
+    finally:
+        release_block(shm, buf)
+
+
+def _merge_bucket(name, dtype, size, pieces, out):
+    """Worker: k-way merge the sorted buf slices in `pieces` into buf[out:]."""
+    shm, buf = attach_block(name, dtype, size)
+    try:
+        merged = array(dtype, kway_merge(*[buf[lo:hi].tolist() for lo, hi in pieces]))
+        buf[out:out + len(merged)] = merged
+    finally:
+        release_block(shm, buf)
+
+
+def merge_sort_buffer(a, aux=None):
+    """Stable bottom-up merge sort of a flat list or array.
+
+    Natural runs are detected first (strictly descending runs are reversed)
+    and short runs are extended to MIN_RUN items with binary insertion sort,
+    so presorted input costs a single pass. Runs are then merged pairwise,
+    level by level, ping-ponging between `a` and one auxiliary buffer of the
+    same length; merges gallop once one side wins MIN_GALLOP times in a row.
+    Only `<` is used to compare items.
+
+    Args:
+        a: list or array to sort; it is used as scratch space
+        aux: optional buffer of the same type and length, reused instead of
+            allocating one
+    Returns:
+        the sorted buffer: either `a` or the auxiliary buffer
+    Raises:
+        TypeError: `a` is not a list or array (an ndarray slice is a view, so
+            it cannot serve as the second buffer)
+    """
+    if not isinstance(a, (list, array)):
+        raise TypeError("merge_sort_buffer needs a list or array.array")
+    n = len(a)
+    bounds = _find_runs(a, n)
+    if len(bounds) <= 2:
+        return a
+    if aux is None:
+        aux = a[:]
+    src, dst = a, aux
+    while len(bounds) > 2:
+        merged = [0]
+        for t in range(0, len(bounds) - 2, 2):
+            lo, mid, hi = bounds[t], bounds[t + 1], bounds[t + 2]
+            _merge(src, dst, lo, mid, hi)
+            merged.append(hi)
+        if len(bounds) % 2 == 0:  # odd number of runs: carry the last one over
+            lo = bounds[-2]
+            dst[lo:n] = src[lo:n]
+            merged.append(n)
+        bounds = merged
+        src, dst = dst, src
+    return src
+
+
+def _find_runs(a, n):
+    """Split a into ascending runs of at least MIN_RUN items; return run boundaries."""
+    bounds = [0]
+    lo = 0
+    while lo < n:
+        hi = lo + 1
+        if hi < n:
+            if a[hi] < a[lo]:
+                while hi + 1 < n and a[hi + 1] < a[hi]:
+                    hi += 1
+                hi += 1
+                a[lo:hi] = a[lo:hi][::-1]
+            else:
+                while hi + 1 < n and not a[hi + 1] < a[hi]:
+                    hi += 1
+                hi += 1
+        if hi - lo < MIN_RUN:
+            end = min(lo + MIN_RUN, n)
+            _binary_insertion_sort(a, lo, hi, end)
+            hi = end
+        bounds.append(hi)
+        lo = hi
+    return bounds
+
+
+def _binary_insertion_sort(a, lo, start, hi):
+    """Extend the sorted prefix a[lo:start] to a sorted a[lo:hi].
+
+    Stable; shifts with slice moves. Also the small-range sort of introsort
+    in algorithms.quick_sort (with start = lo + 1).
+    """
+    for i in range(start, hi):
+        x = a[i]
+        pos = bisect_right(a, x, lo, i)
+        if pos < i:
+            a[pos + 1:i + 1] = a[pos:i]
+            a[pos] = x
+
+
+def _gallop(src, x, start, end, right):
+    """Index past the prefix of sorted src[start:end] that goes before x.
+
+    With right=True the prefix is the items <= x (as bisect_right), else the
+    items < x (as bisect_left). Probes 1, 2, 4, ... items ahead before the
+    final binary search, so short prefixes cost O(log prefix).
+    """
+    lo, step = start, 1
+    while start + step < end:
+        probe = src[start + step]
+        if (x < probe) if right else not (probe < x):
+            break
+        lo = start + step
+        step *= 2
+    hi = min(start + step, end)
+    if right:
+        return bisect_right(src, x, lo, hi)
+    return bisect_left(src, x, lo, hi)
+
+
+def _merge(src, dst, lo, mid, hi):
+    """Stable merge of sorted src[lo:mid] and src[mid:hi] into dst[lo:hi]."""
+    if not src[mid] < src[mid - 1]:  # already in order
+        dst[lo:hi] = src[lo:hi]
+        return
+    i, j, k = lo, mid, lo
+    left_wins = right_wins = 0
+    while i < mid and j < hi:
+        x, y = src[i], src[j]
+        if y < x:
+            dst[k] = y
+            j += 1
+            right_wins += 1
+            left_wins = 0
+        else:
+            dst[k] = x
+            i += 1
+            left_wins += 1
+            right_wins = 0
+        k += 1
+        if left_wins >= MIN_GALLOP and i < mid and j < hi:
+            end = _gallop(src, src[j], i, mid, right=True)
+            dst[k:k + end - i] = src[i:end]
+            k += end - i
+            i = end
+            left_wins = 0
+        elif right_wins >= MIN_GALLOP and i < mid and j < hi:
+            end = _gallop(src, src[i], j, hi, right=False)
+            dst[k:k + end - j] = src[j:end]
+            k += end - j
+            j = end
+            right_wins = 0
+    dst[k:k + mid - i] = src[i:mid]
+    k += mid - i
+    dst[k:k + hi - j] = src[j:hi]
+
+
+# ---- External (out-of-core) sorting ----
+def external_sort(source, max_memory: int = EXTERNAL_SORT_MEMORY, dtype=None,
+                  output=None, tmp_dir=None):
+    """Stable sort of more numeric records than fit in memory.
+
+    1. Records are read in chunks of max_memory / (2 * itemsize) items.
+       Each chunk is sorted with merge_sort_buffer() (the chunk plus its
+       auxiliary buffer fill the budget) and spilled to a temporary file as
+       raw `dtype` items.
+    2. The sorted runs are merged through a heap (heapq.merge), each read
+       through a buffer of its share of max_memory. With more runs than the
+       budget allows (each reader needs MIN_MERGE_BLOCK items), groups of
+       runs are first merged into longer runs.
+    The temporary files are removed when the output is exhausted or closed.
+
+    Args:
+        source: iterable of numbers, a typed Matrix (entries in row-major
+            order, e.g. from Matrix.open) or the path of a Matrix file
+        max_memory: approximate byte budget for record buffers
+        dtype: array typecode of the records; defaults to the Matrix's dtype,
+            or 'q' (64-bit ints) for iterables
+        output: optional path; the result is written there as a 1xN Matrix
+            file instead of being yielded
+        tmp_dir: directory for the spilled runs (default: system temp dir)
+    Returns:
+        a generator of the records in sorted order, or the number of records
+        written when `output` is given
+    """
+    if isinstance(source, (str, os.PathLike)):
+        source = Matrix.open(source)
+    if isinstance(source, Matrix):
+        dtype = dtype or source.dtype
+    dtype = dtype or 'q'
+    itemsize = array(dtype).itemsize
+    if max_memory < 2 * itemsize * MIN_RUN:
+        raise ValueError("max_memory is too small to sort a single run")
+    records = _external_sort_iter(source, max_memory, dtype, tmp_dir)
+    if output is None:
+        return records
+    return _write_vector_file(output, records, dtype)
+
+
+def _external_sort_iter(source, max_memory, dtype, tmp_dir):
+    itemsize = array(dtype).itemsize
+    with tempfile.TemporaryDirectory(dir=tmp_dir) as tmp:
+        runs = _spill_runs(source, dtype, max_memory // (2 * itemsize), tmp)
+        fan_in = max(2, max_memory // (itemsize * MIN_MERGE_BLOCK) - 1)
+        generation = 0
+        while len(runs) > fan_in:
+            generation += 1
+            merged_runs = []
+            for g in range(0, len(runs), fan_in):
+                group = runs[g:g + fan_in]
+                path = os.path.join(tmp, f"run-{generation}-{g}.bin")
+                block = max_memory // ((len(group) + 1) * itemsize)
+                _write_run(path, kway_merge(*[_read_run(r, dtype, block) for r in group]), dtype, block)
+                for r in group:
+                    os.remove(r)
+                merged_runs.append(path)
+            runs = merged_runs
+        block = max(1, max_memory // ((len(runs) + 1) * itemsize))
+        yield from kway_merge(*[_read_run(r, dtype, block) for r in runs])
+
+
+def _source_blocks(source, block_items):
+    """Yield successive blocks of at most block_items records from the source."""
+    if isinstance(source, Matrix):
+        for i in range(source.rows):
+            for lo in range(0, source.cols, block_items):
+                yield source.view(i, lo, i + 1, min(lo + block_items, source.cols)).row(0)
+        return
+    it = iter(source)
+    while True:
+        block = list(islice(it, block_items))
+        if not block:
+            return
+        yield block
+
+
+def _spill_runs(source, dtype, chunk_items, tmp):
+    """Sort the source chunk by chunk into run files; return their paths."""
+    runs = []
+    chunk = array(dtype)
+    for block in _source_blocks(source, min(chunk_items, MIN_MERGE_BLOCK)):
+        while block:
+            take = chunk_items - len(chunk)
+            chunk.extend(block[:take])
+            block = block[take:]
+            if len(chunk) == chunk_items:
+                runs.append(_spill(chunk, tmp, len(runs)))
+                chunk = array(dtype)
+    if chunk or not runs:
+        runs.append(_spill(chunk, tmp, len(runs)))
+    return runs
+
+
+def _spill(chunk, tmp, index):
+    path = os.path.join(tmp, f"run-0-{index}.bin")
+    with open(path, "wb") as f:
+        merge_sort_buffer(chunk).tofile(f)
+    return path
+
+
+def _read_run(path, dtype, block_items):
+    """Stream the items of a run file, reading block_items at a time."""
+    with open(path, "rb") as f:
+        while True:
+            block = array(dtype)
+            try:
+                block.fromfile(f, block_items)
+            except EOFError:  # last, partial block
+                pass
+            if not block:
+                return
+            yield from block
+
+
+def _write_items(f, items, dtype, block_items):
+    """Write an item stream to an open file as raw `dtype` items; return the count."""
+    count = 0
+    block = array(dtype)
+    for x in items:
+        block.append(x)
+        if len(block) >= block_items:
+            block.tofile(f)
+            count += len(block)
+            block = array(dtype)
+    block.tofile(f)
+    return count + len(block)
+
+
+def _write_run(path, items, dtype, block_items):
+    with open(path, "wb") as f:
+        return _write_items(f, items, dtype, block_items)
+
+
+def _write_vector_file(path, items, dtype):
+    """Write an item stream as a 1xN Matrix file; the header is patched at the end."""
+    with open(path, "wb") as f:
+        f.write(pack_file_header(dtype, 1, 0))
+        count = _write_items(f, items, dtype, MIN_MERGE_BLOCK)
+        f.seek(0)
+        f.write(pack_file_header(dtype, 1, count))
+    return count
@@ -1,4 +1,18 @@
+from array import array
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from operator import gt, lt
+
+from data_structures import backend
 from data_structures.matrix import Matrix
+from data_structures.parallel import SHAREABLE_DTYPES, attach_block, create_block, release_block
+from data_structures.queue import Deque
+
+
+REDUCE_CHUNK = 1 << 16
+
+Reduction = namedtuple("Reduction", "min max argmin argmax sum count")
+Reduction.__doc__ = """Result of reduce_stats(): extrema, their first positions, sum and count."""
 
 def formal_min(matrix: Matrix, col: int) -> int:
     """Return the minimum of first `col` elements in a 1xN Matrix vector.
@@ -11,20 +25,13 @@ def formal_min(matrix: Matrix, col: int) -> int:
     """
     if matrix.is_empty() or not (0 < col <= matrix.cols):
         raise ValueError("Matrix is empty or column index is out of bounds")
-    min_value = matrix.get(0, 0)
-    for i in range(1, col):
-        if matrix.get(0, i) < min_value:
-            min_value = matrix.get(0, i)
-    return min_value
+    return reduce_stats(matrix.view(0, 0, 1, col)).min
+
 def formal_max(matrix: Matrix, col: int) -> int:
     """Return the maximum of first `col` elements in a 1xN Matrix vector."""
     if matrix.is_empty() or not (0 < col <= matrix.cols):
         raise ValueError("Matrix is empty or column index is out of bounds")
-    max_value = matrix.get(0, 0)
-    for i in range(1, col):
-        if matrix.get(0, i) > max_value:
-            max_value = matrix.get(0, i)
-    return max_value
+    return reduce_stats(matrix.view(0, 0, 1, col)).max
 
 def formal_min_max(matrix: Matrix) -> tuple[int, int]:
     """Compute min and max of a 1xN Matrix vector by scanning once."""
@@ -33,29 +40,8 @@ def formal_min_max(matrix: Matrix) -> tuple[int, int]:
     col = matrix.cols
     if col == 0:
         raise ValueError("Matrix has no columns")
-    min_value = matrix.get(0, 0)
-    max_value = matrix.get(0, 0)
-    if col == 1:
-        return min_value, max_value
-    
-    # Optimized for pairs
-    for i in range(0, col - 1, 2):
-        a = matrix.get(0, i)
-        b = matrix.get(0, i + 1)
-        if a < b:
-            if a < min_value: min_value = a
-            if b > max_value: max_value = b
-        else:
-            if b < min_value: min_value = b
-            if a > max_value: max_value = a
-    
-    # Handle odd number of elements
-    if col % 2 != 0:
-        last_val = matrix.get(0, col - 1)
-        if last_val < min_value: min_value = last_val
-        if last_val > max_value: max_value = last_val
-        
-    return min_value, max_value
+    stats = reduce_stats(matrix.view(0, 0, 1, col))
+    return stats.min, stats.max
 
 def min_max(l: int, r: int, matrix: Matrix) -> tuple[int, int]:
     """Divide-and-conquer min/max on subarray [l..r] of Matrix vector.
@@ -79,4 +65,211 @@ def min_max(l: int, r: int, matrix: Matrix) -> tuple[int, int]:
     min2, max2 = min_max(mid + 1, r, matrix)
     allmin = min1 if min1 < min2 else min2
     allmax = max1 if max1 > max2 else max2
-    return allmin, allmax
\ No newline at end of file
+    return allmin, allmax
+
+
+def reduce_stats(matrix: Matrix, axis: int | None = None, workers: int | None = None):
+    """Min, max, argmin, argmax, sum and count in one fused pass.
+
+    Entries are read in chunks of REDUCE_CHUNK items and compared in pairs:
+    the smaller of each pair only challenges the minimum and the larger only
+    the maximum, so n items cost about 3n/2 comparisons. argmin and argmax
+    report the first position of the extreme. Under the numpy backend typed
+    matrices are reduced by backend.reduce_lines() instead.
+
+    Args:
+        matrix: non-empty Matrix
+        axis: None reduces every entry (positions are row-major flat indices,
+            which for a 1xN vector are the column indices); 1 reduces each
+            row and 0 each column (positions index within the row / column)
+        workers: with N > 1 and axis=None, split a typed matrix (dtype from
+            data_structures.parallel.SHAREABLE_DTYPES) into N contiguous
+            chunks reduced on N processes over one shared-memory block.
+            Worth it from tens of millions of entries.
+    Returns:
+        a Reduction for axis=None, else a list of Reductions (one per row
+        for axis=1, one per column for axis=0)
+    """
+    if matrix.is_empty():
+        raise ValueError("Matrix is empty")
+    if axis not in (None, 0, 1):
+        raise ValueError("axis must be None, 0 or 1")
+    if backend.uses_numpy(matrix):
+        count = {None: matrix.rows * matrix.cols, 1: matrix.cols, 0: matrix.rows}[axis]
+        stats = [Reduction(*line, count) for line in zip(*backend.reduce_lines(matrix, axis))]
+        return stats[0] if axis is None else stats
+    if axis == 1:
+        return [_reduce_values(matrix._row_values(i)) for i in range(matrix.rows)]
+    if axis == 0:
+        return [_reduce_values(matrix.col(j)) for j in range(matrix.cols)]
+    if workers is not None and workers > 1:
+        return _parallel_reduce(matrix, workers)
+    total = None
+    for i in range(matrix.rows):
+        stats = _reduce_values(matrix._row_values(i), i * matrix.cols)
+        total = stats if total is None else _merge_stats(total, stats)
+    return total
+
+
+def _reduce_values(values, base: int = 0) -> Reduction:
+    """Reduce a flat sequence chunk by chunk; positions are offset by `base`."""
+    total = None
+    for start in range(0, len(values), REDUCE_CHUNK):
+        chunk = values[start:start + REDUCE_CHUNK]
+        if not isinstance(chunk, list):
+            chunk = chunk.tolist()
+        stats = _reduce_chunk(chunk, base + start)
+        total = stats if total is None else _merge_stats(total, stats)
+    return total
+
+
+def _reduce_chunk(v: list, base: int) -> Reduction:
+    """Fused pairwise min/max/argmin/argmax/sum over a non-empty list."""
+    n = len(v)
+    lo = hi = v[0]
+    ilo = ihi = 0
+    total = 0
+    for i in range(0, n - 1, 2):
+        a = v[i]
+        b = v[i + 1]
+        total += a + b
+        if b < a:
+            if b < lo:
+                lo = b
+                ilo = i + 1
+            if a > hi:
+                hi = a
+                ihi = i
+        else:
+            if a < lo:
+                lo = a
+                ilo = i
+            if b > hi:
+                hi = b
+                ihi = i + 1 if a < b else i
+    if n % 2:
+        last = v[-1]
+        total += last
+        if last < lo:
+            lo = last
+            ilo = n - 1
+        if last > hi:
+            hi = last
+            ihi = n - 1
+    return Reduction(lo, hi, base + ilo, base + ihi, total, n)
+
+
+def _merge_stats(first: Reduction, second: Reduction) -> Reduction:
+    """Combine the reductions of two consecutive ranges (first comes first)."""
+    lo, ilo = (second.min, second.argmin) if second.min < first.min else (first.min, first.argmin)
+    hi, ihi = (second.max, second.argmax) if second.max > first.max else (first.max, first.argmax)
+    return Reduction(lo, hi, ilo, ihi, first.sum + second.sum, first.count + second.count)
+
+
+def _parallel_reduce(matrix: Matrix, workers: int) -> Reduction:
+    """reduce_stats(axis=None) over one shared block on `workers` processes."""
+    dtype = matrix.dtype
+    if dtype is None or dtype not in SHAREABLE_DTYPES:
+        raise ValueError(f"workers= needs a matrix typed with a dtype from {SHAREABLE_DTYPES!r}")
+    rows, cols = matrix.rows, matrix.cols
+    size = rows * cols
+    shm, buf = create_block(dtype, size)
+    try:
+        for i in range(rows):
+            values = matrix._row_values(i)
+            buf[i * cols:(i + 1) * cols] = values if isinstance(values, array) else array(dtype, values)
+        step = max(REDUCE_CHUNK, -(-size // workers))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_reduce_block, shm.name, dtype, size, lo, min(lo + step, size))
+                       for lo in range(0, size, step)]
+            parts = [future.result() for future in futures]
+    finally:
+        release_block(shm, buf, unlink=True)
+    total = parts[0]
+    for stats in parts[1:]:
+        total = _merge_stats(total, stats)
+    return total
+
+
+def _reduce_block(name, dtype, size, lo, hi):
+    """Worker: reduce buf[lo:hi]; positions are flat indices into the block."""
+    shm, buf = attach_block(name, dtype, size)
+    try:
+        return _reduce_values(buf[lo:hi], lo)
+    finally:
+        release_block(shm, buf)
+
+
+def sliding_window_min(values, window: int):
+    """Lazily yield the minimum of every `window` consecutive items.
+
+    A monotonic deque holds (index, value) pairs with strictly increasing
+    values: each new item evicts the larger items from the back, and the
+    front leaves once it slides out of the window. Every item enters and
+    leaves the deque at most once, so the cost is amortized O(1) per item,
+    and memory is bounded by the window size.
+
+    Args:
+        values: Matrix(1, N) vector or any iterable (e.g. a sensor stream)
+        window: window length (>= 1)
+    Returns:
+        iterator over the N - window + 1 window minima
+    """
+    return _sliding_extreme(_stream(values, window), window, lt)
+
+
+def sliding_window_max(values, window: int):
+    """Lazily yield the maximum of every `window` consecutive items.
+
+    Same as sliding_window_min() with the deque kept strictly decreasing.
+    """
+    return _sliding_extreme(_stream(values, window), window, gt)
+
+
+def sliding_window_min_max(values, window: int):
+    """Lazily yield (min, max) of every `window` consecutive items in one pass."""
+    return _window_min_max(_stream(values, window), window)
+
+
+def _stream(values, window):
+    """Validate the window and return an iterator over the items."""
+    if window < 1:
+        raise ValueError("window must be at least 1")
+    if isinstance(values, Matrix):
+        if values.rows != 1:
+            raise ValueError("Sliding windows need a 1xN vector")
+        return _vector_items(values)
+    return iter(values)
+
+
+def _vector_items(v):
+    """Yield a vector's entries, copying REDUCE_CHUNK of them at a time."""
+    for start in range(0, v.cols, REDUCE_CHUNK):
+        yield from v.view(0, start, 1, min(start + REDUCE_CHUNK, v.cols)).row(0)
+
+
+def _push(deque, i, x, keep, window):
+    """Add item i to a monotonic deque and drop entries that left the window."""
+    while deque and not keep(deque.peek_back()[1], x):
+        deque.pop_back()
+    deque.enqueue((i, x))
+    if deque.peek()[0] <= i - window:
+        deque.dequeue()
+
+
+def _sliding_extreme(items, window, keep):
+    """Window extrema; keep(back, new) says whether the deque's back survives."""
+    deque = Deque(window + 1)
+    for i, x in enumerate(items):
+        _push(deque, i, x, keep, window)
+        if i >= window - 1:
+            yield deque.peek()[1]
+
+
+def _window_min_max(items, window):
+    lows, highs = Deque(window + 1), Deque(window + 1)
+    for i, x in enumerate(items):
+        _push(lows, i, x, lt, window)
+        _push(highs, i, x, gt, window)
+        if i >= window - 1:
+            yield lows.peek()[1], highs.peek()[1]
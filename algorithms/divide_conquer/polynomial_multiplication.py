@@ -1,73 +1,150 @@
+from itertools import repeat
+from operator import add, mul, sub
+
 from data_structures.matrix import Matrix
 
+
+KARATSUBA_CUTOFF = 32
+
+
 def dc_polynomial_multiply(A: Matrix, B: Matrix) -> Matrix:
     """Multiplies two polynomials represented as 1xN coefficient vectors.
 
     This function implements a divide-and-conquer algorithm (Karatsuba's method)
     for polynomial multiplication. It is more efficient than the naive O(n^2)
-    approach for large polynomials.
+    approach for large polynomials. See karatsuba_multiply().
 
     Args:
         A: A 1xN Matrix representing the coefficients of the first polynomial.
-        B: A 1xN Matrix representing the coefficients of the second polynomial.
-           Both matrices must have the same length.
+        B: A 1xM Matrix representing the coefficients of the second polynomial.
 
     Returns:
-        A 1x(2N-1) Matrix representing the coefficients of the resulting polynomial.
-    
+        A 1x(N+M-1) Matrix representing the coefficients of the resulting polynomial.
+
     Raises:
-        ValueError: If the input matrices are not 1xN or have different lengths.
+        ValueError: If the input matrices are not 1xN vectors.
+    """
+    return karatsuba_multiply(A, B)
+
+
+def schoolbook_multiply(A: Matrix, B: Matrix) -> Matrix:
+    """Multiply two coefficient vectors term by term in O(N * M).
+
+    Args:
+        A: 1xN coefficients, constant term first
+        B: 1xM coefficients, constant term first
+    Returns:
+        1x(N+M-1) product coefficients (1x0 if either input is empty)
+    """
+    a, b, out = _operands(A, B)
+    if out:
+        _schoolbook_into(a, 0, len(a), b, 0, len(b), out, 0)
+    return Matrix.vector(out, dtype=A._result_dtype(B))
+
+
+def karatsuba_multiply(A: Matrix, B: Matrix, cutoff: int = KARATSUBA_CUTOFF) -> Matrix:
+    """Karatsuba polynomial product with a schoolbook base case.
+
+    Equal halves are multiplied with three recursive products instead of
+    four, down to operands of `cutoff` coefficients, where the schoolbook
+    method is faster. Operands of different lengths are split into blocks
+    the length of the shorter one, and each block is a balanced product.
+    All intermediate sums and products live in one scratch list sized up
+    front, so no Matrix is created below the top level.
+
+    Args:
+        A: 1xN coefficients, constant term first
+        B: 1xM coefficients, constant term first
+        cutoff: operand length at or below which schoolbook is used (>= 1)
+    Returns:
+        1x(N+M-1) product coefficients (1x0 if either input is empty)
+    """
+    if cutoff < 1:
+        raise ValueError("cutoff must be at least 1")
+    a, b, out = _operands(A, B)
+    if out:
+        scratch = [0] * _scratch_size(min(len(a), len(b)), cutoff)
+        _multiply_into(a, 0, len(a), b, 0, len(b), out, 0, scratch, 0, cutoff)
+    return Matrix.vector(out, dtype=A._result_dtype(B))
+
+
+def _operands(A, B):
+    """Coefficient lists of A and B, and a zeroed list for their product."""
+    if A.rows != 1 or B.rows != 1:
+        raise ValueError("Polynomials must be represented as 1xN vectors")
+    a, b = A.row(0), B.row(0)
+    size = len(a) + len(b) - 1 if a and b else 0
+    return a, b, [0] * size
+
+
+def _scratch_size(n, cutoff):
+    """Scratch items used by a balanced n x n product (see _karatsuba_into)."""
+    total = 0
+    while n > cutoff:
+        high = n - n // 2
+        total += 8 * high - 3
+        n = high
+    return total
+
+
+def _schoolbook_into(a, ai, na, b, bi, nb, out, oi):
+    """out[oi:oi+na+nb-1] += a[ai:ai+na] * b[bi:bi+nb]."""
+    if na < nb:
+        a, ai, na, b, bi, nb = b, bi, nb, a, ai, na
+    row = b[bi:bi + nb]
+    for i in range(nb):
+        x = row[i]
+        if x:
+            o = oi + i
+            out[o:o + na] = map(add, out[o:o + na], map(mul, a[ai:ai + na], repeat(x)))
+
+
+def _multiply_into(a, ai, na, b, bi, nb, out, oi, scratch, si, cutoff):
+    """out[oi:oi+na+nb-1] += a[ai:ai+na] * b[bi:bi+nb], for any lengths."""
+    if na < nb:
+        a, ai, na, b, bi, nb = b, bi, nb, a, ai, na
+    if nb <= cutoff:
+        _schoolbook_into(a, ai, na, b, bi, nb, out, oi)
+        return
+    for start in range(0, na, nb):
+        size = min(nb, na - start)
+        if size == nb:
+            _karatsuba_into(a, ai + start, b, bi, nb, out, oi + start, scratch, si, cutoff)
+        else:
+            _multiply_into(b, bi, nb, a, ai + start, size, out, oi + start, scratch, si, cutoff)
+
+
+def _karatsuba_into(a, ai, b, bi, n, out, oi, scratch, si, cutoff):
+    """out[oi:oi+2n-1] += a[ai:ai+n] * b[bi:bi+n], using scratch[si:] as workspace.
+
+    With low halves of h = n // 2 and high halves of n - h coefficients:
+        z0 = a_lo * b_lo, z2 = a_hi * b_hi, z1 = (a_lo + a_hi)(b_lo + b_hi) - z0 - z2
+        a * b = z0 + z1 x^h + z2 x^(2h)
+    This level uses 8(n - h) - 3 scratch items: the two sums, z0, z2 and the
+    middle product. The recursive calls reuse the scratch beyond them.
     """
-    if A.rows != 1 or B.rows != 1 or A.cols != B.cols:
-        raise ValueError("Polynomials must be represented as 1xN vectors of the same length")
-    
-    n = A.len()
-    if n == 0:
-        return Matrix(1, 0)
-    if n == 1:
-        res = Matrix(1, 1)
-        res.set(0, 0, A.get(0, 0) * B.get(0, 0))
-        return res
-    
-    mid = (n + 1) // 2
-    
-    A_low = A.submatrix(0, 0, 1, mid)
-    A_high = A.submatrix(0, mid, 1, n)
-    B_low = B.submatrix(0, 0, 1, mid)
-    B_high = B.submatrix(0, mid, 1, n)
-    
-    # Ensure both parts have the same length for recursive calls
-    if A_high.cols < mid:
-        temp = Matrix(1, mid)
-        for i in range(A_high.cols):
-            temp.set(0, i, A_high.get(0, i))
-        A_high = temp
-        
-    if B_high.cols < mid:
-        temp = Matrix(1, mid)
-        for i in range(B_high.cols):
-            temp.set(0, i, B_high.get(0, i))
-        B_high = temp
-
-    Z0 = dc_polynomial_multiply(A_low, B_low)
-    Z2 = dc_polynomial_multiply(A_high, B_high)
-    
-    A_sum = A_low.add(A_high)
-    B_sum = B_low.add(B_high)
-    Z1 = dc_polynomial_multiply(A_sum, B_sum)
-    Z1 = Z1.subtract(Z0).subtract(Z2)
-
-    result_size = 2 * n - 1
-    result = Matrix(1, result_size)
-
-    for i in range(Z0.cols):
-        result.set(0, i, result.get(0, i) + Z0.get(0, i))
-    for i in range(Z1.cols):
-        if (i + mid) < result.cols:
-            result.set(0, i + mid, result.get(0, i + mid) + Z1.get(0, i))
-    for i in range(Z2.cols):
-        if (i + 2 * mid) < result.cols:
-            result.set(0, i + 2 * mid, result.get(0, i + 2 * mid) + Z2.get(0, i))
-    
-    return result
-    
\ No newline at end of file
+    if n <= cutoff:
+        _schoolbook_into(a, ai, n, b, bi, n, out, oi)
+        return
+    h = n // 2
+    high = n - h
+    sa, sb = si, si + high
+    z0, z2, z1 = sb + high, sb + high + 2 * h - 1, sb + high + 2 * h - 1 + 2 * high - 1
+    rest = z1 + 2 * high - 1
+    scratch[z0:rest] = repeat(0, rest - z0)
+    # Operand sums; the high halves are one longer when n is odd.
+    scratch[sa:sa + h] = map(add, a[ai:ai + h], a[ai + h:ai + 2 * h])
+    scratch[sb:sb + h] = map(add, b[bi:bi + h], b[bi + h:bi + 2 * h])
+    if high > h:
+        scratch[sa + h] = a[ai + n - 1]
+        scratch[sb + h] = b[bi + n - 1]
+    _karatsuba_into(a, ai, b, bi, h, scratch, z0, scratch, rest, cutoff)
+    _karatsuba_into(a, ai + h, b, bi + h, high, scratch, z2, scratch, rest, cutoff)
+    _karatsuba_into(scratch, sa, scratch, sb, high, scratch, z1, scratch, rest, cutoff)
+    n0, n2 = 2 * h - 1, 2 * high - 1
+    scratch[z1:z1 + n0] = map(sub, scratch[z1:z1 + n0], scratch[z0:z0 + n0])
+    scratch[z1:z1 + n2] = map(sub, scratch[z1:z1 + n2], scratch[z2:z2 + n2])
+    out[oi:oi + n0] = map(add, out[oi:oi + n0], scratch[z0:z0 + n0])
+    out[oi + h:oi + h + n2] = map(add, out[oi + h:oi + h + n2], scratch[z1:z1 + n2])
+    o = oi + 2 * h
+    out[o:o + n2] = map(add, out[o:o + n2], scratch[z2:z2 + n2])
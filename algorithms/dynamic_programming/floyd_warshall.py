@@ -1,3 +1,4 @@
+from data_structures import backend
 from data_structures.graph import Graph
 from data_structures.matrix import Matrix
 
@@ -7,7 +8,8 @@ def floyd_warshall(graph: Graph, inf_value: int = 10**12):
 
     Works with arbitrary vertex types by using the adjacency matrix mapping.
     Detects negative cycles by checking if any vertex can reach itself with
-    negative cost.
+    negative cost. With the numpy backend enabled, integer weights are
+    relaxed one pivot at a time as whole-matrix vector operations.
 
     Args:
         graph: Graph instance
@@ -25,6 +27,15 @@ def floyd_warshall(graph: Graph, inf_value: int = 10**12):
     vertices = list(graph.adj.keys())
     vertex_mapping = {i: v for i, v in enumerate(vertices)}
     
+    if backend.numpy_enabled():
+        result = backend.floyd_warshall([list(row) for row in A.data], inf_value)
+        if result is not None:
+            A.data, P_rows = result
+            P = Matrix(n, n, -1)
+            P.data = P_rows
+            has_negative_cycle = any(A.get(i, i) < 0 for i in range(n))
+            return A, P, vertex_mapping, has_negative_cycle
+
     P = Matrix(n, n, -1)
     
     # Main algorithm
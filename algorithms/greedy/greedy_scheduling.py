@@ -1,3 +1,4 @@
+from algorithms.radix_sort import integer_argsort
 from data_structures.matrix import Matrix
 
 
@@ -12,24 +13,15 @@ def activity_selection(starts: Matrix, finishes: Matrix):
     """
     if starts.rows != 1 or finishes.rows != 1 or starts.cols != finishes.cols:
         raise ValueError("starts and finishes must be 1xN and same length")
-    n = starts.cols
-    idx_matrix = Matrix(1, n)
-    for i in range(n):
-        idx_matrix.set(0, i, i)
-
-    # Sorting logic similar to knapsack
-    idx_list = [idx_matrix.get(0, i) for i in range(n)]
-    idx_list.sort(key=lambda i: finishes.get(0, i))
-    for i in range(n):
-        idx_matrix.set(0, i, idx_list[i])
+    start_list, finish_list = starts.row(0), finishes.row(0)
 
+    # visit activities by finish time (stable, so ties keep input order)
     selected_matrix = Matrix(1, 0)
     last_finish = -10**18
-    for i in range(n):
-        activity_idx = idx_matrix.get(0, i)
-        if starts.get(0, activity_idx) >= last_finish:
+    for activity_idx in integer_argsort(finishes).row(0):
+        if start_list[activity_idx] >= last_finish:
             selected_matrix.add_column([activity_idx])
-            last_finish = finishes.get(0, activity_idx)
+            last_finish = finish_list[activity_idx]
     return selected_matrix
 
 
@@ -45,34 +37,25 @@ def deadline_scheduler(deadlines: Matrix, profits: Matrix):
     """
     if deadlines.rows != 1 or profits.rows != 1 or deadlines.cols != profits.cols:
         raise ValueError("deadlines and profits must be 1xN and same length")
-    n = deadlines.cols
-    idx_matrix = Matrix(1, n)
-    for i in range(n):
-        idx_matrix.set(0, i, i)
-    
-    idx_list = [idx_matrix.get(0, i) for i in range(n)]
-    idx_list.sort(key=lambda i: profits.get(0, i), reverse=True)
-    for i in range(n):
-        idx_matrix.set(0, i, idx_list[i])
+    deadline_list, profit_list = deadlines.row(0), profits.row(0)
 
     max_d = 0
-    for i in range(n):
-        d = deadlines.get(0, i)
+    for d in deadline_list:
         if d > max_d:
             max_d = d
     
     schedule_matrix = Matrix(1, max_d, -1)
     total = 0
-    for i in range(n):
-        job_idx = idx_list[i]
-        d = deadlines.get(0, job_idx)
+    # jobs by profit, highest first; integer profits take the counting/radix path
+    for job_idx in integer_argsort(profits, key=lambda x: -x).row(0):
+        d = deadline_list[job_idx]
         # find latest free slot <= d
         t = min(d, max_d) - 1
         while t >= 0 and schedule_matrix.get(0, t) != -1:
             t -= 1
         if t >= 0:
             schedule_matrix.set(0, t, job_idx)
-            total += profits.get(0, job_idx)
+            total += profit_list[job_idx]
     return schedule_matrix, total
 
 
@@ -52,11 +52,7 @@ def prim_mst(graph: Graph, start=0, inf_value: int = 10**12):
                 heap.push((key[v], tiebreak, v))
     # Build explicit MST edge list (parent[v] --key[v]--> v)
     mst_edges_list = [(pu, v, key[v]) for v, pu in parent.items() if pu is not None]
-    mst_edges_matrix = Matrix(len(mst_edges_list), 3)
-    for i, (pu, v, w) in enumerate(mst_edges_list):
-        mst_edges_matrix.set(i, 0, pu)
-        mst_edges_matrix.set(i, 1, v)
-        mst_edges_matrix.set(i, 2, w)
+    mst_edges_matrix = Matrix.from_rows(mst_edges_list, cols=3)
     
     total_cost = sum(w for _, _, w in mst_edges_list)
     return parent, key, order, mst_edges_matrix, total_cost
@@ -116,28 +112,16 @@ def kruskal_mst(graph: Graph):
     if not edge_list:
         return Matrix(0, 3), 0
 
-    # Create a matrix from the list of edges
-    edges = Matrix(len(edge_list), 3)
-    for i, (w, u, v) in enumerate(edge_list):
-        edges.set(i, 0, w)
-        edges.set(i, 1, u)
-        edges.set(i, 2, v)
-
-    # A proper matrix sort on a column would be ideal.
-    # For now, we extract, sort, and rebuild the matrix.
-    edge_data_sorted = sorted([tuple(edges.data[i]) for i in range(edges.rows)])
-    for i, (w, u, v) in enumerate(edge_data_sorted):
-        edges.set(i, 0, w)
-        edges.set(i, 1, u)
-        edges.set(i, 2, v)
+    # Create a matrix from the list of edges, sorted by (w, u, v)
+    edges = Matrix.from_rows(edge_list)
+    edges.sort_rows_by((0, 1, 2))
     
     # Initialize disjoint set with all vertices
     ds = DisjointSet(vertices)
     
     mst_matrix = Matrix(0, 3)
     total = 0
-    for i in range(edges.rows):
-        w, u, v = edges.get(i, 0), edges.get(i, 1), edges.get(i, 2)
+    for w, u, v in edges.tolist():
         if ds.union(u, v):
             mst_matrix.add_row([u, v, w])
             total += w
@@ -64,20 +64,15 @@ def bellman_ford(graph: Graph, s, inf_value: int = 10**12):
     if not edge_list:
         return True, d, parent
 
-    edges = Matrix(len(edge_list), 3)
-    for i, (u, v, w) in enumerate(edge_list):
-        edges.set(i, 0, u)
-        edges.set(i, 1, v)
-        edges.set(i, 2, w)
+    edges = Matrix.from_rows(edge_list)
+    edge_rows = edges.tolist()
 
     for _ in range(len(graph.adj) - 1):
-        for i in range(edges.rows):
-            u, v, w = edges.get(i, 0), edges.get(i, 1), edges.get(i, 2)
+        for u, v, w in edge_rows:
             if d.get(u, inf_value) < inf_value:
                 relax(u, v, w, d, parent)
 
-    for i in range(edges.rows):
-        u, v, w = edges.get(i, 0), edges.get(i, 1), edges.get(i, 2)
+    for u, v, w in edge_rows:
         if d.get(u, inf_value) + w < d.get(v, inf_value):
             return False, d, parent
     return True, d, parent
@@ -120,10 +115,8 @@ def dijkstra(graph: Graph, s, inf_value: int = 10**12):
                 tiebreak += 1
                 heap.push((d[v], tiebreak, v))
 
-    order_matrix = Matrix(1, len(order_list))
-    for i, vertex in enumerate(order_list):
-        order_matrix.set(0, i, vertex)
-        
+    order_matrix = Matrix.vector(order_list)
+
     return order_matrix, d, parent
 
 
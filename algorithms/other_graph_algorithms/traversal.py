@@ -132,15 +132,10 @@ def dfs_plus(graph: Graph):
             if color2[u] == 'white':
                 comp_list = []
                 visit_t(u, comp_list)
-                comp_matrix = Matrix(1, len(comp_list))
-                for i, vertex in enumerate(comp_list):
-                    comp_matrix.set(0, i, vertex)
-                scc_matrices.append(comp_matrix)
+                scc_matrices.append(Matrix.vector(comp_list))
     
     articulation_list = sorted(list(articulation_set))
-    articulation_matrix = Matrix(1, len(articulation_list))
-    for i, vertex in enumerate(articulation_list):
-        articulation_matrix.set(0, i, vertex)
+    articulation_matrix = Matrix.vector(articulation_list)
 
     return {
         'color': color,
@@ -190,10 +185,8 @@ def bfs(graph: Graph, s, inf_value: int = 10**12):
                 q.enqueue(v)
         color[u] = 'black'
 
-    order_matrix = Matrix(1, len(order_list))
-    for i, vertex in enumerate(order_list):
-        order_matrix.set(0, i, vertex)
-        
+    order_matrix = Matrix.vector(order_list)
+
     return color, d, parent, order_matrix
 
 
@@ -1,9 +1,16 @@
 from data_structures.matrix import Matrix
-from algorithms.two_pointers.partition import partition as matrix_partition
+from algorithms.divide_conquer.merge_sort import _binary_insertion_sort
+from algorithms.two_pointers.partition import choose_pivot, three_way_partition
+
+
+INSERTION_SORT_CUTOFF = 16
 
 
 def quick_sort_matrix(v: Matrix, low: int = 0, high: int | None = None) -> None:
-    """In-place quicksort for a 1xN Matrix using shared partition.
+    """In-place introsort for a 1xN Matrix.
+
+    The segment [low, high] is copied into a list once, sorted with
+    introsort() and written back in a single row write.
 
     Args:
         v: Matrix with shape 1xN
@@ -16,6 +23,66 @@ def quick_sort_matrix(v: Matrix, low: int = 0, high: int | None = None) -> None:
     if high is None:
         high = v.cols - 1
     if low < high:
-        p = matrix_partition(v, low, high)
-        quick_sort_matrix(v, low, p - 1)
-        quick_sort_matrix(v, p + 1, high)
\ No newline at end of file
+        segment = v.view(0, low, 1, high + 1)
+        values = segment.row(0)
+        introsort(values)
+        segment._set_row(0, values)
+
+
+def introsort(a, lo: int = 0, hi: int | None = None) -> None:
+    """Sort a[lo:hi] in place (a is a list or array); O(n log n) worst case.
+
+    Quicksort with an explicit stack: the larger side of every partition is
+    pushed and the loop continues on the smaller one, so the stack holds at
+    most log2(n) segments. Pivots come from choose_pivot() (median of three,
+    or the ninther for large segments) and three_way_partition() finishes
+    runs of equal keys in one pass; both live in
+    algorithms.two_pointers.partition. Segments of at most
+    INSERTION_SORT_CUTOFF items are insertion-sorted, and a segment that
+    exceeds 2*log2(n) partitioning levels is heapsorted instead. Only `<` is
+    used to compare items.
+    """
+    if hi is None:
+        hi = len(a)
+    stack = [(lo, hi, 2 * (hi - lo).bit_length())]
+    while stack:
+        lo, hi, depth = stack.pop()
+        while hi - lo > INSERTION_SORT_CUTOFF:
+            if depth == 0:
+                _heapsort(a, lo, hi)
+                lo = hi
+                break
+            depth -= 1
+            lt, gt = three_way_partition(a, lo, hi, choose_pivot(a, lo, hi))
+            if lt - lo < hi - gt:
+                stack.append((gt, hi, depth))
+                hi = lt
+            else:
+                stack.append((lo, lt, depth))
+                lo = gt
+        _binary_insertion_sort(a, lo, lo + 1, hi)
+
+
+def _heapsort(a, lo, hi):
+    """In-place max-heap sort of a[lo:hi]."""
+    n = hi - lo
+    for root in range(n // 2 - 1, -1, -1):
+        _sift_down(a, lo, root, n)
+    for end in range(n - 1, 0, -1):
+        a[lo], a[lo + end] = a[lo + end], a[lo]
+        _sift_down(a, lo, 0, end)
+
+
+def _sift_down(a, lo, root, n):
+    x = a[lo + root]
+    while True:
+        child = 2 * root + 1
+        if child >= n:
+            break
+        if child + 1 < n and a[lo + child] < a[lo + child + 1]:
+            child += 1
+        if not x < a[lo + child]:
+            break
+        a[lo + root] = a[lo + child]
+        root = child
+    a[lo + root] = x
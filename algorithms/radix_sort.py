@@ -0,0 +1,190 @@
+from itertools import chain, repeat
+
+from data_structures.matrix import INTEGER_DTYPES, Matrix
+
+
+RADIX_BITS = 8
+COUNTING_SPAN_FACTOR = 2
+
+
+def counting_sort(v: Matrix) -> Matrix:
+    """Return a sorted copy of an integer 1xN vector in O(n + max - min).
+
+    Args:
+        v: Matrix with shape 1xN holding integers
+    Returns:
+        new Matrix(1xN) sorted non-decreasing, same dtype as v
+    """
+    values = _integer_values(v)
+    if not values:
+        return Matrix.vector(values, dtype=v.dtype)
+    lo, hi = min(values), max(values)
+    counts = [0] * (hi - lo + 1)
+    for x in values:
+        counts[x - lo] += 1
+    out = list(chain.from_iterable(map(repeat, range(lo, hi + 1), counts)))
+    return Matrix.vector(out, dtype=v.dtype)
+
+
+def radix_sort(v: Matrix, radix_bits: int = RADIX_BITS) -> Matrix:
+    """Return a sorted copy of an integer 1xN vector with LSD radix sort.
+
+    Keys are offset by the minimum, so negative numbers work, and each pass
+    distributes the items over 2**radix_bits buckets by one digit. The
+    number of passes is ceil(bits(max - min) / radix_bits), and passes in
+    which every item has the same digit are skipped.
+
+    Args:
+        v: Matrix with shape 1xN holding integers
+        radix_bits: digit width in bits (8 means byte-wise)
+    Returns:
+        new Matrix(1xN) sorted non-decreasing, same dtype as v
+    """
+    values = _integer_values(v)
+    if values:
+        values = _lsd_passes(values, values, min(values), max(values), radix_bits)
+    return Matrix.vector(values, dtype=v.dtype)
+
+
+def counting_argsort(v: Matrix, key=None) -> Matrix:
+    """Stable argsort of a 1xN vector by integer keys in O(n + key span).
+
+    Args:
+        v: Matrix with shape 1xN
+        key: optional function mapping an entry to its integer sort key
+    Returns:
+        new Matrix(1xN, dtype 'q') of indices into v in sorted key order
+    """
+    keys = _keys(v, key)
+    if not keys:
+        return Matrix.vector([], dtype='q')
+    lo = min(keys)
+    starts = [0] * (max(keys) - lo + 2)
+    for k in keys:
+        starts[k - lo + 1] += 1
+    for t in range(1, len(starts)):
+        starts[t] += starts[t - 1]
+    order = [0] * len(keys)
+    for i, k in enumerate(keys):
+        slot = k - lo
+        order[starts[slot]] = i
+        starts[slot] += 1
+    return Matrix.vector(order, dtype='q')
+
+
+def radix_argsort(v: Matrix, key=None, radix_bits: int = RADIX_BITS) -> Matrix:
+    """Stable argsort of a 1xN vector by integer keys with LSD radix sort.
+
+    Sorts the index permutation, so the entries themselves never move and
+    the key is extracted only once per entry.
+
+    Args:
+        v: Matrix with shape 1xN
+        key: optional function mapping an entry to its integer sort key
+        radix_bits: digit width in bits
+    Returns:
+        new Matrix(1xN, dtype 'q') of indices into v in sorted key order
+    """
+    keys = _keys(v, key)
+    order = list(range(len(keys)))
+    if keys:
+        order = _lsd_passes(order, keys, min(keys), max(keys), radix_bits)
+    return Matrix.vector(order, dtype='q')
+
+
+def integer_sort(v: Matrix) -> Matrix:
+    """Sorted copy of a 1xN vector, choosing the algorithm from the key range.
+
+    Counting sort when max - min is at most COUNTING_SPAN_FACTOR * n, LSD
+    radix sort when its passes are estimated to cost less than the log2(n)
+    merge levels, and merge sort otherwise (including for non-integer entries).
+    """
+    values = v.row(0) if v.rows == 1 else None
+    algorithm = choose_integer_sort(values)
+    if algorithm == "counting":
+        return counting_sort(v)
+    if algorithm == "radix":
+        return radix_sort(v)
+    return v.merge_sort()
+
+
+def integer_argsort(v: Matrix, key=None) -> Matrix:
+    """Stable argsort of a 1xN vector, choosing the algorithm as integer_sort does.
+
+    Args:
+        v: Matrix with shape 1xN
+        key: optional function mapping an entry to its sort key
+    Returns:
+        new Matrix(1xN, dtype 'q') of indices into v in sorted key order
+    """
+    keys = _keys(v, key, check=False)
+    algorithm = choose_integer_sort(keys)
+    keyed = Matrix.vector(keys)
+    if algorithm == "counting":
+        return counting_argsort(keyed)
+    if algorithm == "radix":
+        return radix_argsort(keyed)
+    return keyed.argsort()
+
+
+def choose_integer_sort(keys, radix_bits: int = RADIX_BITS) -> str:
+    """Pick 'counting', 'radix' or 'merge' for a list of keys."""
+    if keys is None:
+        raise ValueError("Integer sort works only for 1xN matrices")
+    n = len(keys)
+    if n < 2 or not all(type(k) is int for k in keys):
+        return "merge"
+    span = max(keys) - min(keys)
+    if span <= COUNTING_SPAN_FACTOR * n:
+        return "counting"
+    # Each radix pass costs about one step per item plus half a step per
+    # bucket; merge sort costs about one step per item per level.
+    passes = -(-span.bit_length() // radix_bits)
+    if passes * ((1 << radix_bits) // 2 + n) < n * n.bit_length():
+        return "radix"
+    return "merge"
+
+
+def _integer_values(v):
+    if v.rows != 1:
+        raise ValueError("Integer sort works only for 1xN matrices")
+    values = v.row(0)
+    typed_integers = v.dtype is not None and v.dtype in INTEGER_DTYPES
+    if not typed_integers and not all(type(x) is int for x in values):
+        raise ValueError("Counting and radix sort need integer entries")
+    return values
+
+
+def _keys(v, key, check=True):
+    if v.rows != 1:
+        raise ValueError("Integer sort works only for 1xN matrices")
+    values = v.row(0)
+    keys = values if key is None else [key(x) for x in values]
+    if check and not all(type(k) is int for k in keys):
+        raise ValueError("Counting and radix sort need integer keys")
+    return keys
+
+
+def _lsd_passes(items, keys, lo, hi, radix_bits):
+    """Stable LSD radix sort of items by keys (keys[i] for item i, or the items themselves)."""
+    base = 1 << radix_bits
+    mask = base - 1
+    span_bits = (hi - lo).bit_length()
+    by_value = items is keys
+    shifted = [k - lo for k in keys]
+    for shift in range(0, span_bits, radix_bits):
+        buckets = [[] for _ in range(base)]
+        if by_value:
+            for k in shifted:
+                buckets[(k >> shift) & mask].append(k)
+        else:
+            for i in items:
+                buckets[(shifted[i] >> shift) & mask].append(i)
+        if sum(1 for b in buckets if b) == 1:
+            continue  # every item has this digit in common
+        items = list(chain.from_iterable(buckets))
+        if by_value:
+            shifted = items
+    if by_value:
+        return [k + lo for k in shifted]
+    return items
@@ -1,3 +1,6 @@
+from array import array
+from bisect import bisect_left, bisect_right
+
 from data_structures.matrix import Matrix
 
 def binary_search(matrix: Matrix, target: int) -> bool:  # this matrix is a sorted vector
@@ -11,19 +14,8 @@ def binary_search(matrix: Matrix, target: int) -> bool:  # this matrix is a sort
     """
     if matrix.is_empty():
         return False
-    cols = matrix.cols
-    left, right = 0, cols - 1
-    while left <= right:
-        mid = (left + right) // 2
-        mid_value = matrix[0][mid]
-        if mid_value == target:
-            return True
-        elif mid_value < target:
-            left = mid + 1
-        else:
-            right = mid - 1
-    return False
-    
+    pos = lower_bound(matrix, target)
+    return pos < matrix.cols and matrix.get(0, pos) == target
 
 
 def recursive_binary_search(matrix: Matrix, left: int, right: int, target: int) -> bool:
@@ -46,7 +38,157 @@ def recursive_binary_search(matrix: Matrix, left: int, right: int, target: int)
     elif mid_value < target:
         return recursive_binary_search(matrix, mid + 1, right, target)
     return recursive_binary_search(matrix, left, mid - 1, target)
-    
-    
-# these algorithms return true or false based on whether the target is found in the matrix
-# if you want the index of the target, modify the return statements to return mid instead of True
\ No newline at end of file
+
+
+def _search_space(matrix):
+    """Return (seq, start, stop) so that seq[start:stop] is the vector's entries.
+
+    Unit-stride vectors are searched in their own buffer without copying;
+    strided views (e.g. a transposed column) are copied once.
+    """
+    if matrix.rows != 1:
+        raise ValueError("Binary search works only for 1xN matrices")
+    if matrix._cstride == 1:
+        return matrix._data, matrix._offset, matrix._offset + matrix.cols
+    return matrix.row(0), 0, matrix.cols
+
+
+def lower_bound(matrix: Matrix, target, lo: int = 0, hi: int | None = None) -> int:
+    """First index i in [lo, hi) with matrix[0][i] >= target (hi if none).
+
+    Args:
+        matrix: Matrix(1, N) sorted in non-decreasing order
+        target: value to search
+        lo: start of the search range
+        hi: end of the search range (exclusive); defaults to N
+    Returns:
+        insertion point that keeps the vector sorted, before any equal entries
+    """
+    seq, start, stop = _search_space(matrix)
+    hi = stop if hi is None else start + hi
+    return bisect_left(seq, target, start + lo, hi) - start
+
+
+def upper_bound(matrix: Matrix, target, lo: int = 0, hi: int | None = None) -> int:
+    """First index i in [lo, hi) with matrix[0][i] > target (hi if none).
+
+    Args:
+        matrix: Matrix(1, N) sorted in non-decreasing order
+        target: value to search
+        lo: start of the search range
+        hi: end of the search range (exclusive); defaults to N
+    Returns:
+        insertion point that keeps the vector sorted, after any equal entries
+    """
+    seq, start, stop = _search_space(matrix)
+    hi = stop if hi is None else start + hi
+    return bisect_right(seq, target, start + lo, hi) - start
+
+
+def equal_range(matrix: Matrix, target) -> tuple[int, int]:
+    """Return (lower_bound, upper_bound): the slice of entries equal to target."""
+    seq, start, stop = _search_space(matrix)
+    first = bisect_left(seq, target, start, stop)
+    return first - start, bisect_right(seq, target, first, stop) - start
+
+
+def search_many(sorted_vec: Matrix, targets) -> Matrix:
+    """Look up many targets in one sorted vector.
+
+    The targets are sorted once and answered in ascending order with one
+    forward walk over the vector. Each step gallops (1, 2, 4, ... entries)
+    from the previous answer and then bisects inside the last jump, so a
+    batch of m targets costs O(m log(n / m)) comparisons instead of
+    O(m log n), and nearby targets touch nearby memory.
+
+    Args:
+        sorted_vec: Matrix(1, N) sorted in non-decreasing order
+        targets: Matrix(1, M) or iterable of values to look up
+    Returns:
+        Matrix(1, M, dtype 'q'): index of the first entry equal to each
+        target, or -1 if it is absent, in the order of targets
+    """
+    seq, start, stop = _search_space(sorted_vec)
+    values = targets.row(0) if isinstance(targets, Matrix) else list(targets)
+    found = array('q', [-1]) * len(values)
+    pos = start
+    for i in sorted(range(len(values)), key=values.__getitem__):
+        t = values[i]
+        if pos < stop and seq[pos] < t:
+            step = 1
+            while pos + step < stop and seq[pos + step] < t:
+                step *= 2
+            pos = bisect_left(seq, t, pos + step // 2 + 1, min(pos + step, stop))
+        if pos < stop and seq[pos] == t:
+            found[i] = pos - start
+    return Matrix.from_buffer(found, 1, len(found), 'q')
+
+
+class EytzingerIndex:
+    """Read-only search index over a sorted vector in Eytzinger (BFS) order.
+
+    Slot 1 holds the median, slots 2k and 2k+1 the children of slot k, so
+    the first levels of every search share a few cache lines and each
+    step's next probe is at a predictable position. Build it once for a
+    vector that is searched many times; later changes to the vector are
+    not reflected. Each probe runs in the interpreter, so for in-memory
+    vectors lower_bound() (C bisect) is usually still faster per lookup;
+    see examples/search_benchmarks.py.
+    """
+
+    def __init__(self, sorted_vec: Matrix):
+        """Build the index (O(n)) from a sorted Matrix(1, N)."""
+        values = _search_space(sorted_vec)
+        values = values[0][values[1]:values[2]]
+        n = len(values)
+        self._n = n
+        keys = [values[0]] * (n + 1) if n else [0]
+        positions = array('q', bytes(8 * (n + 1)))
+        # In-order walk of the implicit tree assigns sorted ranks to slots.
+        rank, k, stack = 0, 1, []
+        while stack or k <= n:
+            if k <= n:
+                stack.append(k)
+                k *= 2
+            else:
+                k = stack.pop()
+                keys[k] = values[rank]
+                positions[k] = rank
+                rank += 1
+                k = 2 * k + 1
+        dtype = sorted_vec.dtype
+        self._keys = array(dtype, keys) if dtype is not None else keys
+        self._positions = positions
+
+    def __len__(self):
+        return self._n
+
+    def _descend(self, target, strict):
+        """Slot of the first key >= target (> target if strict), or 0."""
+        keys, n, k = self._keys, self._n, 1
+        if strict:
+            while k <= n:
+                k = 2 * k + (not target < keys[k])
+        else:
+            while k <= n:
+                k = 2 * k + (keys[k] < target)
+        # Strip the trailing right turns and the final left turn.
+        return k >> ((~k & (k + 1)).bit_length())
+
+    def lower_bound(self, target) -> int:
+        """Same result as lower_bound() on the original vector."""
+        k = self._descend(target, False)
+        return self._positions[k] if k else self._n
+
+    def upper_bound(self, target) -> int:
+        """Same result as upper_bound() on the original vector."""
+        k = self._descend(target, True)
+        return self._positions[k] if k else self._n
+
+    def search(self, target) -> int:
+        """Index of the first entry equal to target, or -1."""
+        k = self._descend(target, False)
+        return self._positions[k] if k and self._keys[k] == target else -1
+
+    def __contains__(self, target):
+        return self.search(target) != -1
@@ -1,4 +1,9 @@
-from data_structures.matrix import Matrix
+from bisect import bisect_left
+from math import floor
+
+
+NINTHER_THRESHOLD = 128
+SELECT_SORT_CUTOFF = 16
 
 def partition(matrix, low: int, high: int, pivot: int | None = None) -> int:
     """Lomuto-style partition on a 1xN Matrix vector.
@@ -40,6 +45,10 @@ def partition(matrix, low: int, high: int, pivot: int | None = None) -> int:
 def quickselect(matrix, low: int, high: int, k: int) -> int:
     """Quickselect to find k-th smallest in Matrix vector.
 
+    Runs introselect() on matrix[low..high] in place (see _select), so
+    afterwards entry k holds its sorted value with smaller-or-equal entries
+    before it and larger-or-equal after it.
+
     Args:
         matrix: Matrix(1, N)
         low: start index
@@ -48,15 +57,7 @@ def quickselect(matrix, low: int, high: int, k: int) -> int:
     Returns:
         value of k-th smallest element
     """
-    if low == high:
-        return matrix.get(0, low)
-    pivot_index = partition(matrix, low, high) # can set pivot as rand.randint(low, high)
-    if k == pivot_index:
-        return matrix.get(0, k)
-    elif k < pivot_index:
-        return quickselect(matrix, low, pivot_index - 1, k)
-    else:
-        return quickselect(matrix, pivot_index + 1, high, k)
+    return _select(matrix, low, high, k - low, deterministic=False)
     
 def kth_smallest(matrix, k: int) -> int:
     """Return k-th smallest element (1-based) from Matrix vector."""
@@ -65,36 +66,241 @@ def kth_smallest(matrix, k: int) -> int:
     return quickselect(matrix, 0, matrix.len() - 1, k - 1)
 
 def sel(matrix, l:int, r:int, k: int) -> int:
-    """Median of medians selection (deterministic select)."""
-    n = r - l + 1
-    if n <= 5:
-        # Create a sub-matrix and sort it to find the k-th element
-        sub_matrix = Matrix(1, n)
-        for i in range(n):
-            sub_matrix.set(0, i, matrix.get(0, l + i))
-        sub_matrix.quick_sort()
-        return sub_matrix.get(0, k - 1)
-
-    num_medians = (n + 4) // 5
-    medians = Matrix(1, num_medians)
-    for i in range(num_medians):
-        sub_l = l + 5 * i
-        sub_r = min(sub_l + 4, r)
-        # The median is the middle element of a small sorted group
-        median_k = ((sub_r - sub_l + 1) + 1) // 2
-        medians.set(0, i, sel(matrix, sub_l, sub_r, median_k))
-
-    # Find the median of medians
-    pivot_val = sel(medians, 0, medians.len() - 1, (medians.len() + 1) // 2)
-    
-    j = partition(matrix, l, r, pivot_val)
-    
-    # Number of elements in the low partition + pivot
-    i = j - l + 1
-    
-    if k == i:
-        return matrix.get(0, j)
-    elif k < i:
-        return sel(matrix, l, j - 1, k)
-    else:
-        return sel(matrix, j + 1, r, k - i)
+    """Median of medians selection (deterministic select).
+
+    Every pivot is a median of medians, so the worst case is O(n). Like
+    quickselect, it partitions matrix[l..r] in place.
+
+    Args:
+        matrix: Matrix(1, N)
+        l: start index
+        r: end index (inclusive)
+        k: rank within [l, r] (1-based)
+    Returns:
+        value of the k-th smallest element of matrix[l..r]
+    """
+    return _select(matrix, l, r, k - 1, deterministic=True)
+
+
+def _select(matrix, low, high, rank, deterministic):
+    """introselect() the 0-based `rank` of matrix[low..high] in place.
+
+    Unit-stride vectors are partitioned in their own buffer without copying;
+    strided views (e.g. a transposed column) are copied once and written back.
+    """
+    segment = matrix.view(0, low, 1, high + 1)
+    if segment._cstride == 1:
+        start = segment._offset
+        return introselect(segment._data, start + rank, start, start + segment.cols, deterministic)
+    values = segment.row(0)
+    value = introselect(values, rank, deterministic=deterministic)
+    segment._set_row(0, values)
+    return value
+
+
+def introselect(a, k: int, lo: int = 0, hi: int | None = None, deterministic: bool = False):
+    """Rearrange a[lo:hi] in place so a[k] holds its sorted value; return it.
+
+    Iterative quickselect with median-of-three (or ninther) pivots and a
+    three-way partition. When a step keeps more than 3/4 of the segment
+    twice in a row, the next pivot is a median of medians, which always
+    discards at least 3/10. Progress is therefore geometric, and the worst
+    case is O(n) while typical inputs keep quickselect's speed. With
+    deterministic=True every pivot is a median of medians. Apart from the
+    short median-of-medians recursion, no memory is allocated.
+
+    Args:
+        a: list or array
+        k: absolute index of the wanted rank, lo <= k < hi
+        lo: start of the segment
+        hi: end of the segment (exclusive); defaults to len(a)
+        deterministic: always use median-of-medians pivots
+    Returns:
+        the k-th smallest value of a[lo:hi] (counting from lo)
+    """
+    if hi is None:
+        hi = len(a)
+    if not lo <= k < hi:
+        raise ValueError("k is out of bounds")
+    stalls = 0
+    while hi - lo > SELECT_SORT_CUTOFF:
+        size = hi - lo
+        if deterministic or stalls >= 2:
+            pivot = _median_of_medians(a, lo, hi)
+            stalls = 0
+        else:
+            pivot = choose_pivot(a, lo, hi)
+        lt, gt = three_way_partition(a, lo, hi, pivot)
+        if k < lt:
+            hi = lt
+        elif k >= gt:
+            lo = gt
+        else:
+            return pivot
+        stalls = stalls + 1 if 4 * (hi - lo) > 3 * size else 0
+    insertion_sort(a, lo, hi)
+    return a[k]
+
+
+def _median_of_medians(a, lo: int, hi: int):
+    """BFPRT pivot of a[lo:hi], computed in place.
+
+    Each group of 5 is insertion-sorted and its median swapped to the front
+    of the segment; the median of those medians is then selected in place.
+    """
+    dest = lo
+    for g in range(lo, hi, 5):
+        end = min(g + 5, hi)
+        insertion_sort(a, g, end)
+        m = (g + end - 1) // 2
+        a[dest], a[m] = a[m], a[dest]
+        dest += 1
+    return introselect(a, (lo + dest - 1) // 2, lo, dest, deterministic=True)
+
+
+def insertion_sort(a, lo: int, hi: int) -> None:
+    """Sort a small segment a[lo:hi] in place by swapping (no allocation)."""
+    for i in range(lo + 1, hi):
+        x = a[i]
+        j = i
+        while j > lo and x < a[j - 1]:
+            a[j] = a[j - 1]
+            j -= 1
+        a[j] = x
+
+
+def median_of_three(a, i: int, j: int, k: int):
+    """Return the median of a[i], a[j], a[k]."""
+    x, y, z = a[i], a[j], a[k]
+    if y < x:
+        x, y = y, x
+    if z < y:
+        y = z if x < z else x
+    return y
+
+
+def choose_pivot(a, lo: int, hi: int):
+    """Pivot value for a[lo:hi]: median of three, or Tukey's ninther for large segments."""
+    mid, last = (lo + hi) // 2, hi - 1
+    if hi - lo < NINTHER_THRESHOLD:
+        return median_of_three(a, lo, mid, last)
+    step = (hi - lo) // 8
+    x = median_of_three(a, lo, lo + step, lo + 2 * step)
+    y = median_of_three(a, mid - step, mid, mid + step)
+    z = median_of_three(a, last - 2 * step, last - step, last)
+    if y < x:
+        x, y = y, x
+    if z < y:
+        y = z if x < z else x
+    return y
+
+
+def three_way_partition(a, lo: int, hi: int, pivot):
+    """Dutch-flag partition of a[lo:hi] (list or array) around a pivot value.
+
+    Returns:
+        (lt, gt) with a[lo:lt] < pivot, a[lt:gt] == pivot, a[gt:hi] > pivot
+    """
+    lt, i, gt = lo, lo, hi
+    while i < gt:
+        x = a[i]
+        if x < pivot:
+            a[i] = a[lt]
+            a[lt] = x
+            lt += 1
+            i += 1
+        elif pivot < x:
+            gt -= 1
+            a[i] = a[gt]
+            a[gt] = x
+        else:
+            i += 1
+    return lt, gt
+
+
+def multiselect(matrix, ks) -> list:
+    """Return several order statistics of a Matrix vector in one pass.
+
+    The vector is copied once and partitioned recursively (three-way,
+    median-of-three or ninther pivots). A segment is only descended into if it
+    contains a requested rank, so m ranks cost about O(n log m) rather than
+    the O(n * m) of m separate kth_smallest calls. Segments that take more
+    than 2*log2(n) levels are sorted outright, which bounds the worst case by
+    O(n log n). The input matrix is not modified.
+
+    Args:
+        matrix: Matrix(1, N)
+        ks: iterable of 1-based ranks, in any order, repeats allowed
+    Returns:
+        list with the k-th smallest value for each k in ks, in the order of ks
+    """
+    ks = list(ks)
+    n = matrix.len()
+    for k in ks:
+        if k < 1 or k > n:
+            raise ValueError("k is out of bounds")
+    a = matrix.row(0)
+    ranks = sorted({k - 1 for k in ks})
+    found = {}
+    stack = [(0, n, 0, len(ranks), 2 * n.bit_length())]
+    while stack:
+        lo, hi, r0, r1, depth = stack.pop()
+        if hi - lo <= SELECT_SORT_CUTOFF or depth == 0:
+            a[lo:hi] = sorted(a[lo:hi])
+            for r in ranks[r0:r1]:
+                found[r] = a[r]
+            continue
+        pivot = choose_pivot(a, lo, hi)
+        lt, gt = three_way_partition(a, lo, hi, pivot)
+        left = bisect_left(ranks, lt, r0, r1)
+        right = bisect_left(ranks, gt, left, r1)
+        for r in ranks[left:right]:
+            found[r] = pivot
+        if r0 < left:
+            stack.append((lo, lt, r0, left, depth - 1))
+        if right < r1:
+            stack.append((gt, hi, right, r1, depth - 1))
+    return [found[k - 1] for k in ks]
+
+
+def quantiles(matrix, qs, method: str = "linear") -> list:
+    """Return the q-quantiles of a Matrix vector for every q in qs (via multiselect).
+
+    Quantile q sits at position h = q * (n - 1) of the sorted vector. The
+    methods follow NumPy's: 'linear' interpolates between the order
+    statistics around h, 'lower' and 'higher' take the one below or above,
+    and 'nearest' takes the closer one (ties go to the even position).
+
+    Args:
+        matrix: Matrix(1, N), N >= 1
+        qs: iterable of fractions in [0, 1], e.g. [0.5, 0.9, 0.99]
+        method: 'linear', 'lower', 'higher' or 'nearest'
+    Returns:
+        list of quantile values, in the order of qs
+    """
+    if method not in ("linear", "lower", "higher", "nearest"):
+        raise ValueError("method must be 'linear', 'lower', 'higher' or 'nearest'")
+    qs = list(qs)
+    n = matrix.len()
+    if n == 0:
+        raise ValueError("quantiles of an empty vector")
+    positions = []
+    for q in qs:
+        if not 0 <= q <= 1:
+            raise ValueError("quantile fractions must be in [0, 1]")
+        h = q * (n - 1)
+        below = floor(h)
+        above = below + 1 if h > below else below
+        if method == "lower":
+            above = below
+        elif method == "higher":
+            below = above
+        elif method == "nearest":
+            below = above = round(h)
+        positions.append((h, below, above))
+    stats = multiselect(matrix, [rank + 1 for _, below, above in positions for rank in (below, above)])
+    result = []
+    for t, (h, below, above) in enumerate(positions):
+        x, y = stats[2 * t], stats[2 * t + 1]
+        result.append(x if method != "linear" or below == above else x + (y - x) * (h - below))
+    return result
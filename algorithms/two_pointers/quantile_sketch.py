@@ -0,0 +1,174 @@
+from bisect import bisect_right
+from itertools import accumulate, islice
+from random import Random
+
+from data_structures.matrix import Matrix
+
+
+KLL_DEFAULT_K = 200
+KLL_SHRINK = 2 / 3
+KLL_MIN_WIDTH = 8
+
+
+class KLLSketch:
+    """Mergeable streaming quantile sketch (Karnin, Lang and Liberty, 2016).
+
+    Items are buffered in a stack of compactors. An item at level h stands
+    for 2**h stream items. When a level fills up, it is sorted and every
+    other item, starting at a random offset, is promoted one level up. The
+    top level holds up to k items and each level below holds 2/3 of the one
+    above, down to KLL_MIN_WIDTH, so at most about 3k + 8 log2(n / k) items
+    are kept for a stream of n items.
+
+    Error bound: every compaction shifts any rank by at most its level
+    weight, up or down with equal probability. The rank error returned by
+    rank() and used by quantile() is therefore unbiased, with a normalized
+    error (|estimated rank - true rank| / n) of O(1/k). With k = 200 it stays
+    around 1% or less in practice (see examples/quantile_benchmarks.py). Up
+    to k items nothing is compacted and the answers are exact. min and max
+    are always exact.
+
+    Attributes:
+        k: accuracy parameter (capacity of the top compactor)
+        n: number of stream items seen (including merged sketches)
+        min, max: smallest and largest item seen (None while empty)
+    """
+
+    def __init__(self, k: int = KLL_DEFAULT_K, seed=None):
+        if k < 8:
+            raise ValueError("k must be at least 8")
+        self.k = k
+        self.n = 0
+        self.min = None
+        self.max = None
+        self._compactors = [[]]
+        self._retained = 0
+        self._max_retained = self._capacity(0)
+        self._random = Random(seed)
+
+    def _capacity(self, level):
+        """Capacity of compactor `level` in the current stack."""
+        depth = len(self._compactors) - 1 - level
+        return max(int(self.k * KLL_SHRINK ** depth) + 1, KLL_MIN_WIDTH)
+
+    def _grow(self):
+        self._compactors.append([])
+        self._max_retained = sum(self._capacity(h) for h in range(len(self._compactors)))
+
+    def _compress(self):
+        """Compact full levels, lowest first, until the sketch fits again."""
+        for h in range(len(self._compactors)):
+            level = self._compactors[h]
+            if len(level) >= self._capacity(h):
+                if h + 1 == len(self._compactors):
+                    self._grow()
+                level.sort()
+                # An odd item out stays behind so the promoted items pair up.
+                held = [level.pop()] if len(level) % 2 else []
+                promoted = level[self._random.getrandbits(1)::2]
+                self._compactors[h + 1].extend(promoted)
+                self._retained -= len(level) - len(promoted)
+                level[:] = held
+                if self._retained < self._max_retained:
+                    break
+
+    def update(self, x) -> None:
+        """Add one stream item."""
+        if self.n == 0:
+            self.min = self.max = x
+        elif x < self.min:
+            self.min = x
+        elif self.max < x:
+            self.max = x
+        self.n += 1
+        self._compactors[0].append(x)
+        self._retained += 1
+        if self._retained >= self._max_retained:
+            self._compress()
+
+    def extend(self, values) -> None:
+        """Add every item of an iterable or of a 1xN Matrix vector."""
+        if isinstance(values, Matrix):
+            if values.rows != 1:
+                raise ValueError("Sketch input must be a 1xN vector")
+            values = values.row(0)
+        values = iter(values)
+        while True:
+            room = max(1, self._max_retained - self._retained)
+            chunk = list(islice(values, room))
+            if not chunk:
+                return
+            lo, hi = min(chunk), max(chunk)
+            if self.n == 0:
+                self.min, self.max = lo, hi
+            else:
+                self.min = lo if lo < self.min else self.min
+                self.max = hi if self.max < hi else self.max
+            self.n += len(chunk)
+            self._compactors[0].extend(chunk)
+            self._retained += len(chunk)
+            if self._retained >= self._max_retained:
+                self._compress()
+
+    def merge(self, other: "KLLSketch") -> "KLLSketch":
+        """Fold `other` (built with any k) into this sketch; return self."""
+        if other.n == 0:
+            return self
+        while len(self._compactors) < len(other._compactors):
+            self._grow()
+        for mine, theirs in zip(self._compactors, other._compactors):
+            mine.extend(theirs)
+        if self.n == 0:
+            self.min, self.max = other.min, other.max
+        else:
+            self.min = other.min if other.min < self.min else self.min
+            self.max = other.max if self.max < other.max else self.max
+        self.n += other.n
+        self._retained += other._retained
+        while self._retained >= self._max_retained:
+            self._compress()
+        return self
+
+    def num_retained(self) -> int:
+        """Number of items currently stored (the sketch's memory footprint)."""
+        return self._retained
+
+    def _weighted(self):
+        """Sorted stored items and their cumulative weights."""
+        pairs = sorted((x, 1 << h) for h, level in enumerate(self._compactors) for x in level)
+        return [x for x, _ in pairs], list(accumulate(w for _, w in pairs))
+
+    def rank(self, x) -> float:
+        """Estimated fraction of stream items <= x."""
+        if self.n == 0:
+            raise ValueError("rank of an empty sketch")
+        items, cumulative = self._weighted()
+        i = bisect_right(items, x)
+        return cumulative[i - 1] / cumulative[-1] if i else 0.0
+
+    def quantile(self, q: float):
+        """Estimated q-quantile (0 <= q <= 1) of the stream.
+
+        Equals quantiles(..., method="lower") of the exact data while nothing
+        has been compacted; q = 0 and q = 1 give the exact min and max.
+        """
+        return self.quantiles([q])[0]
+
+    def quantiles(self, qs) -> list:
+        """Estimated quantiles for every q in qs, sorting the sketch once."""
+        if self.n == 0:
+            raise ValueError("quantile of an empty sketch")
+        items, cumulative = self._weighted()
+        total = cumulative[-1]
+        out = []
+        for q in qs:
+            if not 0 <= q <= 1:
+                raise ValueError("quantile levels must lie in [0, 1]")
+            if q == 0:
+                out.append(self.min)
+            elif q == 1:
+                out.append(self.max)
+            else:
+                i = bisect_right(cumulative, q * (total - 1))
+                out.append(items[min(i, len(items) - 1)])
+        return out
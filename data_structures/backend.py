@@ -0,0 +1,214 @@
+"""Optional compute backends for Matrix.
+
+The default "python" backend uses only the standard library. When NumPy is
+installed, the "numpy" backend can be switched on with the environment
+variable ALGORITHMS_BACKEND=numpy or with set_backend("numpy"). Typed
+matrices (created with a dtype) then keep their entries in a 1-D ndarray,
+and add, subtract, linear_combination (with the in-place iadd, isub,
+scale_ and axpy), multiply, strassen_multiply, transpose, copy, sorting,
+reduce_stats, Floyd-Warshall and fft_multiply run as vectorized kernels.
+Generic (dtype=None) matrices always take the Python path, and the
+environment variable is ignored when NumPy is missing.
+
+Both backends return the same values for integer data. The arithmetic
+kernels compute integers in int64 (uint64 as Python ints) and floats in
+float64, then raise OverflowError, as array storage does, if a result does
+not fit the dtype it is stored in (see fit()). Only intermediate sums past
+64 bits wrap instead of raising, and float sums may differ in the last bits
+because NumPy sums in another order.
+Growing a matrix (add_row, add_column, merges) moves it back to array storage.
+"""
+
+import os
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency
+    np = None
+
+
+BACKEND_ENV_VAR = "ALGORITHMS_BACKEND"
+_BACKENDS = ("python", "numpy")
+_active = "python"
+
+
+def available_backends():
+    """Return the names of the backends that can be selected here."""
+    return [name for name in _BACKENDS if name != "numpy" or np is not None]
+
+
+def get_backend() -> str:
+    """Return the name of the active backend."""
+    return _active
+
+
+def set_backend(name: str) -> None:
+    """Select the backend used by matrices created from now on.
+
+    Raises:
+        ValueError: unknown backend name
+        ImportError: "numpy" requested but NumPy is not installed
+    """
+    global _active
+    if name not in _BACKENDS:
+        raise ValueError(f"Unknown backend {name!r}; choose from {_BACKENDS}")
+    if name == "numpy" and np is None:
+        raise ImportError("The numpy backend requires NumPy to be installed")
+    _active = name
+
+
+def numpy_enabled() -> bool:
+    """True if the numpy backend is active."""
+    return _active == "numpy"
+
+
+def uses_numpy(*matrices) -> bool:
+    """True if the numpy backend is active and every matrix has a typed dtype."""
+    return _active == "numpy" and all(m.dtype is not None for m in matrices)
+
+
+def is_ndarray(buf) -> bool:
+    """True if `buf` is a NumPy array."""
+    return np is not None and isinstance(buf, np.ndarray)
+
+
+# ---- Kernels (only called when uses_numpy() is true) ----
+def full(size: int, fill, dtype):
+    """Return a 1-D ndarray of `size` copies of `fill`."""
+    return np.full(size, fill, dtype=np.dtype(dtype))
+
+
+def as_array(m):
+    """Return m's entries as a 2-D ndarray (a read-only view when ndarray-backed)."""
+    buf = m._data
+    if m.rows == 0 or m.cols == 0:
+        return np.zeros((m.rows, m.cols), dtype=np.dtype(m.dtype))
+    if isinstance(buf, np.ndarray):
+        item = buf.itemsize
+        return np.lib.stride_tricks.as_strided(
+            buf[m._offset:], shape=(m.rows, m.cols),
+            strides=(m._rstride * item, m._cstride * item), writeable=False)
+    return np.array([m._row_values(i) for i in range(m.rows)], dtype=np.dtype(m.dtype))
+
+
+def _work(m):
+    """m's entries widened to the kernels' compute dtype: int64 for integers
+    (objects for uint64, which int64 cannot hold) and float64 for floats."""
+    x = as_array(m)
+    if x.dtype.kind == "f":
+        return x.astype(np.float64, copy=False)
+    if x.dtype == np.uint64:
+        return x.astype(object)
+    return x.astype(np.int64, copy=False)
+
+
+def fit(values, dtype):
+    """Return `values` converted to dtype (unchanged for dtype=None).
+
+    Raises:
+        TypeError: float values for an integer dtype (no silent truncation)
+        OverflowError: an integer entry is out of range for dtype
+    """
+    if dtype is None:
+        return values
+    target = np.dtype(dtype)
+    if target.kind in "iu" and values.dtype.kind == "f":
+        raise TypeError(f"float results cannot be stored in integer dtype {dtype!r}")
+    if target.kind in "iu" and values.size:
+        info = np.iinfo(target)
+        if values.min() < info.min or values.max() > info.max:
+            raise OverflowError(f"result does not fit in dtype {dtype!r}")
+    return values.astype(target)
+
+
+def elementwise(a, b, subtract: bool):
+    """Zero-padded a + b (or a - b) over the union of both shapes."""
+    x, y = _work(a), _work(b)
+    out = np.zeros((max(a.rows, b.rows), max(a.cols, b.cols)), dtype=np.result_type(x, y))
+    out[:a.rows, :a.cols] += x
+    if subtract:
+        out[:b.rows, :b.cols] -= y
+    else:
+        out[:b.rows, :b.cols] += y
+    return out
+
+
+def linear_combination(terms):
+    """Return sum(coef * M) over (coef, M) pairs as a 2-D ndarray."""
+    (c0, m0), rest = terms[0], terms[1:]
+    out = c0 * _work(m0)
+    for c, m in rest:
+        out = out + c * _work(m)
+    return out
+
+
+def matmul(a, b):
+    """Return the matrix product of a and b as a 2-D ndarray."""
+    return _work(a) @ _work(b)
+
+
+def reduce_lines(m, axis):
+    """Per-line (min, max, argmin, argmax, sum) of m, as five lists of Python values.
+
+    axis=1 reduces each row, axis=0 each column and axis=None all entries in
+    row-major order (one line). argmin and argmax are first positions.
+    """
+    x = _work(m)
+    lines = x.reshape(1, -1) if axis is None else (x if axis == 1 else x.T)
+    return (lines.min(axis=1).tolist(), lines.max(axis=1).tolist(),
+            lines.argmin(axis=1).tolist(), lines.argmax(axis=1).tolist(),
+            lines.sum(axis=1).tolist())
+
+
+def sort_vector(v, stable: bool = True):
+    """Return the sorted entries of a 1xN matrix as a 1-D ndarray."""
+    return np.sort(as_array(v)[0], kind="stable" if stable else "quicksort")
+
+
+def sort_lines(m, axis, stable: bool = True):
+    """Return m's rows (axis=1) or columns (axis=0) sorted, one line per ndarray row."""
+    lines = as_array(m) if axis == 1 else as_array(m).T
+    return np.sort(lines, axis=1, kind="stable" if stable else "quicksort")
+
+
+def argsort_lines(m, axis, stable: bool = True):
+    """Like sort_lines() but returns the sorting indices of every line."""
+    lines = as_array(m) if axis == 1 else as_array(m).T
+    return np.argsort(lines, axis=1, kind="stable" if stable else "quicksort")
+
+
+def fft_convolve(a, b):
+    """Real convolution of two 1xN matrices via rfft, as a 1-D float ndarray."""
+    x, y = as_array(a)[0].astype(float), as_array(b)[0].astype(float)
+    size = len(x) + len(y) - 1
+    n = 1 << (size - 1).bit_length()
+    return np.fft.irfft(np.fft.rfft(x, n) * np.fft.rfft(y, n), n)[:size]
+
+
+def floyd_warshall(rows, inf_value):
+    """Vectorized Floyd-Warshall over a list of integer distance rows.
+
+    Returns (dist_rows, parent_rows) as nested Python lists, or None when
+    the data is not all integers small enough for int64 arithmetic or a
+    negative cycle appears; the caller then runs the exact Python loop.
+    """
+    D = np.array(rows)
+    n = D.shape[0]
+    if D.dtype.kind != "i" or (n and int(np.abs(D).max()) * 2 * n >= 2 ** 62):
+        return None
+    P = np.full((n, n), -1, dtype=np.int64)
+    for k in range(n):
+        if D[k, k] < 0:
+            return None
+        col = D[:, k:k + 1]
+        row = D[k:k + 1, :]
+        via = col + row
+        better = (col < inf_value) & (row < inf_value) & (via < D)
+        D = np.where(better, via, D)
+        P[better] = k
+    return D.tolist(), P.tolist()
+
+
+_requested = os.environ.get(BACKEND_ENV_VAR, "python").strip().lower()
+if _requested in available_backends():
+    _active = _requested
@@ -7,6 +7,7 @@ Floyd-Warshall which automatically handle vertex-to-index mapping.
 """
 
 from data_structures.matrix import Matrix
+from data_structures.sparse_matrix import SparseMatrix
 
 
 class Edge:
@@ -95,18 +96,14 @@ class Graph:
         if not edge_matrix or edge_matrix.is_empty():
             return []
         
-        edges = []
-        for i in range(edge_matrix.rows):
-            v, w, directed_val = edge_matrix.get(i, 0), edge_matrix.get(i, 1), edge_matrix.get(i, 2)
-            edges.append(Edge(u, v, w, bool(directed_val)))
-        return edges
+        return [Edge(u, v, w, bool(directed_val)) for v, w, directed_val in edge_matrix.tolist()]
 
     @classmethod
     def from_adjacency_matrix(cls, matrix: Matrix, directed: bool = True, inf_value: int = 10**12):
         """Create a graph from an n×n adjacency matrix.
         
         Args:
-            matrix: n×n Matrix with edge weights (inf_value for no edge)
+            matrix: n×n Matrix or SparseMatrix with edge weights (inf_value for no edge)
             directed: whether the graph is directed
             inf_value: value representing no edge
             
@@ -115,6 +112,13 @@ class Graph:
         """
         n = matrix.rows
         graph = cls(n, directed)
+
+        if isinstance(matrix, SparseMatrix):
+            # Only stored entries can be edges: O(n + nnz) instead of O(n^2).
+            for i, j, weight in matrix.items():
+                if weight != inf_value and weight != 0:
+                    graph.add_edge(i, j, weight)
+            return graph
         
         for i in range(n):
             for j in range(n):
@@ -148,12 +152,29 @@ class Graph:
         # Add edges
         for u, edge_matrix in self.adj.items():
             u_idx = vertex_to_index[u]
-            for i in range(edge_matrix.rows):
-                v, w, _ = edge_matrix.get(i, 0), edge_matrix.get(i, 1), edge_matrix.get(i, 2)
+            for v, w, _ in edge_matrix.tolist():
                 if v in vertex_to_index:
                     v_idx = vertex_to_index[v]
                     m.set(u_idx, v_idx, w)
         
         return m
 
+    def to_sparse_adjacency(self, inf_value: int = 10**12) -> SparseMatrix:
+        """Convert to a CSR adjacency matrix in O(V + E) memory.
 
+        Same layout and vertex order as to_adjacency_matrix (diagonal 0,
+        missing edges read as inf_value), but only the diagonal and the
+        edges are stored.
+        """
+        vertices = list(self.adj.keys())
+        n = len(vertices)
+        vertex_to_index = {v: i for i, v in enumerate(vertices)}
+        m = SparseMatrix(n, n, inf_value)
+        for i in range(n):
+            m.set(i, i, 0)
+        for u, edge_matrix in self.adj.items():
+            u_idx = vertex_to_index[u]
+            for v, w, _ in edge_matrix.tolist():
+                if v in vertex_to_index:
+                    m.set(u_idx, vertex_to_index[v], w)
+        return m.to_csr()
@@ -54,10 +54,7 @@ class MinHeap:
         self._swap(0, last_idx)
         item = self._data.get(0, last_idx)
         self._data.cols -= 1
-        new_data = Matrix(1, self._data.cols)
-        for i in range(self._data.cols):
-            new_data.set(0, i, self._data.get(0, i))
-        self._data = new_data
+        self._data = Matrix.vector(self._data.row(0))
         if not self.is_empty():
             self._sift_down(0)
         return item
@@ -2,21 +2,381 @@
 
 Provides a lightweight 2D matrix with helpers for vector operations, sorting,
 basic arithmetic, submatrix operations, and Strassen multiplication.
+
+Entries live in one flat row-major buffer addressed through an offset and a
+(row, column) stride pair. By default the buffer is a Python list so any
+object can be stored; passing an `array` typecode as ``dtype`` (for example
+'q', 'd' or 'b') stores unboxed numbers in an ``array.array`` instead, which
+is several times smaller for large numeric matrices.
 """
 
+from array import array, typecodes
+from functools import total_ordering
+from numbers import Integral
+from operator import add, mul, sub
+import mmap
+import struct
+import sys
+
+from data_structures import backend
+
+
+STRASSEN_LEAF_SIZE = 64
+INTEGER_DTYPES = "bBhHiIlLqQ"
+
+# On-disk format: fixed 32-byte header, then raw native row-major items.
+# magic, version, dtype, byte order ('l'/'b'), itemsize, rows, cols
+_FILE_MAGIC = b"ALGMTX"
+_FILE_VERSION = 1
+_FILE_HEADER = struct.Struct("<6sBccB2xQQ4x")
+_FILE_DTYPES = INTEGER_DTYPES + "fd"
+_OPEN_MODES = {"r": mmap.ACCESS_READ, "r+": mmap.ACCESS_WRITE, "c": mmap.ACCESS_COPY}
+
+
+def _allocate(dtype, size, fill=0):
+    """Return a flat buffer of `size` copies of `fill` for the given dtype."""
+    if dtype is None:
+        return [fill] * size
+    if backend.numpy_enabled():
+        return backend.full(size, fill, dtype)
+    return array(dtype, [fill]) * size
+
+
+def _empty_buffer(dtype):
+    """Return an empty, growable flat buffer for the given dtype."""
+    if dtype is None:
+        return []
+    return array(dtype)
+
+
+def _as_list(values):
+    """Return a flat sequence as a list of plain Python values."""
+    if isinstance(values, list):
+        return values
+    return values.tolist()
+
+
+def pack_file_header(dtype, rows, cols) -> bytes:
+    """Return the 32-byte Matrix file header for a rows x cols matrix of `dtype`.
+
+    Writers that stream entries (instead of calling Matrix.save) write this
+    header first, followed by the rows * cols raw row-major items.
+    """
+    if dtype is None or dtype not in _FILE_DTYPES:
+        raise ValueError(f"Only numeric typed matrices can be saved (dtype in {_FILE_DTYPES!r})")
+    return _FILE_HEADER.pack(_FILE_MAGIC, _FILE_VERSION, dtype.encode(),
+                             sys.byteorder[0].encode(), array(dtype).itemsize, rows, cols)
+
+
+def _clone(buf):
+    """Return an independent copy of a flat buffer (memoryviews become arrays)."""
+    if isinstance(buf, (list, array)):
+        return buf[:]
+    if isinstance(buf, memoryview):
+        copied = array(buf.format)
+        copied.frombytes(buf.cast("B"))
+        return copied
+    return buf.copy()
+
+
+@total_ordering
+class _RowProxy:
+    """Live, writable handle on one matrix row (returned by m[i] and m.data[i])."""
+
+    __slots__ = ("_matrix", "_row")
+
+    def __init__(self, matrix, row):
+        self._matrix = matrix
+        self._row = row
+
+    def __len__(self):
+        return self._matrix.cols
+
+    def __iter__(self):
+        return iter(self._matrix._row_values(self._row))
+
+    def __getitem__(self, col):
+        if isinstance(col, slice):
+            return list(self)[col]
+        if col < 0:
+            col += self._matrix.cols
+        return self._matrix.get(self._row, col)
+
+    def __setitem__(self, col, value):
+        if col < 0:
+            col += self._matrix.cols
+        self._matrix.set(self._row, col, value)
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def __lt__(self, other):
+        return list(self) < list(other)
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+class _RowsProxy:
+    """Sequence of row handles exposed through `Matrix.data`."""
+
+    __slots__ = ("_matrix",)
+
+    def __init__(self, matrix):
+        self._matrix = matrix
+
+    def __len__(self):
+        return self._matrix.rows
+
+    def __iter__(self):
+        return (_RowProxy(self._matrix, i) for i in range(self._matrix.rows))
+
+    def __getitem__(self, row):
+        if row < 0:
+            row += self._matrix.rows
+        if not 0 <= row < self._matrix.rows:
+            raise IndexError("Index out of bounds")
+        return _RowProxy(self._matrix, row)
+
+    def __setitem__(self, row, values):
+        if row < 0:
+            row += self._matrix.rows
+        self._matrix._set_row(row, values)
+
+    def __repr__(self):
+        return repr([list(r) for r in self])
+
 
 class Matrix:
     """Simple row-major matrix.
 
     Use rows=1 to represent vectors. The implementation avoids external libs
     and is intended for educational purposes and algorithm demos.
+
+    Storage is a single flat buffer: entry (i, j) lives at
+    ``_offset + i * _rstride + j * _cstride``. ``dtype=None`` keeps a generic
+    Python list; any ``array`` typecode selects a typed ``array.array``.
     """
 
-    def __init__(self, rows, cols, default_value=0):
+    def __init__(self, rows, cols, default_value=0, dtype=None):
+        if dtype is not None and dtype not in typecodes:
+            raise ValueError(f"Unsupported dtype {dtype!r}; use None or one of {typecodes!r}")
         self.rows = rows
         self.cols = cols
-        self.data = [[default_value for _ in range(cols)] for _ in range(rows)]
-        
+        self.dtype = dtype
+        self._data = _allocate(dtype, rows * cols, default_value)
+        self._offset = 0
+        self._rstride = cols
+        self._cstride = 1
+
+    # ---- Storage helpers ----
+    def _is_compact(self):
+        """True if the buffer holds exactly this matrix, densely, from index 0."""
+        return (self._offset == 0 and self._cstride == 1 and self._rstride == self.cols
+                and len(self._data) == self.rows * self.cols)
+
+    def _row_values(self, row):
+        """Return row `row` as a fresh flat sequence (list or array slice)."""
+        start = self._offset + row * self._rstride
+        if self._cstride == 1:
+            return self._data[start:start + self.cols]
+        return self._data[start:start + self.cols * self._cstride:self._cstride]
+
+    def _plain_row(self, row):
+        """Row `row` for pure-Python arithmetic: NumPy scalars would wrap at their
+        own width, so ndarray-backed rows come back as lists of Python values."""
+        values = self._row_values(row)
+        return values.tolist() if backend.is_ndarray(values) else values
+
+    def _set_row(self, row, values):
+        """Overwrite row `row` with `values` (length must equal cols)."""
+        if not 0 <= row < self.rows:
+            raise IndexError("Index out of bounds")
+        if len(values) != self.cols:
+            raise ValueError("Row length must match number of columns")
+        start = self._offset + row * self._rstride
+        data = self._data
+        if not (isinstance(data, list) or backend.is_ndarray(data)
+                or (isinstance(values, array) and values.typecode == self.dtype)):
+            values = array(self.dtype, values)
+        if self._cstride == 1:
+            self._data[start:start + self.cols] = values
+        else:
+            self._data[start:start + self.cols * self._cstride:self._cstride] = values
+
+    def _compact(self):
+        """Repack storage into a dense, growable buffer owned by this matrix."""
+        if self._is_compact() and isinstance(self._data, (list, array)):
+            return
+        buf = _empty_buffer(self.dtype)
+        for i in range(self.rows):
+            buf.extend(self._row_values(i))
+        self._data = buf
+        self._offset = 0
+        self._rstride = self.cols
+        self._cstride = 1
+
+    @classmethod
+    def _from_ndarray(cls, values, dtype):
+        """Build a Matrix from a 2-D ndarray (used by the numpy backend).
+
+        With dtype=None the entries are stored as Python objects, matching
+        what the pure-Python path would produce.
+        """
+        rows, cols = values.shape
+        m = cls(0, cols, dtype=dtype)
+        if dtype is None:
+            m._data = values.reshape(-1).tolist()
+        else:
+            m._data = backend.np.array(values, dtype=backend.np.dtype(dtype)).reshape(-1)
+        m.rows = rows
+        return m
+
+    def _adopt(self, buf, rows, cols):
+        """Take ownership of a dense flat buffer holding rows x cols entries."""
+        if self.dtype is not None and backend.numpy_enabled() and isinstance(buf, array):
+            buf = backend.np.array(buf)
+        self.rows = rows
+        self.cols = cols
+        self._data = buf
+        self._offset = 0
+        self._rstride = cols
+        self._cstride = 1
+
+    @property
+    def data(self):
+        """Rows of the matrix as writable row handles (m.data[i][j] = x works)."""
+        return _RowsProxy(self)
+
+    @data.setter
+    def data(self, rows):
+        """Replace contents from a list of equally sized rows."""
+        rows = list(rows)
+        cols = len(rows[0]) if rows else self.cols
+        buf = _empty_buffer(self.dtype)
+        for r in rows:
+            if len(r) != cols:
+                raise ValueError("All rows must have the same length")
+            buf.extend(r)
+        self._adopt(buf, len(rows), cols)
+
+    # ---- Bulk construction and export ----
+    @classmethod
+    def from_rows(cls, rows, dtype=None, cols=None):
+        """Build a matrix from an iterable of equally sized rows.
+
+        Each row is copied with one extend, not one set() per entry.
+
+        Args:
+            rows: iterable of sequences, all the same length
+            dtype: storage dtype (None for generic objects)
+            cols: column count to use when `rows` is empty
+        Returns:
+            new Matrix
+        """
+        m = cls(0, cols or 0, dtype=dtype)
+        m.data = rows
+        return m
+
+    @classmethod
+    def vector(cls, values, dtype=None):
+        """Build a 1xN vector from any iterable in a single pass."""
+        buf = list(values) if dtype is None else array(dtype, values)
+        m = cls(0, 0, dtype=dtype)
+        m._adopt(buf, 1, len(buf))
+        return m
+
+    @classmethod
+    def from_buffer(cls, buffer, rows, cols, dtype):
+        """Build a typed matrix by copying raw row-major bytes.
+
+        Args:
+            buffer: bytes-like object (bytes, bytearray, array, memoryview, ...)
+                holding rows * cols native items of `dtype`
+            rows: number of rows
+            cols: number of columns
+            dtype: array typecode of the items
+        Returns:
+            new Matrix owning a copy of the data
+        """
+        m = cls(0, 0, dtype=dtype)
+        buf = array(dtype)
+        buf.frombytes(memoryview(buffer).cast("B"))
+        if len(buf) != rows * cols:
+            raise ValueError(f"Buffer holds {len(buf)} items, expected {rows * cols}")
+        m._adopt(buf, rows, cols)
+        return m
+
+    # ---- File storage ----
+    def save(self, path):
+        """Write the matrix to `path` in the binary Matrix file format.
+
+        The file is a 32-byte header (magic, version, dtype, byte order,
+        itemsize, rows, cols) followed by the raw row-major items, so it can
+        be mapped straight back into memory by Matrix.open. Only typed
+        matrices can be saved.
+        """
+        header = pack_file_header(self.dtype, self.rows, self.cols)
+        with open(path, "wb") as f:
+            f.write(header)
+            if self._is_compact():
+                f.write(self._data)
+            else:
+                for i in range(self.rows):
+                    f.write(self._row_values(i))
+
+    @classmethod
+    def open(cls, path, mode="r"):
+        """Map a file written by save() into a Matrix without reading it.
+
+        The entries stay in the file: pages are loaded on first access and
+        the OS shares them between every process that maps the same file.
+
+        Args:
+            path: file written by Matrix.save
+            mode: 'r' read-only, 'r+' writes go to the file, 'c' copy-on-write
+                (writes stay private to this process)
+        Returns:
+            Matrix backed by the memory map
+        """
+        if mode not in _OPEN_MODES:
+            raise ValueError(f"mode must be one of {sorted(_OPEN_MODES)}")
+        with open(path, "r+b" if mode == "r+" else "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=_OPEN_MODES[mode])
+        if len(mapped) < _FILE_HEADER.size:
+            raise ValueError("File is too small to be a Matrix file")
+        magic, version, dtype, order, itemsize, rows, cols = _FILE_HEADER.unpack_from(mapped)
+        dtype, order = dtype.decode(), order.decode()
+        if magic != _FILE_MAGIC or version != _FILE_VERSION:
+            raise ValueError("Not a Matrix file or unsupported version")
+        if dtype not in _FILE_DTYPES or array(dtype).itemsize != itemsize or order != sys.byteorder[0]:
+            raise ValueError("Matrix file was written on an incompatible platform")
+        end = _FILE_HEADER.size + rows * cols * itemsize
+        if len(mapped) < end:
+            raise ValueError("Matrix file is truncated")
+        m = cls(0, 0, dtype=dtype)
+        m._adopt(memoryview(mapped)[_FILE_HEADER.size:end].cast(dtype), rows, cols)
+        return m
+
+    def tolist(self):
+        """Return the entries as a list of row lists."""
+        return [_as_list(self._row_values(i)) for i in range(self.rows)]
+
+    def row(self, i):
+        """Return row i as a list."""
+        if not 0 <= i < self.rows:
+            raise IndexError("Index out of bounds")
+        return _as_list(self._row_values(i))
+
+    def col(self, j):
+        """Return column j as a list."""
+        if not 0 <= j < self.cols:
+            raise IndexError("Index out of bounds")
+        if self.rows == 0:
+            return []
+        start = self._offset + j * self._cstride
+        return _as_list(self._data[start:start + (self.rows - 1) * self._rstride + 1:self._rstride])
+
     def len(self):
         """Return length for vectors or (rows, cols) for matrices."""
         if self.rows == 1:
@@ -26,14 +386,14 @@ class Matrix:
     def get(self, row, col):
         """Get value at (row, col). Raises IndexError if out of bounds."""
         if 0 <= row < self.rows and 0 <= col < self.cols:
-            return self.data[row][col]
+            return self._data[self._offset + row * self._rstride + col * self._cstride]
         else:
             raise IndexError("Index out of bounds")
 
     def set(self, row, col, value):
         """Set value at (row, col). Raises IndexError if out of bounds."""
         if 0 <= row < self.rows and 0 <= col < self.cols:
-            self.data[row][col] = value
+            self._data[self._offset + row * self._rstride + col * self._cstride] = value
         else:
             raise IndexError("Index out of bounds")
         
@@ -49,32 +409,31 @@ class Matrix:
         """Get element at (row, col) or entire row.
         
         Args:
-            pidx: row index
+            pidx: row index, or a (row, col) tuple
             sidx: column index (optional, if None returns entire row)
             
         Returns:
-            Element at (pidx, sidx) or list representing row pidx
+            Element at (pidx, sidx) or a writable handle on row pidx
         """
+        if isinstance(pidx, tuple):
+            pidx, sidx = pidx
         if pidx<0 or pidx>=self.rows or (sidx is not None and (sidx<0 or sidx>=self.cols)):
             raise IndexError("Index out of bounds")
         if sidx is None:
-            return self.data[pidx]
-        return self.data[pidx][sidx]
+            return _RowProxy(self, pidx)
+        return self.get(pidx, sidx)
     
-    def __setitem__(self, pidx, sidx, value):
+    def __setitem__(self, key, value):
         """Set element at (row, col) or entire row.
         
         Args:
-            pidx: row index
-            sidx: column index (optional, if None sets entire row)
-            value: value to set (single value or list for entire row)
+            key: row index (sets entire row) or a (row, col) tuple
+            value: value to set (single value or sequence for entire row)
         """
-        if pidx<0 or pidx>=self.rows or (sidx is not None and (sidx<0 or sidx>=self.cols)):
-            raise IndexError("Index out of bounds")
-        if sidx is None:
-            self.data[pidx] = value
+        if isinstance(key, tuple):
+            self.set(key[0], key[1], value)
         else:
-            self.data[pidx][sidx] = value
+            self._set_row(key, value)
 
     # ---- Vector helpers ----
     def _ensure_vector(self):
@@ -86,39 +445,57 @@ class Matrix:
         self._ensure_vector()
         if not (0 <= i < self.cols and 0 <= j < self.cols):
             raise IndexError("Index out of bounds")
-        self.data[0][i], self.data[0][j] = self.data[0][j], self.data[0][i]
+        data = self._data
+        i = self._offset + i * self._cstride
+        j = self._offset + j * self._cstride
+        data[i], data[j] = data[j], data[i]
 
     def copy(self):
         """Return a deep copy of the matrix."""
-        m = Matrix(self.rows, self.cols)
-        for i in range(self.rows):
-            for j in range(self.cols):
-                m.data[i][j] = self.data[i][j]
+        if backend.uses_numpy(self):
+            return Matrix._from_ndarray(backend.as_array(self), self.dtype)
+        m = Matrix(0, self.cols, dtype=self.dtype)
+        if self._is_compact():
+            m._data = _clone(self._data)
+        else:
+            m._data = _empty_buffer(self.dtype)
+            for i in range(self.rows):
+                m._data.extend(self._row_values(i))
+        m.rows = self.rows
         return m
             
     def add_row(self, values=None):
         """Append a row; values defaults to zeros of current column count."""
         if values is None:
-            values = [0] * self.cols
+            values = _allocate(self.dtype, self.cols)
         elif len(values) != self.cols:
             raise ValueError("Row length must match number of columns")
-        self.data.append(values)
+        self._compact()
+        self._data.extend(values)
         self.rows += 1
         
     def merge_rows(self, other):
         """Concatenate rows of another matrix with same number of columns."""
         if self.cols != other.cols:
             raise ValueError("Matrices must have the same number of columns to merge rows")
-        self.data.extend(other.data)
+        self._compact()
+        for i in range(other.rows):
+            self._data.extend(other._row_values(i))
         self.rows += other.rows
         
     def merge_columns(self, other):
         """Concatenate columns of another matrix with same number of rows."""
         if self.rows != other.rows:
             raise ValueError("Matrices must have the same number of rows to merge columns")
+        buf = _empty_buffer(self.dtype)
         for i in range(self.rows):
-            self.data[i].extend(other.data[i])
+            buf.extend(self._row_values(i))
+            buf.extend(other._row_values(i))
         self.cols += other.cols
+        self._data = buf
+        self._offset = 0
+        self._rstride = self.cols
+        self._cstride = 1
         
     def add_column(self, values=None):
         """Append a column; values defaults to zeros of current row count."""
@@ -126,15 +503,26 @@ class Matrix:
             values = [0] * self.rows
         elif len(values) != self.rows:
             raise ValueError("Column length must match number of rows")
+        if self.rows == 1:
+            self._compact()
+            self._data.append(values[0])
+            self.cols += 1
+            return
+        buf = _empty_buffer(self.dtype)
         for i in range(self.rows):
-            self.data[i].append(values[i])
+            buf.extend(self._row_values(i))
+            buf.append(values[i])
         self.cols += 1
+        self._data = buf
+        self._offset = 0
+        self._rstride = self.cols
+        self._cstride = 1
 
     def zero(self):
         """Set all entries to 0."""
+        zeros = _allocate(self.dtype, self.cols)
         for i in range(self.rows):
-            for j in range(self.cols):
-                self.data[i][j] = 0
+            self._set_row(i, zeros)
 
     def identity(self):
         """Transform into an identity matrix (must be square)."""
@@ -142,140 +530,350 @@ class Matrix:
             raise ValueError("Identity matrix must be square")
         self.zero()
         for i in range(self.rows):
-            self.data[i][i] = 1
+            self.set(i, i, 1)
 
     def __str__(self):
         """Pretty string representation with space-separated rows."""
-        return '\n'.join([' '.join(map(str, row)) for row in self.data])
+        return '\n'.join([' '.join(map(str, self._row_values(i))) for i in range(self.rows)])
 
     def transpose(self):
         """Return the transpose of the matrix as a new Matrix."""
-        transposed = Matrix(self.cols, self.rows)
-        for i in range(self.rows):
-            for j in range(self.cols):
-                transposed.set(j, i, self.get(i, j))
+        if backend.uses_numpy(self):
+            return Matrix._from_ndarray(backend.as_array(self).T, self.dtype)
+        transposed = Matrix(0, self.rows, dtype=self.dtype)
+        transposed._data = _empty_buffer(self.dtype)
+        src = self
+        if not self._is_compact():
+            src = self.copy()
+        data, cols = src._data, src.cols
+        for j in range(cols):
+            transposed._data.extend(data[j::cols])
+        transposed.rows = self.cols
         return transposed
 
     # ---- Sorting for 1xN vectors ----
-    def _partition(self, low: int, high: int) -> int:
-        self._ensure_vector()
-        pivot = self.get(0, high)
-        i = low - 1
-        for j in range(low, high):
-            if self.get(0, j) <= pivot:
-                i += 1
-                x = self.get(0, i)
-                self.set(0, i, self.get(0, j))
-                self.set(0, j, x)
-        x = self.get(0, i + 1)
-        self.set(0, i + 1, self.get(0, high))
-        self.set(0, high, x)
-        return i + 1
-
     def quick_sort(self):
-        """In-place quicksort for 1xN vector. Uses internal partition."""
+        """In-place introsort for 1xN vector (see algorithms.quick_sort)."""
         self._ensure_vector()
-
-        def _qs(l, r):
-            if l < r:
-                p = self._partition(l, r)
-                _qs(l, p - 1)
-                _qs(p + 1, r)
-        _qs(0, self.cols - 1)
+        if backend.uses_numpy(self):
+            self._set_row(0, backend.sort_vector(self, stable=False))
+            return
+        from algorithms.quick_sort import quick_sort_matrix
+        quick_sort_matrix(self)
 
     def merge_sort(self):
-        """Stable merge sort for 1xN vector (returns new sorted Matrix)."""
+        """Stable merge sort for 1xN vector (returns new sorted Matrix).
+
+        Bottom-up with run detection and galloping merges; besides the copy
+        that becomes the result, one n-item buffer is allocated (see
+        algorithms.divide_conquer.merge_sort.merge_sort_buffer).
+        """
         self._ensure_vector()
-        if self.cols <= 1:
-            return self.copy()
-
-        mid = self.cols // 2
-        left = Matrix(1, mid)
-        right = Matrix(1, self.cols - mid)
-        for i in range(mid):
-            left.set(0, i, self.get(0, i))
-        for i in range(self.cols - mid):
-            right.set(0, i, self.get(0, mid + i))
-        left_sorted = left.merge_sort()
-        right_sorted = right.merge_sort()
-
-        # merge
-        result = Matrix(1, self.cols)
-        i = j = k = 0
-        while i < left_sorted.cols and j < right_sorted.cols:
-            if left_sorted.get(0, i) <= right_sorted.get(0, j):
-                result.set(0, k, left_sorted.get(0, i))
-                i += 1
-            else:
-                result.set(0, k, right_sorted.get(0, j))
-                j += 1
-            k += 1
-        while i < left_sorted.cols:
-            result.set(0, k, left_sorted.get(0, i))
-            i += 1
-            k += 1
-        while j < right_sorted.cols:
-            result.set(0, k, right_sorted.get(0, j))
-            j += 1
-            k += 1
+        if backend.uses_numpy(self):
+            return Matrix._from_ndarray(backend.sort_vector(self).reshape(1, -1), self.dtype)
+        from algorithms.divide_conquer.merge_sort import merge_sort_buffer
+        values = self._row_values(0)
+        if not isinstance(values, (list, array)):
+            # ndarray (built under the numpy backend) or memoryview rows
+            values = array(self.dtype, values.tolist())
+        result = Matrix(0, 0, dtype=self.dtype)
+        result._adopt(merge_sort_buffer(values), 1, self.cols)
         return result
-    
-    def add(self, other):
-        """Element-wise addition; returns a new Matrix.
-        
-        If matrices have different dimensions, the smaller one is padded with zeros.
+
+    # ---- Key-aware sorting (any shape) ----
+    def _set_col(self, col, values):
+        """Overwrite column `col` with `values` (length must equal rows)."""
+        if len(values) != self.rows:
+            raise ValueError("Column length must match number of rows")
+        if self.rows == 0:
+            return
+        data = self._data
+        if not (isinstance(data, list) or backend.is_ndarray(data)):
+            values = array(self.dtype, values)
+        start = self._offset + col * self._cstride
+        data[start:start + (self.rows - 1) * self._rstride + 1:self._rstride] = values
+
+    def _lines(self, axis):
+        """(count, getter, setter) for the rows (axis=1) or columns (axis=0)."""
+        if axis == 1:
+            return self.rows, self._row_values, self._set_row
+        if axis == 0:
+            return self.cols, self.col, self._set_col
+        raise ValueError("axis must be 0 (columns) or 1 (rows)")
+
+    def sort(self, axis=1, key=None, reverse=False, stable=True):
+        """Sort in place along an axis; returns self.
+
+        axis=1 sorts the entries of every row (so a 1xN vector is sorted as a
+        whole), axis=0 sorts every column. The Python path is always stable;
+        stable=False only lets the numpy backend pick a faster unstable sort.
+
+        Args:
+            axis: 1 to sort within rows, 0 to sort within columns
+            key: optional one-argument function applied to entries
+            reverse: sort descending (equal entries keep their order)
+            stable: whether equal entries must keep their relative order
+        Returns:
+            self
+        """
+        count, get, put = self._lines(axis)
+        if key is None and not reverse and backend.uses_numpy(self):
+            sorted_lines = backend.sort_lines(self, axis, stable)
+            for t in range(count):
+                put(t, sorted_lines[t].tolist())
+            return self
+        for t in range(count):
+            line = list(get(t))
+            line.sort(key=key, reverse=reverse)
+            put(t, line)
+        return self
+
+    def argsort(self, axis=1, key=None, reverse=False, stable=True):
+        """Return the indices that would sort each row (axis=1) or column (axis=0).
+
+        Args:
+            axis, key, reverse, stable: as in sort()
+        Returns:
+            new Matrix of the same shape with dtype 'q'; along each line, entry
+            t is the index of the t-th smallest (or largest) entry of that line
+        """
+        count, get, _ = self._lines(axis)
+        result = Matrix(self.rows, self.cols, dtype='q')
+        _, _, put = result._lines(axis)
+        if key is None and not reverse and backend.uses_numpy(self):
+            orders = backend.argsort_lines(self, axis, stable)
+            for t in range(count):
+                put(t, orders[t].tolist())
+            return result
+        for t in range(count):
+            line = get(t)
+            lookup = line.__getitem__ if key is None else (lambda s, line=line: key(line[s]))
+            put(t, sorted(range(len(line)), key=lookup, reverse=reverse))
+        return result
+
+    def sort_rows_by(self, col, key=None, reverse=False):
+        """Reorder whole rows in place by the values in column `col`; returns self.
+
+        The sort is stable, so sorting by one column after another gives a
+        multi-key order. `col` may also be a tuple of columns, compared
+        lexicographically.
+
+        Args:
+            col: column index, or tuple of column indices
+            key: optional function applied to the column value (or value tuple)
+            reverse: sort descending (rows with equal keys keep their order)
+        Returns:
+            self
+        """
+        cols = col if isinstance(col, tuple) else (col,)
+        for c in cols:
+            if not 0 <= c < self.cols:
+                raise IndexError("Index out of bounds")
+        columns = [self.col(c) for c in cols]
+        keys = columns[0] if len(columns) == 1 else list(zip(*columns))
+        lookup = keys.__getitem__ if key is None else (lambda i: key(keys[i]))
+        order = sorted(range(self.rows), key=lookup, reverse=reverse)
+        moved = [self._row_values(i) for i in order]
+        if not isinstance(self._data, (list, array)):
+            moved = [_clone(values) for values in moved]  # rows are views here
+        for i, values in enumerate(moved):
+            self._set_row(i, values)
+        return self
+
+    def _result_dtype(self, other):
+        """Storage dtype for a binary operation result: shared dtype, else generic."""
+        return self.dtype if self.dtype == other.dtype else None
+
+    def _from_kernel(self, values, other):
+        """Wrap a numpy kernel result in the dtype of a binary operation on self
+        and other, raising OverflowError if it does not fit."""
+        dtype = self._result_dtype(other)
+        return Matrix._from_ndarray(backend.fit(values, dtype), dtype)
+
+    def _padded_row(self, row, cols, zero=0):
+        """Row `row` padded with `zero` to `cols` entries (all zeros past the last row)."""
+        if row >= self.rows:
+            return [zero] * cols
+        values = self._plain_row(row)
+        if self.cols == cols:
+            return values
+        return list(values) + [zero] * (cols - self.cols)
+
+    def _elementwise(self, other, op):
+        """New Matrix op(self, other) over the union of both shapes, zero-padded.
+
+        The padding is 0.0 when either operand is float-typed, so padded
+        entries are floats as well, like the promoted numpy result.
         """
         max_rows = max(self.rows, other.rows)
         max_cols = max(self.cols, other.cols)
-        result = Matrix(max_rows, max_cols)
+        result = Matrix(max_rows, max_cols, dtype=self._result_dtype(other))
+        zero = 0.0 if {self.dtype, other.dtype} & {"f", "d"} else 0
         for i in range(max_rows):
-            for j in range(max_cols):
-                val1 = self.get(i, j) if i < self.rows and j < self.cols else 0
-                val2 = other.get(i, j) if i < other.rows and j < other.cols else 0
-                result.set(i, j, val1 + val2)
+            a = self._padded_row(i, max_cols, zero)
+            b = other._padded_row(i, max_cols, zero)
+            result._set_row(i, list(map(op, a, b)))
         return result
+
+    def add(self, other):
+        """Element-wise addition; returns a new Matrix.
+        
+        If matrices have different dimensions, the smaller one is padded with zeros.
+        """
+        if backend.uses_numpy(self, other):
+            return self._from_kernel(backend.elementwise(self, other, subtract=False), other)
+        return self._elementwise(other, add)
     
     def subtract(self, other):
         """Element-wise subtraction; returns a new Matrix.
         
         If matrices have different dimensions, the smaller one is padded with zeros.
         """
-        max_rows = max(self.rows, other.rows)
-        max_cols = max(self.cols, other.cols)
-        result = Matrix(max_rows, max_cols)
-        for i in range(max_rows):
-            for j in range(max_cols):
-                val1 = self.get(i, j) if i < self.rows and j < self.cols else 0
-                val2 = other.get(i, j) if i < other.rows and j < other.cols else 0
-                result.set(i, j, val1 - val2)
-        return result
+        if backend.uses_numpy(self, other):
+            return self._from_kernel(backend.elementwise(self, other, subtract=True), other)
+        return self._elementwise(other, sub)
+
+    def __add__(self, other):
+        """a + b is a.add(b)."""
+        return self.add(other)
+
+    def __sub__(self, other):
+        """a - b is a.subtract(b)."""
+        return self.subtract(other)
+
+    def __iadd__(self, other):
+        """a += b adds in place (same shape required)."""
+        return self.iadd(other)
+
+    def __isub__(self, other):
+        """a -= b subtracts in place (same shape required)."""
+        return self.isub(other)
+
+    # ---- In-place and fused element-wise operations ----
+    @classmethod
+    def linear_combination(cls, terms, out=None):
+        """Evaluate sum(coef * M for coef, M in terms) in one pass.
+
+        Each output row is built from the matching rows of every term and
+        written once, so no intermediate Matrix is created. Coefficients of
+        1 and -1 skip the multiplication.
+
+        Args:
+            terms: non-empty list of (coef, Matrix) pairs, all the same shape
+            out: optional Matrix of that shape to write into; it may be one of
+                the terms (each row is read before it is overwritten)
+        Returns:
+            the result Matrix (`out` itself when given)
+        Raises:
+            TypeError: a non-integer coefficient for an integer-typed result
+        """
+        if not terms:
+            raise ValueError("linear_combination needs at least one term")
+        rows, cols = terms[0][1].rows, terms[0][1].cols
+        for _, m in terms:
+            if m.rows != rows or m.cols != cols:
+                raise ValueError("All terms must have the same shape")
+        if out is None:
+            dtypes = {m.dtype for _, m in terms}
+            out = cls(rows, cols, dtype=dtypes.pop() if len(dtypes) == 1 else None)
+        elif out.rows != rows or out.cols != cols:
+            raise ValueError("out has the wrong shape for this combination")
+        if out.dtype is not None and out.dtype not in "fd":
+            if not all(isinstance(c, Integral) for c, _ in terms):
+                raise TypeError("integer-typed results need integer coefficients")
+        matrices = [m for _, m in terms]
+        if backend.uses_numpy(*matrices):
+            combined = backend.fit(backend.linear_combination(terms), out.dtype)
+            for i in range(rows):
+                out._set_row(i, combined[i].tolist())
+            return out
+        (c0, m0), rest = terms[0], terms[1:]
+        for i in range(rows):
+            acc = m0._plain_row(i)
+            if c0 != 1:
+                acc = [-x for x in acc] if c0 == -1 else [c0 * x for x in acc]
+            for c, m in rest:
+                values = m._plain_row(i)
+                if c == 1:
+                    acc = list(map(add, acc, values))
+                elif c == -1:
+                    acc = list(map(sub, acc, values))
+                else:
+                    acc = [a + c * x for a, x in zip(acc, values)]
+            out._set_row(i, acc)
+        return out
+
+    def iadd(self, other):
+        """self += other in place; returns self."""
+        return Matrix.linear_combination([(1, self), (1, other)], out=self)
+
+    def isub(self, other):
+        """self -= other in place; returns self."""
+        return Matrix.linear_combination([(1, self), (-1, other)], out=self)
+
+    def scale_(self, factor):
+        """self *= factor in place; returns self."""
+        return Matrix.linear_combination([(factor, self)], out=self)
+
+    def axpy(self, alpha, x):
+        """self += alpha * x in place (BLAS axpy); returns self."""
+        return Matrix.linear_combination([(1, self), (alpha, x)], out=self)
     
-    def multiply(self, other):
-        """Matrix multiplication; returns a new Matrix."""
+    def multiply(self, other, out=None, block_size=64, workers=None):
+        """Matrix multiplication; returns a new Matrix (or fills `out`).
+
+        `other` is transposed once so every entry of the product is a single
+        ``sum(map(mul, row, col))`` reduction over two flat sequences, with no
+        per-element bounds checks. The i and j loops are tiled into
+        `block_size` panels so a panel of columns stays hot while it is reused
+        across a band of rows. With `workers` > 1 the rows are split into
+        bands computed by that many processes over shared memory (see
+        data_structures.parallel); both operands must then share a numeric dtype.
+
+        Args:
+            other: right operand, other.rows == self.cols
+            out: optional self.rows x other.cols Matrix to write into; it may
+                be self or other, since operands are read before being overwritten
+            block_size: tile edge for the row and column loops
+            workers: number of worker processes; None or 1 runs in this process
+        Returns:
+            the product Matrix (`out` itself when given)
+        """
         if self.cols != other.rows:
             raise ValueError("Incompatible dimensions for multiplication")
-        result = Matrix(self.rows, other.cols)
-        for i in range(self.rows):
-            for j in range(other.cols):
-                sum_product = 0
-                for k in range(self.cols):
-                    sum_product += self.get(i, k) * other.get(k, j)
-                result.set(i, j, sum_product)
-        return result
+        n, p = self.rows, other.cols
+        if out is not None and (out.rows != n or out.cols != p):
+            raise ValueError("out has the wrong shape for this product")
+        if backend.uses_numpy(self, other):
+            product = backend.matmul(self, other)
+            if out is None:
+                return self._from_kernel(product, other)
+            product = backend.fit(product, out.dtype)
+            for i in range(n):
+                out._set_row(i, product[i].tolist())
+            return out
+        if workers is not None and workers > 1:
+            from data_structures.parallel import parallel_multiply
+            return parallel_multiply(self, other, out, block_size, workers)
+        if out is None:
+            out = Matrix(n, p, dtype=self._result_dtype(other))
+        other_t = other.transpose()
+        columns = [other_t._plain_row(j) for j in range(p)]
+        _multiply_rows(self, columns, out, block_size)
+        return out
     
+    def view(self, row_start, col_start, row_end=None, col_end=None):
+        """Return a zero-copy view of rows [row_start, row_end) x cols [col_start, col_end).
+
+        The view shares this matrix's storage, so writes through either are
+        visible in both. Views can be nested; call copy() for an independent
+        Matrix.
+        """
+        return MatrixView(self, row_start, col_start, row_end, col_end)
+
     def submatrix(self, row_start, col_start, row_end=None, col_end=None):
         """Return a copy of the specified submatrix range."""
-        if row_end == None:
-            row_end = self.rows
-        if col_end == None:
-            col_end = self.cols
-        if row_start < 0 or row_end > self.rows or col_start < 0 or col_end > self.cols:
-            raise IndexError("Submatrix indices out of bounds")
-        sub = Matrix(row_end - row_start, col_end - col_start)
-        for i in range(row_start, row_end):
-            for j in range(col_start, col_end):
-                sub.set(i - row_start, j - col_start, self.get(i, j))
-        return sub
+        return self.view(row_start, col_start, row_end, col_end).copy()
     
     def set_submatrix(self, row_start, row_end, col_start, col_end, sub):
         """Overwrite a region with entries from given submatrix."""
@@ -283,94 +881,224 @@ class Matrix:
             raise IndexError("Submatrix indices out of bounds")
         if (row_end - row_start != sub.rows) or (col_end - col_start != sub.cols):
             raise ValueError("Submatrix dimensions do not match")
-        for i in range(row_start, row_end):
-            for j in range(col_start, col_end):
-                self.set(i, j, sub.get(i - row_start, j - col_start))
+        target = self.view(row_start, col_start, row_end, col_end)
+        for i in range(sub.rows):
+            target._set_row(i, sub._row_values(i))
     
-    def _square_matrix_subtract(self, other):
-        """Strict element-wise subtraction for same-sized square matrices."""
-        result = Matrix(self.rows, self.cols)
-        for i in range(self.rows):
-            for j in range(self.cols):
-                result.set(i, j, self.get(i, j) - other.get(i, j))
-        return result
+    # Strassen's matrix multiplication
+    def strassen_multiply(self, other, leaf_size=STRASSEN_LEAF_SIZE, workers=None):
+        """Strassen-Winograd multiplication; returns a new Matrix.
 
-    def _square_matrix_add(self, other):
-        """Strict element-wise addition for same-sized square matrices."""
-        result = Matrix(self.rows, self.cols)
-        for i in range(self.rows):
-            for j in range(self.cols):
-                result.set(i, j, self.get(i, j) + other.get(i, j))
-        return result
-    
-    def _square_matrix_add(self, other):
-        """Strict element-wise addition for same-sized square matrices."""
-        result = Matrix(self.rows, self.cols)
-        for i in range(self.rows):
-            for j in range(self.cols):
-                result.set(i, j, self.get(i, j) + other.get(i, j))
-        return result
+        Uses Winograd's variant (7 products, 15 additions per level) and hands
+        blocks whose smallest side is at most `leaf_size` to the classical
+        multiply() kernel. Odd dimensions are handled by dynamic peeling: the
+        even part recurses and the leftover row, column and rank-1 term are
+        fixed up classically, so any rectangular shape works. All intermediate
+        sums live in one workspace buffer allocated up front and carved into
+        per-level windows, so no Matrix is allocated inside the recursion.
+        The S/T differences go negative and can outgrow narrow types, so
+        typed operands are computed in a signed 64-bit or double work dtype
+        (see _strassen_dtype) and converted back at the end; like multiply(),
+        this raises OverflowError only if the product itself does not fit.
+        With `workers` > 1 the seven top-level products run in separate
+        processes over shared memory, which needs a shared numeric dtype.
 
-    def _square_matrix_subtract(self, other):
-        """Strict element-wise subtraction for same-sized square matrices."""
-        result = Matrix(self.rows, self.cols)
-        for i in range(self.rows):
-            for j in range(self.cols):
-                result.set(i, j, self.get(i, j) - other.get(i, j))
-        return result
+        Args:
+            other: right operand, other.rows == self.cols
+            leaf_size: recursion cutoff; at or below it the classical kernel runs
+            workers: number of worker processes; None or 1 runs in this process
+        Returns:
+            new self.rows x other.cols Matrix
+        """
+        if self.cols != other.rows:
+            raise ValueError("Incompatible dimensions for multiplication")
+        if leaf_size < 1:
+            raise ValueError("leaf_size must be positive")
+        if backend.uses_numpy(self, other):
+            return self._from_kernel(backend.matmul(self, other), other)
+        if workers is not None and workers > 1:
+            from data_structures.parallel import parallel_strassen
+            return parallel_strassen(self, other, leaf_size, workers)
+        dtype = self._result_dtype(other)
+        work = _strassen_dtype(dtype)
+        result = Matrix(self.rows, other.cols, dtype=work)
+        size = _strassen_workspace(self.rows, self.cols, other.cols, leaf_size)
+        workspace = Matrix(1, size, dtype=work)
+        _strassen_into(self, other, result, workspace._data, 0, leaf_size)
+        return _cast(result, dtype)
 
-    # Strassen's matrix multiplication
-    def strassen_multiply(self, other):
-        """Strassen's multiplication for square matrices of size 2^n; returns new Matrix."""
-        if self.rows != self.cols or other.rows != other.cols or self.rows != other.rows:
-            raise ValueError("Strassen's algorithm requires square matrices of the same size")
-
-        n = self.rows
-        if n == 0:
-            return Matrix(0, 0)
-
-        # Check if size is a power of two
-        if (n & (n - 1)) != 0:
-            raise ValueError("Strassen's algorithm requires matrix dimensions to be powers of two")
-
-        # Base case
-        if n == 1:
-            res = Matrix(1, 1)
-            res.set(0, 0, self.get(0, 0) * other.get(0, 0))
-            return res
-
-        mid = n // 2
-        A11 = self.submatrix(0, 0, mid, mid)
-        A12 = self.submatrix(0, mid, mid, n)
-        A21 = self.submatrix(mid, 0, n, mid)
-        A22 = self.submatrix(mid, mid, n, n)
-
-        B11 = other.submatrix(0, 0, mid, mid)
-        B12 = other.submatrix(0, mid, mid, n)
-        B21 = other.submatrix(mid, 0, n, mid)
-        B22 = other.submatrix(mid, mid, n, n)
-
-        # Recursive calls on subproblems
-        P = (A11.add(A22)).strassen_multiply(B11.add(B22))
-        Q = (A21.add(A22)).strassen_multiply(B11)
-        R = A11.strassen_multiply(B12.subtract(B22))
-        S = A22.strassen_multiply(B21.subtract(B11))
-        T = (A11.add(A12)).strassen_multiply(B22)
-        U = (A21.subtract(A11)).strassen_multiply(B11.add(B12))
-        V = (A12.subtract(A22)).strassen_multiply(B21.add(B22))
-
-        # Combine results
-        C11 = P.add(S).subtract(T).add(V)
-        C12 = R.add(T)
-        C21 = Q.add(S)
-        C22 = P.subtract(Q).add(R).add(U)
-
-        result = Matrix(n, n)
-        result.set_submatrix(0, mid, 0, mid, C11)
-        result.set_submatrix(0, mid, mid, n, C12)
-        result.set_submatrix(mid, n, 0, mid, C21)
-        result.set_submatrix(mid, n, mid, n, C22)
 
-        return result
+class MatrixView(Matrix):
+    """Zero-copy window onto another matrix's storage.
+
+    Shares the parent's buffer through an offset and the parent's strides, so
+    creating a view is O(1) regardless of its size. Reads and writes go
+    straight to the parent; views of views address the same buffer. A view
+    cannot change shape, and it stays attached to the buffer the parent had
+    when the view was taken (resizing the parent may reallocate it).
+
+    Attributes:
+        base: the matrix that owns the shared storage
+    """
+
+    def __init__(self, parent, row_start, col_start, row_end=None, col_end=None):
+        if row_end is None:
+            row_end = parent.rows
+        if col_end is None:
+            col_end = parent.cols
+        if (row_start < 0 or row_end > parent.rows or col_start < 0 or col_end > parent.cols
+                or row_start > row_end or col_start > col_end):
+            raise IndexError("Submatrix indices out of bounds")
+        self.rows = row_end - row_start
+        self.cols = col_end - col_start
+        self.dtype = parent.dtype
+        self.base = parent.base if isinstance(parent, MatrixView) else parent
+        self._data = parent._data
+        self._offset = parent._offset + row_start * parent._rstride + col_start * parent._cstride
+        self._rstride = parent._rstride
+        self._cstride = parent._cstride
+
+    def _is_compact(self):
+        return False
+
+    def _resize_error(self, *args, **kwargs):
+        raise ValueError("Cannot resize a matrix view; copy() it first")
+
+    add_row = add_column = merge_rows = merge_columns = _resize_error
+
+    @property
+    def data(self):
+        """Rows of the view as writable row handles."""
+        return _RowsProxy(self)
+
+    @data.setter
+    def data(self, rows):
+        self._resize_error()
+
+
+def _window(data, dtype, offset, rows, cols, rstride=None):
+    """Wrap rows x cols entries of a flat buffer, starting at offset, as a view."""
+    w = MatrixView.__new__(MatrixView)
+    w.rows, w.cols, w.dtype, w.base = rows, cols, dtype, None
+    w._data, w._offset, w._cstride = data, offset, 1
+    w._rstride = cols if rstride is None else rstride
+    return w
+
+
+def _multiply_rows(A, columns, out, block_size):
+    """out = A * B, where columns[j] holds column j of B (the Matrix.multiply kernel)."""
+    n = A.rows
+    for ii in range(0, n, block_size):
+        band = [A._plain_row(i) for i in range(ii, min(ii + block_size, n))]
+        results = [[] for _ in band]
+        for jj in range(0, len(columns), block_size):
+            panel = columns[jj:jj + block_size]
+            for row, acc in zip(band, results):
+                acc.extend([sum(map(mul, row, col)) for col in panel])
+        for i, acc in enumerate(results):
+            out._set_row(ii + i, acc)
+
+
+def _strassen_dtype(dtype):
+    """Signed work dtype for Strassen intermediates: 'd' for floats, 'q' for
+    integers up to 32 bits and 'q' itself, and Python ints (None) for the
+    remaining 64-bit types, whose differences may not fit in 'q'."""
+    if dtype is None or dtype in "dq":
+        return dtype
+    if dtype == "f":
+        return "d"
+    if array(dtype).itemsize < 8:
+        return "q"
+    return None
+
+
+def _cast(m, dtype):
+    """m converted to dtype (m itself if it already has it); raises OverflowError
+    like any typed write when an entry does not fit."""
+    if m.dtype == dtype:
+        return m
+    out = Matrix(m.rows, m.cols, dtype=dtype)
+    for i in range(m.rows):
+        out._set_row(i, m._row_values(i))
+    return out
+
+
+def _strassen_workspace(m, k, n, leaf_size):
+    """Number of scratch entries _strassen_into needs for an m x k by k x n product."""
+    size = 0
+    while min(m, k, n) > leaf_size:
+        m, k, n = m // 2, k // 2, n // 2
+        size += m * max(k, n) + k * n
+    return size
+
+
+def _combine(dst, x, y, op):
+    """dst = op(x, y) element-wise, row by row; dst may alias x or y."""
+    for i in range(dst.rows):
+        dst._set_row(i, list(map(op, x._row_values(i), y._row_values(i))))
+
+
+def _strassen_into(A, B, C, arena, top, leaf_size):
+    """Write A*B into C using Strassen-Winograd; scratch comes from arena[top:]."""
+    m, k, n = A.rows, A.cols, B.cols
+    if min(m, k, n) <= leaf_size:
+        A.multiply(B, out=C)
+        return
+    h, kh, nh = m // 2, k // 2, n // 2
+    m2, k2, n2 = 2 * h, 2 * kh, 2 * nh
+
+    A11, A12 = A.view(0, 0, h, kh), A.view(0, kh, h, k2)
+    A21, A22 = A.view(h, 0, m2, kh), A.view(h, kh, m2, k2)
+    B11, B12 = B.view(0, 0, kh, nh), B.view(0, nh, kh, n2)
+    B21, B22 = B.view(kh, 0, k2, nh), B.view(kh, nh, k2, n2)
+    C11, C12 = C.view(0, 0, h, nh), C.view(0, nh, h, n2)
+    C21, C22 = C.view(h, 0, m2, nh), C.view(h, nh, m2, n2)
+
+    # X holds the A-side sums and later P1; Y holds the B-side sums.
+    x_size = h * max(kh, nh)
+    X = _window(arena, C.dtype, top, h, kh)
+    P1 = _window(arena, C.dtype, top, h, nh)
+    Y = _window(arena, C.dtype, top + x_size, kh, nh)
+    top += x_size + kh * nh
+
+    # Schedule from Boyer, Dumas, Pernet & Zhou (2009): two temporaries per level.
+    _combine(X, A11, A21, sub)                       # S3
+    _combine(Y, B22, B12, sub)                       # T3
+    _strassen_into(X, Y, C21, arena, top, leaf_size)  # P7
+    _combine(X, A21, A22, add)                       # S1
+    _combine(Y, B12, B11, sub)                       # T1
+    _strassen_into(X, Y, C22, arena, top, leaf_size)  # P5
+    _combine(X, X, A11, sub)                         # S2
+    _combine(Y, B22, Y, sub)                         # T2
+    _strassen_into(X, Y, C12, arena, top, leaf_size)  # P6
+    _combine(X, A12, X, sub)                         # S4
+    _strassen_into(X, B22, C11, arena, top, leaf_size)  # P3
+    _strassen_into(A11, B11, P1, arena, top, leaf_size)  # P1
+    _combine(C12, P1, C12, add)                      # U2 = P1 + P6
+    _combine(C21, C12, C21, add)                     # U3 = U2 + P7
+    _combine(C12, C12, C22, add)                     # U4 = U2 + P5
+    _combine(C22, C21, C22, add)                     # U7 = U3 + P5
+    _combine(C12, C12, C11, add)                     # U5 = U4 + P3
+    _combine(Y, Y, B21, sub)                         # T4
+    _strassen_into(A22, Y, C11, arena, top, leaf_size)  # P4
+    _combine(C21, C21, C11, sub)                     # U6 = U3 - P4
+    _strassen_into(A12, B21, C11, arena, top, leaf_size)  # P2
+    _combine(C11, P1, C11, add)                      # U1 = P1 + P2
+
+    _peel(A, B, C, m2, k2, n2)
 
 
+def _peel(A, B, C, m2, k2, n2):
+    """Dynamic peeling: add the parts of A*B left out of the even m2 x k2 x n2 product."""
+    m, k, n = A.rows, A.cols, B.cols
+    if k2 < k:
+        b_last = B._row_values(k - 1)[:n2]
+        for i in range(m2):
+            a = A.get(i, k - 1)
+            if a:
+                row = C.view(i, 0, i + 1, n2)
+                row._set_row(0, list(map(add, row._row_values(0), [a * b for b in b_last])))
+    if n2 < n:
+        A.multiply(B.view(0, n2, k, n), out=C.view(0, n2, m, n))
+    if m2 < m:
+        A.view(m2, 0, m, k).multiply(B.view(0, 0, k, n2), out=C.view(m2, 0, m, n2))
@@ -0,0 +1,228 @@
+"""Process-pool execution for Matrix products.
+
+Matrix.multiply(..., workers=N) and Matrix.strassen_multiply(..., workers=N)
+delegate here. The operands are copied once into a single
+multiprocessing.shared_memory block, and every worker attaches to it by
+name, so each task pickles only a few small region descriptors. Workers
+write their part of the product straight to its final place in the shared
+block. The parent then copies the finished product out once.
+
+Only typed numeric matrices can be shared. Both operands must have the same
+dtype, one of 'bBhHiIlLqQfd'. Starting a pool costs tens of milliseconds,
+so parallel mode only pays off for products of a few hundred rows or more.
+
+The shared-block helpers (create_block, attach_block, release_block) are
+also used by the parallel sort in algorithms.divide_conquer.merge_sort.
+"""
+
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from operator import add, sub
+
+from data_structures.matrix import (
+    _FILE_DTYPES, Matrix, _cast, _combine, _multiply_rows, _peel, _strassen_dtype,
+    _strassen_into, _strassen_workspace, _window,
+)
+
+
+SHAREABLE_DTYPES = _FILE_DTYPES  # fixed-size numeric items, as in Matrix files
+
+
+def _shared_dtype(A, B):
+    """Return the dtype both operands share, or raise if they cannot be shared."""
+    if A.dtype != B.dtype or A.dtype is None or A.dtype not in SHAREABLE_DTYPES:
+        raise ValueError(
+            f"workers= needs both operands typed with the same dtype from {SHAREABLE_DTYPES!r}")
+    return A.dtype
+
+
+def _layout(shapes):
+    """Place (rows, cols) regions back to back; return their descriptors and total size.
+
+    A descriptor is (offset, rows, cols, row_stride) into the flat block.
+    """
+    regions, top = [], 0
+    for rows, cols in shapes:
+        regions.append((top, rows, cols, cols))
+        top += rows * cols
+    return regions, top
+
+
+def _block(region, row, col, rows, cols):
+    """Descriptor of the rows x cols sub-block of `region` starting at (row, col)."""
+    offset, _, _, stride = region
+    return (offset + row * stride + col, rows, cols, stride)
+
+
+def create_block(dtype, size):
+    """Allocate a shared block of `size` items; return (shm, typed memoryview)."""
+    nbytes = size * array(dtype).itemsize
+    shm = shared_memory.SharedMemory(create=True, size=max(1, nbytes))
+    return shm, shm.buf[:nbytes].cast(dtype)
+
+
+def attach_block(name, dtype, size):
+    """Attach to an existing shared block; return (shm, typed memoryview)."""
+    shm = shared_memory.SharedMemory(name=name)
+    return shm, shm.buf[:size * array(dtype).itemsize].cast(dtype)
+
+
+def release_block(shm, buf, unlink=False):
+    """Drop the typed view and detach; the owner also unlinks the block."""
+    buf.release()
+    shm.close()
+    if unlink:
+        shm.unlink()
+
+
+def _store(buf, dtype, region, matrix):
+    """Copy `matrix` into `region` of the shared block."""
+    window = _window(buf, dtype, *region)
+    for i in range(matrix.rows):
+        window._set_row(i, matrix._row_values(i))
+
+
+def _run(pool, fn, jobs):
+    """Submit fn(*job) for every job and wait, re-raising the first failure."""
+    for future in [pool.submit(fn, *job) for job in jobs]:
+        future.result()
+
+
+# ---- Worker tasks (module level so they can be pickled by reference) ----
+def _multiply_band(name, dtype, size, a, bt, c, start, stop, block_size):
+    """Worker: rows [start, stop) of C = A * B, with B shared transposed."""
+    shm, buf = attach_block(name, dtype, size)
+    try:
+        _multiply_band_into(buf, dtype, a, bt, c, start, stop, block_size)
+    finally:
+        release_block(shm, buf)
+
+
+def _multiply_band_into(buf, dtype, a, bt, c, start, stop, block_size):
+    band_a = _window(buf, dtype, *_block(a, start, 0, stop - start, a[2]))
+    band_c = _window(buf, dtype, *_block(c, start, 0, stop - start, c[2]))
+    Bt = _window(buf, dtype, *bt)
+    columns = [Bt._row_values(j) for j in range(Bt.rows)]
+    _multiply_rows(band_a, columns, band_c, block_size)
+
+
+def _strassen_product(name, dtype, size, left, right, out, leaf_size):
+    """Worker: out = left * right with the serial Strassen-Winograd recursion."""
+    shm, buf = attach_block(name, dtype, size)
+    try:
+        _strassen_product_into(buf, dtype, left, right, out, leaf_size)
+    finally:
+        release_block(shm, buf)
+
+
+def _strassen_product_into(buf, dtype, left, right, out, leaf_size):
+    L, R, C = (_window(buf, dtype, *region) for region in (left, right, out))
+    workspace = Matrix(1, _strassen_workspace(L.rows, L.cols, R.cols, leaf_size), dtype=dtype)
+    _strassen_into(L, R, C, workspace._data, 0, leaf_size)
+
+
+# ---- Entry points ----
+def parallel_multiply(A, B, out, block_size, workers):
+    """Classical A * B with row bands spread over `workers` processes.
+
+    Returns:
+        the product Matrix (`out` itself when given)
+    """
+    dtype = _shared_dtype(A, B)
+    m, k, n = A.rows, A.cols, B.cols
+    (a, bt, c), size = _layout([(m, k), (n, k), (m, n)])
+    shm, buf = create_block(dtype, size)
+    try:
+        _store(buf, dtype, a, A)
+        _store(buf, dtype, bt, B.transpose())
+        step = max(1, -(-m // workers))
+        jobs = [(shm.name, dtype, size, a, bt, c, start, min(start + step, m), block_size)
+                for start in range(0, m, step)]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            _run(pool, _multiply_band, jobs)
+        if out is None:
+            out = Matrix.from_buffer(buf[c[0]:c[0] + m * n], m, n, dtype)
+        else:
+            product = _window(buf, dtype, *c)
+            for i in range(m):
+                out._set_row(i, product._row_values(i))
+            del product
+    finally:
+        release_block(shm, buf, unlink=True)
+    return out
+
+
+def parallel_strassen(A, B, leaf_size, workers):
+    """Strassen-Winograd A * B with the seven top-level products run in parallel.
+
+    The parent forms the eight operand sums S1-S4 and T1-T4 in shared memory.
+    Each worker computes one product with the serial recursion. The parent
+    then combines the products into the result and peels odd dimensions.
+    Below the top level the work is serial, so at most 7 workers are busy.
+    The shared block holds the signed work dtype of the serial version (see
+    _strassen_dtype), so negative differences of unsigned operands fit. The
+    64-bit types that have no such dtype are multiplied serially.
+
+    Returns:
+        new A.rows x B.cols Matrix
+    """
+    dtype = _strassen_dtype(_shared_dtype(A, B))
+    m, k, n = A.rows, A.cols, B.cols
+    if dtype is None or min(m, k, n) <= leaf_size:
+        return A.strassen_multiply(B, leaf_size)
+    h, kh, nh = m // 2, k // 2, n // 2
+    regions, size = _layout([(m, k), (k, n)] + [(h, kh)] * 4 + [(kh, nh)] * 4 + [(h, nh)] * 7)
+    a, b, S, T, P = regions[0], regions[1], regions[2:6], regions[6:10], regions[10:]
+    A11, A12 = _block(a, 0, 0, h, kh), _block(a, 0, kh, h, kh)
+    A21, A22 = _block(a, h, 0, h, kh), _block(a, h, kh, h, kh)
+    B11, B12 = _block(b, 0, 0, kh, nh), _block(b, 0, nh, kh, nh)
+    B21, B22 = _block(b, kh, 0, kh, nh), _block(b, kh, nh, kh, nh)
+    products = [(A11, B11), (A12, B21), (S[3], B22), (A22, T[3]),
+                (S[0], T[0]), (S[1], T[1]), (S[2], T[2])]
+
+    result = Matrix(m, n, dtype=dtype)
+    shm, buf = create_block(dtype, size)
+    try:
+        _store(buf, dtype, a, A)
+        _store(buf, dtype, b, B)
+        _winograd_sums(buf, dtype, (A11, A12, A21, A22), (B11, B12, B21, B22), S, T)
+        jobs = [(shm.name, dtype, size, left, right, out, leaf_size)
+                for (left, right), out in zip(products, P)]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            _run(pool, _strassen_product, jobs)
+        _winograd_combine(buf, dtype, P, result, h, nh)
+    finally:
+        release_block(shm, buf, unlink=True)
+    _peel(A, B, result, 2 * h, 2 * kh, 2 * nh)
+    return _cast(result, A.dtype)
+
+
+def _winograd_sums(buf, dtype, a_blocks, b_blocks, S, T):
+    """Fill S1-S4 from the A quadrants and T1-T4 from the B quadrants."""
+    A11, A12, A21, A22 = (_window(buf, dtype, *r) for r in a_blocks)
+    B11, B12, B21, B22 = (_window(buf, dtype, *r) for r in b_blocks)
+    S1, S2, S3, S4 = (_window(buf, dtype, *r) for r in S)
+    T1, T2, T3, T4 = (_window(buf, dtype, *r) for r in T)
+    _combine(S1, A21, A22, add)
+    _combine(S2, S1, A11, sub)
+    _combine(S3, A11, A21, sub)
+    _combine(S4, A12, S2, sub)
+    _combine(T1, B12, B11, sub)
+    _combine(T2, B22, T1, sub)
+    _combine(T3, B22, B12, sub)
+    _combine(T4, T2, B21, sub)
+
+
+def _winograd_combine(buf, dtype, P, C, h, nh):
+    """Write the Winograd combination of products P1-P7 into C's quadrants."""
+    P1, P2, P3, P4, P5, P6, P7 = (_window(buf, dtype, *r) for r in P)
+    C11, C12 = C.view(0, 0, h, nh), C.view(0, nh, h, 2 * nh)
+    C21, C22 = C.view(h, 0, 2 * h, nh), C.view(h, nh, 2 * h, 2 * nh)
+    _combine(C12, P1, P6, add)    # U2 = P1 + P6
+    _combine(C21, C12, P7, add)   # U3 = U2 + P7
+    _combine(C22, C21, P5, add)   # U7 = U3 + P5
+    _combine(C12, C12, P5, add)   # U4 = U2 + P5
+    _combine(C12, C12, P3, add)   # U5 = U4 + P3
+    _combine(C21, C21, P4, sub)   # U6 = U3 - P4
+    _combine(C11, P1, P2, add)    # U1 = P1 + P2
@@ -33,10 +33,9 @@ class Queue:
 
     def _grow(self):
         new_capacity = max(2 * self._data.cols, 1)
-        new_data = Matrix(1, new_capacity)
-        for i in range(self._size):
-            new_data.set(0, i, self._data.get(0, (self._head + i) % self._data.cols))
-        self._data = new_data
+        items = self._data.row(0)
+        ordered = (items[self._head:] + items[:self._head])[:self._size]
+        self._data = Matrix.vector(ordered + [0] * (new_capacity - self._size))
         self._head = 0
         self._tail = self._size
 
@@ -62,3 +61,24 @@ class Queue:
         return item
 
 
+class Deque(Queue):
+    """Double-ended queue on the same circular buffer.
+
+    Adds to Queue
+    - peek_back(): view tail without removing
+    - pop_back(): remove from tail
+    """
+
+    def peek_back(self):
+        if self._size == 0:
+            raise QueueEmptyError("Queue is empty")
+        return self._data.get(0, (self._tail - 1) % self._data.cols)
+
+    def pop_back(self):
+        if self._size == 0:
+            raise QueueEmptyError("Queue is empty")
+        self._tail = (self._tail - 1) % self._data.cols
+        item = self._data.get(0, self._tail)
+        self._data.set(0, self._tail, None)
+        self._size -= 1
+        return item
@@ -0,0 +1,190 @@
+"""Prebuilt range-query indexes over Matrix vectors.
+
+- SparseTable: O(n log n) build, O(1) min or max over any [l, r].
+- SegmentTree: O(n) build, O(log n) sum, min or max over [l, r] and
+  O(log n) point updates.
+- FenwickTree: O(n) build, O(log n) prefix and range sums with point
+  updates, in a single array of n + 1 items.
+
+Ranges are inclusive, as in min_max(l, r, matrix). Tables are array.array
+buffers when the vector is typed and Python lists otherwise. An index is a
+snapshot: later writes to the vector are not seen. Use update() on the
+trees instead.
+"""
+
+from array import array
+from operator import add
+
+from data_structures.matrix import INTEGER_DTYPES, Matrix
+
+
+OPERATIONS = {"sum": add, "min": min, "max": max}
+
+
+def _vector_values(v):
+    if not isinstance(v, Matrix) or v.rows != 1:
+        raise ValueError("Range queries need a 1xN Matrix vector")
+    if v.cols == 0:
+        raise ValueError("Range queries need a non-empty vector")
+    return v.row(0)
+
+
+def _buffer(dtype, values):
+    """Typed array for typed vectors, list otherwise."""
+    return array(dtype, values) if dtype is not None else list(values)
+
+
+def _sum_dtype(dtype):
+    """Accumulator dtype for sums, so small integer types cannot overflow.
+
+    64-bit integer types ('q', 'Q' and 'l', 'L' on LP64) have no wider
+    array type, so their sums are Python ints.
+    """
+    if dtype is None:
+        return None
+    if dtype not in INTEGER_DTYPES:
+        return "d"
+    return "q" if array(dtype).itemsize < 8 else None
+
+
+class SparseTable:
+    """Idempotent range min or max in O(1) after an O(n log n) build.
+
+    Level k holds op over every window of 2**k items. A query covers [l, r]
+    with the two (possibly overlapping) windows of the largest power of two
+    that fits.
+    """
+
+    def __init__(self, v: Matrix, op: str = "min"):
+        if op not in ("min", "max"):
+            raise ValueError("SparseTable supports op='min' or op='max'")
+        values = _vector_values(v)
+        self.op = op
+        self._op = OPERATIONS[op]
+        self._n = len(values)
+        self._levels = [_buffer(v.dtype, values)]
+        width = 1
+        while 2 * width <= self._n:
+            prev = self._levels[-1]
+            count = self._n - 2 * width + 1
+            self._levels.append(_buffer(v.dtype, map(self._op, prev[:count], prev[width:width + count])))
+            width *= 2
+
+    def __len__(self):
+        return self._n
+
+    def query(self, l: int, r: int):
+        """op over entries l..r (inclusive)."""
+        if not 0 <= l <= r < self._n:
+            raise IndexError("Range out of bounds")
+        k = (r - l + 1).bit_length() - 1
+        level = self._levels[k]
+        return self._op(level[l], level[r - (1 << k) + 1])
+
+
+class SegmentTree:
+    """Bottom-up segment tree for sum, min or max with point updates.
+
+    Leaves live at tree[n:2n] and node i combines nodes 2i and 2i+1, so the
+    whole tree is one buffer of 2n items without pointers or padding.
+    """
+
+    def __init__(self, v: Matrix, op: str = "sum"):
+        if op not in OPERATIONS:
+            raise ValueError(f"op must be one of {sorted(OPERATIONS)}")
+        values = _vector_values(v)
+        self.op = op
+        self._op = OPERATIONS[op]
+        n = self._n = len(values)
+        dtype = _sum_dtype(v.dtype) if op == "sum" else v.dtype
+        tree = self._tree = _buffer(dtype, values[:1] * n + values)
+        for i in range(n - 1, 0, -1):
+            tree[i] = self._op(tree[2 * i], tree[2 * i + 1])
+
+    def __len__(self):
+        return self._n
+
+    def __getitem__(self, i: int):
+        if not 0 <= i < self._n:
+            raise IndexError("Index out of bounds")
+        return self._tree[self._n + i]
+
+    def update(self, i: int, value) -> None:
+        """Set entry i to value and refresh its ancestors."""
+        if not 0 <= i < self._n:
+            raise IndexError("Index out of bounds")
+        tree, op = self._tree, self._op
+        i += self._n
+        tree[i] = value
+        while i > 1:
+            i //= 2
+            tree[i] = op(tree[2 * i], tree[2 * i + 1])
+
+    def query(self, l: int, r: int):
+        """op over entries l..r (inclusive)."""
+        if not 0 <= l <= r < self._n:
+            raise IndexError("Range out of bounds")
+        tree, op = self._tree, self._op
+        lo, hi = l + self._n, r + self._n + 1
+        result = None
+        while lo < hi:
+            if lo & 1:
+                result = tree[lo] if result is None else op(result, tree[lo])
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                result = tree[hi] if result is None else op(result, tree[hi])
+            lo //= 2
+            hi //= 2
+        return result
+
+
+class FenwickTree:
+    """Binary indexed tree for prefix and range sums with point updates.
+
+    tree[i] (1-based) holds the sum of the i & -i entries ending at entry
+    i - 1, so both prefix sums and updates touch O(log n) slots.
+    """
+
+    def __init__(self, v: Matrix):
+        values = _vector_values(v)
+        n = self._n = len(values)
+        tree = self._tree = _buffer(_sum_dtype(v.dtype), [0] + values)
+        for i in range(1, n + 1):
+            parent = i + (i & -i)
+            if parent <= n:
+                tree[parent] += tree[i]
+
+    def __len__(self):
+        return self._n
+
+    def add(self, i: int, delta) -> None:
+        """Add delta to entry i."""
+        if not 0 <= i < self._n:
+            raise IndexError("Index out of bounds")
+        tree, n = self._tree, self._n
+        i += 1
+        while i <= n:
+            tree[i] += delta
+            i += i & -i
+
+    def update(self, i: int, value) -> None:
+        """Set entry i to value."""
+        self.add(i, value - self.range_sum(i, i))
+
+    def prefix_sum(self, i: int):
+        """Sum of entries 0..i (inclusive); 0 for i = -1."""
+        if not -1 <= i < self._n:
+            raise IndexError("Index out of bounds")
+        tree, total = self._tree, 0
+        i += 1
+        while i > 0:
+            total += tree[i]
+            i -= i & -i
+        return total
+
+    def range_sum(self, l: int, r: int):
+        """Sum of entries l..r (inclusive)."""
+        if not 0 <= l <= r < self._n:
+            raise IndexError("Range out of bounds")
+        return self.prefix_sum(r) - self.prefix_sum(l - 1)
@@ -0,0 +1,233 @@
+"""Sparse matrix with COO and CSR layouts.
+
+SparseMatrix stores only the entries that differ from a background value
+(`default_value`, 0 by default; graph adjacency uses the infinity sentinel).
+Two layouts are supported:
+
+- 'coo' keeps parallel row/column/value lists and is cheap to append to, so
+  it is the layout for building a matrix entry by entry.
+- 'csr' keeps, per row, a slice of column indices sorted ascending plus the
+  matching values, addressed through a row pointer array. Lookups are a
+  binary search inside one row and row iteration touches only that row's
+  entries, so it is the layout for querying and multiplying.
+
+Both expose the same get/set/len surface as Matrix. to_dense() and
+from_dense() convert between the two types.
+"""
+
+from array import array
+from bisect import bisect_left
+from itertools import repeat
+from operator import add, mul
+
+from data_structures.matrix import Matrix
+
+
+class SparseMatrix:
+    """rows x cols sparse matrix in COO or CSR layout.
+
+    Attributes:
+        rows, cols: shape
+        default_value: value of every entry that is not stored
+        dtype: None for generic values or an array typecode for typed values
+        format: 'coo' or 'csr'
+    """
+
+    def __init__(self, rows, cols, default_value=0, dtype=None, format="coo"):
+        if format not in ("coo", "csr"):
+            raise ValueError("format must be 'coo' or 'csr'")
+        self.rows = rows
+        self.cols = cols
+        self.default_value = default_value
+        self.dtype = dtype
+        self.format = format
+        self._values = [] if dtype is None else array(dtype)
+        if format == "coo":
+            self._row_idx = array('q')
+            self._col_idx = array('q')
+        else:
+            self._indptr = array('q', [0]) * (rows + 1)
+            self._indices = array('q')
+
+    @property
+    def nnz(self):
+        """Number of stored entries (COO may still hold overwritten duplicates)."""
+        return len(self._values)
+
+    def len(self):
+        """Return length for vectors or (rows, cols) for matrices."""
+        if self.rows == 1:
+            return self.cols
+        return (self.rows, self.cols)
+
+    def is_empty(self):
+        """Return True if matrix has zero rows or zero cols."""
+        return self.rows == 0 or self.cols == 0
+
+    def __bool__(self):
+        """Truthiness: empty matrices are False, others True."""
+        return not self.is_empty()
+
+    def _check(self, row, col):
+        if not (0 <= row < self.rows and 0 <= col < self.cols):
+            raise IndexError("Index out of bounds")
+
+    def get(self, row, col):
+        """Get value at (row, col). O(log k) in CSR, O(nnz) in COO."""
+        self._check(row, col)
+        if self.format == "csr":
+            lo, hi = self._indptr[row], self._indptr[row + 1]
+            pos = bisect_left(self._indices, col, lo, hi)
+            if pos < hi and self._indices[pos] == col:
+                return self._values[pos]
+            return self.default_value
+        # Scan backwards so the latest write to a cell wins.
+        rows, cols = self._row_idx, self._col_idx
+        for t in range(len(rows) - 1, -1, -1):
+            if rows[t] == row and cols[t] == col:
+                return self._values[t]
+        return self.default_value
+
+    def set(self, row, col, value):
+        """Set value at (row, col).
+
+        COO appends in O(1). CSR updates a stored entry in place and inserts a
+        new one in O(nnz + rows); build in COO and call to_csr() for bulk loads.
+        """
+        self._check(row, col)
+        if self.format == "coo":
+            self._row_idx.append(row)
+            self._col_idx.append(col)
+            self._values.append(value)
+            return
+        lo, hi = self._indptr[row], self._indptr[row + 1]
+        pos = bisect_left(self._indices, col, lo, hi)
+        if pos < hi and self._indices[pos] == col:
+            self._values[pos] = value
+            return
+        self._indices.insert(pos, col)
+        self._values.insert(pos, value)
+        for r in range(row + 1, self.rows + 1):
+            self._indptr[r] += 1
+
+    def __getitem__(self, key):
+        """m[i, j] reads one entry."""
+        return self.get(*key)
+
+    def __setitem__(self, key, value):
+        """m[i, j] = x writes one entry."""
+        self.set(key[0], key[1], value)
+
+    # ---- Layout conversion ----
+    def to_csr(self):
+        """Return this matrix in CSR layout (self if it already is)."""
+        if self.format == "csr":
+            return self
+        csr = SparseMatrix(self.rows, self.cols, self.default_value, self.dtype, "csr")
+        rows, cols, values = self._row_idx, self._col_idx, self._values
+        width = self.cols
+        # Stable sort by (row, col); among duplicates the last write comes last.
+        order = sorted(range(len(values)), key=lambda t: rows[t] * width + cols[t])
+        counts = csr._indptr
+        last_key = -1
+        for t in order:
+            key = rows[t] * width + cols[t]
+            if key == last_key:
+                csr._values[-1] = values[t]
+                continue
+            last_key = key
+            csr._indices.append(cols[t])
+            csr._values.append(values[t])
+            counts[rows[t] + 1] += 1
+        for r in range(self.rows):
+            counts[r + 1] += counts[r]
+        return csr
+
+    def to_coo(self):
+        """Return this matrix in COO layout (self if it already is)."""
+        if self.format == "coo":
+            return self
+        coo = SparseMatrix(self.rows, self.cols, self.default_value, self.dtype, "coo")
+        for r in range(self.rows):
+            lo, hi = self._indptr[r], self._indptr[r + 1]
+            coo._row_idx.extend(repeat(r, hi - lo))
+        coo._col_idx = self._indices[:]
+        coo._values = self._values[:]
+        return coo
+
+    @classmethod
+    def from_dense(cls, matrix: Matrix, default_value=0, format="csr"):
+        """Build a sparse matrix holding every entry of `matrix` != default_value."""
+        sparse = cls(matrix.rows, matrix.cols, default_value, matrix.dtype, "csr")
+        indptr = sparse._indptr
+        for i in range(matrix.rows):
+            for j, value in enumerate(matrix.row(i)):
+                if value != default_value:
+                    sparse._indices.append(j)
+                    sparse._values.append(value)
+            indptr[i + 1] = len(sparse._values)
+        return sparse if format == "csr" else sparse.to_coo()
+
+    def to_dense(self) -> Matrix:
+        """Return a dense Matrix with the background value in unstored cells."""
+        dense = Matrix(self.rows, self.cols, self.default_value, dtype=self.dtype)
+        for i, j, value in self.items():
+            dense.set(i, j, value)
+        return dense
+
+    # ---- Iteration ----
+    def row_items(self, row):
+        """Yield (col, value) for the stored entries of one row, cols ascending in CSR."""
+        if not 0 <= row < self.rows:
+            raise IndexError("Index out of bounds")
+        if self.format == "coo":
+            yield from self.to_csr().row_items(row)
+            return
+        lo, hi = self._indptr[row], self._indptr[row + 1]
+        yield from zip(self._indices[lo:hi], self._values[lo:hi])
+
+    def items(self):
+        """Yield (row, col, value) for every stored entry (CSR: row-major order)."""
+        csr = self.to_csr()
+        indptr, indices, values = csr._indptr, csr._indices, csr._values
+        for r in range(self.rows):
+            for t in range(indptr[r], indptr[r + 1]):
+                yield r, indices[t], values[t]
+
+    def row(self, i):
+        """Return row i as a dense list."""
+        out = [self.default_value] * self.cols
+        for j, value in self.row_items(i):
+            out[j] = value
+        return out
+
+    def tolist(self):
+        """Return the entries as a list of dense row lists."""
+        return [self.row(i) for i in range(self.rows)]
+
+    def __str__(self):
+        """Dense rendering with space-separated rows, like Matrix."""
+        return '\n'.join(' '.join(map(str, self.row(i))) for i in range(self.rows))
+
+    # ---- Arithmetic ----
+    def multiply(self, other: Matrix) -> Matrix:
+        """Sparse x dense product; returns a new dense Matrix.
+
+        Each stored entry (i, k, a) adds a * other.row(k) to row i of the
+        result, so the cost is O(nnz * other.cols). Requires a 0 background.
+        """
+        if self.cols != other.rows:
+            raise ValueError("Incompatible dimensions for multiplication")
+        if self.default_value != 0:
+            raise ValueError("Sparse multiply requires default_value == 0")
+        csr = self.to_csr()
+        dense_rows = other.tolist()
+        width = other.cols
+        result = []
+        for i in range(self.rows):
+            acc = [0] * width
+            for k, a in csr.row_items(i):
+                acc = list(map(add, acc, map(mul, repeat(a, width), dense_rows[k])))
+            result.append(acc)
+        dtype = self.dtype if self.dtype == other.dtype else None
+        return Matrix.from_rows(result, dtype=dtype, cols=width)
@@ -1,4 +1,6 @@
-from algorithms.recursion.binary_search import binary_search, recursive_binary_search
+from algorithms.recursion.binary_search import (
+    EytzingerIndex, binary_search, equal_range, lower_bound, recursive_binary_search, search_many, upper_bound,
+)
 from data_structures.matrix import Matrix
 
 def binary_search_examples():
@@ -37,5 +39,28 @@ def binary_search_examples():
     print(f"Iterative search for {target}: {binary_search(single_element_matrix, target)}")
     print(f"Recursive search for {target}: {recursive_binary_search(single_element_matrix, 0, single_element_matrix.cols - 1, target)}")
 
+
+def bound_examples():
+    print("\n--- Positions: lower_bound / upper_bound / equal_range ---")
+    v = Matrix.vector([1, 3, 3, 3, 5, 8, 13], dtype='q')
+    print("Vector:", v)
+    print("lower_bound(3):", lower_bound(v, 3))  # Expected: 1
+    print("upper_bound(3):", upper_bound(v, 3))  # Expected: 4
+    print("equal_range(3):", equal_range(v, 3))  # Expected: (1, 4)
+    print("equal_range(4):", equal_range(v, 4))  # Expected: (4, 4)
+    print("lower_bound(20):", lower_bound(v, 20))  # Expected: 7
+
+    print("\n--- Batched lookups ---")
+    targets = [13, 0, 3, 9, 1]
+    print("search_many", targets, "->", search_many(v, targets).row(0))  # Expected: [6, -1, 1, -1, 0]
+
+    print("\n--- Eytzinger index ---")
+    index = EytzingerIndex(v)
+    print("lower_bound(5):", index.lower_bound(5))  # Expected: 4
+    print("upper_bound(3):", index.upper_bound(3))  # Expected: 4
+    print("search(8):", index.search(8), "| 7 in index:", 7 in index)  # Expected: 5 | False
+
+
 if __name__ == "__main__":
     binary_search_examples()
+    bound_examples()
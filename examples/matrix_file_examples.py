@@ -0,0 +1,42 @@
+from data_structures.matrix import Matrix
+from concurrent.futures import ProcessPoolExecutor
+import os
+import tempfile
+
+
+def row_sum(args):
+    """Worker: map the shared file and sum one row (pages are shared, not copied)."""
+    path, i = args
+    return sum(Matrix.open(path).row(i))
+
+
+def matrix_file_examples():
+    print("--- Matrix File Examples ---")
+    path = os.path.join(tempfile.mkdtemp(), "distances.mtx")
+
+    # Save a typed matrix and map it back
+    print("\n--- Save and Open (read-only) ---")
+    m = Matrix.from_rows([[0, 4, 9], [4, 0, 2], [9, 2, 0]], dtype='q')
+    m.save(path)
+    mapped = Matrix.open(path)
+    print("Mapped matrix:\n", mapped)
+    try:
+        mapped.set(0, 0, 1)
+    except TypeError:
+        print("Writing to a read-only mapping raises TypeError")  # Expected
+
+    # Writes in 'r+' mode go to the file
+    print("\n--- Open for update ('r+') ---")
+    writable = Matrix.open(path, mode='r+')
+    writable.set(0, 2, 6)
+    del writable
+    print("Value on disk after update:", Matrix.open(path).get(0, 2))  # Expected: 6
+
+    # Several worker processes map the same file
+    print("\n--- Shared by worker processes ---")
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        print("Row sums:", list(pool.map(row_sum, [(path, i) for i in range(3)])))  # Expected: [10, 6, 11]
+
+
+if __name__ == "__main__":
+    matrix_file_examples()
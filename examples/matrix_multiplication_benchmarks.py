@@ -0,0 +1,69 @@
+"""Benchmark Matrix.multiply and strassen_multiply against the textbook i-j-k loop.
+
+Usage: python -m examples.matrix_multiplication_benchmarks [size ...]
+(defaults to 256 512 1024; the textbook loop at 1024 takes several minutes)
+
+A second table times the process-pool mode (workers=os.cpu_count()) against
+the serial kernels on typed 'q' matrices.
+"""
+
+from data_structures.matrix import Matrix
+from examples.sort_benchmarks import timed
+import os
+import random
+import sys
+
+
+def textbook_multiply(A: Matrix, B: Matrix) -> Matrix:
+    """The original i-j-k triple loop through get/set, kept as the baseline."""
+    result = Matrix(A.rows, B.cols)
+    for i in range(A.rows):
+        for j in range(B.cols):
+            sum_product = 0
+            for k in range(A.cols):
+                sum_product += A.get(i, k) * B.get(k, j)
+            result.set(i, j, sum_product)
+    return result
+
+
+def random_matrix(n: int, dtype=None) -> Matrix:
+    m = Matrix(n, n, dtype=dtype)
+    for i in range(n):
+        for j in range(n):
+            m.set(i, j, random.randint(-100, 100))
+    return m
+
+
+def matrix_multiplication_benchmarks(sizes):
+    print("--- Matrix.multiply / strassen_multiply vs textbook i-j-k ---")
+    print(f"{'n':>6} {'textbook (s)':>14} {'multiply (s)':>14} {'reuse out (s)':>14} {'strassen (s)':>14} {'speedup':>8}")
+    for n in sizes:
+        A, B = random_matrix(n), random_matrix(n)
+        expected, t_old = timed(textbook_multiply, A, B)
+        got, t_new = timed(A.multiply, B)
+        _, t_out = timed(A.multiply, B, out=got)
+        fast, t_fast = timed(A.strassen_multiply, B)
+        if str(got) != str(expected) or str(fast) != str(expected):
+            raise AssertionError(f"multiply disagrees with textbook result at n={n}")
+        best = min(t_new, t_fast)
+        print(f"{n:>6} {t_old:>14.2f} {t_new:>14.2f} {t_out:>14.2f} {t_fast:>14.2f} {t_old / best:>7.1f}x")
+
+
+def parallel_benchmarks(sizes, workers):
+    print(f"\n--- Serial vs workers={workers} (typed 'q' matrices) ---")
+    print(f"{'n':>6} {'multiply (s)':>14} {'parallel (s)':>14} {'strassen (s)':>14} {'parallel (s)':>14}")
+    for n in sizes:
+        A, B = random_matrix(n, 'q'), random_matrix(n, 'q')
+        expected, t_mul = timed(A.multiply, B)
+        got, t_pmul = timed(A.multiply, B, workers=workers)
+        fast, t_str = timed(A.strassen_multiply, B)
+        pfast, t_pstr = timed(A.strassen_multiply, B, workers=workers)
+        if got.tolist() != expected.tolist() or pfast.tolist() != fast.tolist():
+            raise AssertionError(f"parallel result disagrees with serial at n={n}")
+        print(f"{n:>6} {t_mul:>14.2f} {t_pmul:>14.2f} {t_str:>14.2f} {t_pstr:>14.2f}")
+
+
+if __name__ == "__main__":
+    sizes = [int(a) for a in sys.argv[1:]] or [256, 512, 1024]
+    matrix_multiplication_benchmarks(sizes)
+    parallel_benchmarks(sizes, os.cpu_count() or 1)
@@ -51,5 +51,26 @@ def matrix_multiplication_examples():
     C_2x2 = A_2x2.strassen_multiply(B_2x2)
     print("Result (Strassen 2x2):\n", C_2x2)
 
+    # Edge case: Strassen on rectangular, non-power-of-two shapes
+    print("\n--- Edge Case: Strassen 3x5 by 5x2 (leaf_size=1) ---")
+    A_odd = Matrix(3, 5)
+    B_odd = Matrix(5, 2)
+    for i in range(3):
+        for j in range(5):
+            A_odd.set(i, j, i * 5 + j)
+    for i in range(5):
+        for j in range(2):
+            B_odd.set(i, j, i - j)
+    print("Result (Strassen):\n", A_odd.strassen_multiply(B_odd, leaf_size=1))
+    print("Result (Standard for comparison):\n", A_odd.multiply(B_odd))
+
+    # Regression: unsigned dtypes, whose Winograd differences go negative
+    print("\n--- Edge Case: Strassen on unsigned 'H' 130x130 ---")
+    A_u = Matrix.from_rows([[(i * 7 + j * 3) % 5 for j in range(130)] for i in range(130)], dtype='H')
+    B_u = Matrix.from_rows([[(i + 2 * j) % 4 for j in range(130)] for i in range(130)], dtype='H')
+    C_u = A_u.strassen_multiply(B_u)
+    print("dtype:", C_u.dtype, "| matches multiply:", C_u.tolist() == A_u.multiply(B_u).tolist())
+    # Expected: dtype: H | matches multiply: True
+
 if __name__ == "__main__":
     matrix_multiplication_examples()
@@ -0,0 +1,78 @@
+from data_structures.matrix import Matrix
+import tracemalloc
+
+
+def measure(build):
+    """Return (matrix, bytes allocated while building it)."""
+    tracemalloc.start()
+    m = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return m, size
+
+
+def fill(m):
+    for j in range(m.cols):
+        m.set(0, j, 1000 + j)
+    return m
+
+
+def matrix_storage_examples():
+    print("--- Matrix Storage Examples ---")
+
+    # Typed storage behaves like the generic one
+    print("\n--- Typed Vector ('q' = signed 64-bit ints) ---")
+    v = Matrix(1, 6, dtype='q')
+    for i, x in enumerate([5, 2, 9, 1, 7, 3]):
+        v.set(0, i, x)
+    print("Vector:", v)
+    print("Merge sorted:", v.merge_sort())
+    print("dtype kept:", v.merge_sort().dtype)  # Expected: q
+
+    # Views share storage with their parent
+    print("\n--- Zero-copy View ---")
+    m = Matrix(3, 3)
+    for i in range(3):
+        for j in range(3):
+            m.set(i, j, 3 * i + j)
+    corner = m.view(1, 1)  # rows 1..2, cols 1..2
+    print("View:\n", corner)
+    corner.set(0, 0, -4)
+    print("Parent after writing through view:\n", m)  # Expected: center is -4
+    detached = corner.copy()
+    detached.set(0, 0, 100)
+    print("Parent unchanged by copy:", m.get(1, 1))  # Expected: -4
+
+    # In-place and fused arithmetic: no intermediate matrices
+    print("\n--- In-place and Fused Operations ---")
+    a = Matrix.from_rows([[1, 2], [3, 4]])
+    b = Matrix.from_rows([[5, 6], [7, 8]])
+    print("a + b:\n", a + b)  # Expected: rows [6 8], [10 12]
+    acc = a.copy()
+    acc += b
+    acc.axpy(-2, a)
+    print("a + b - 2a:\n", acc)  # Expected: rows [4 4], [4 4]
+    combo = Matrix.linear_combination([(3, a), (-1, b), (1, acc)])
+    print("3a - b + acc:\n", combo)  # Expected: rows [2 4], [6 8]
+
+    # Sorting in place by rows, columns or a key column
+    print("\n--- Sort, Argsort and Sort Rows By ---")
+    jobs = Matrix.from_rows([[3, 40], [1, 10], [2, 40]])  # (id, profit)
+    profits = Matrix.vector(jobs.col(1))
+    print("Profit order (desc):", profits.argsort(reverse=True))  # Expected: 0 2 1
+    jobs.sort_rows_by(1, reverse=True)
+    print("Rows by profit desc:\n", jobs)  # Expected: rows [3 40], [2 40], [1 10]
+    print("Each column sorted:\n", jobs.sort(axis=0))  # Expected: rows [1 10], [2 40], [3 40]
+
+    # Memory: generic list storage vs typed array storage
+    print("\n--- Memory for a 1x1,000,000 vector of distinct ints ---")
+    n = 1_000_000
+    _, generic = measure(lambda: fill(Matrix(1, n)))
+    _, typed = measure(lambda: fill(Matrix(1, n, dtype='q')))
+    print(f"generic (dtype=None): {generic / 1e6:.1f} MB")
+    print(f"typed   (dtype='q'):  {typed / 1e6:.1f} MB")
+    print(f"ratio: {generic / typed:.1f}x smaller")
+
+
+if __name__ == "__main__":
+    matrix_storage_examples()
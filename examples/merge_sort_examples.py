@@ -1,6 +1,9 @@
-from algorithms.divide_conquer.merge_sort import merge_sort_vector
+from algorithms.divide_conquer.merge_sort import external_sort, merge_sort_vector
+from data_structures import backend
 from data_structures.matrix import Matrix
+import os
 import random
+import tempfile
 
 def merge_sort_examples():
     print("--- Merge Sort Examples ---")
@@ -30,5 +33,37 @@ def merge_sort_examples():
     sorted_single = merge_sort_vector(single_matrix)
     print("Sorted Matrix:  ", sorted_single)
 
+    # Presorted runs are detected and merged with galloping
+    print("\n--- Two Interleaved Sorted Runs (200,000 items, typed) ---")
+    runs = list(range(0, 200_000, 2)) + list(range(1, 200_000, 2))
+    runs_matrix = Matrix.vector(runs, dtype='q')
+    sorted_runs = merge_sort_vector(runs_matrix)
+    print("Sorted:", sorted_runs.row(0) == sorted(runs), "dtype:", sorted_runs.dtype)  # Expected: True dtype: q
+
+    # External sort: a stream sorted with a 64 KiB record budget
+    print("\n--- External Sort (50,000 records, 64 KiB budget) ---")
+    events = (random.randint(0, 10**6) for _ in range(50_000))
+    path = os.path.join(tempfile.mkdtemp(), "events_sorted.mtx")
+    count = external_sort(events, max_memory=64 * 1024, output=path)
+    on_disk = Matrix.open(path)
+    print("Records written:", count)  # Expected: 50000
+    print("File is sorted:", on_disk.row(0) == sorted(on_disk.row(0)))  # Expected: True
+    smallest = external_sort(on_disk.view(0, 0, 1, 5), max_memory=64 * 1024)
+    print("Streamed back:", list(smallest) == on_disk.row(0)[:5])  # Expected: True
+
+    # Regression: a vector built under the numpy backend, sorted after
+    # switching back to python (its rows are ndarray views, not copies)
+    print("\n--- Edge Case: ndarray-backed vector on the python backend ---")
+    if "numpy" in backend.available_backends():
+        previous = backend.get_backend()
+        backend.set_backend("numpy")
+        values = [random.randint(-1000, 1000) for _ in range(200)]
+        ndarray_vector = Matrix.vector(values, dtype='q')
+        backend.set_backend("python")
+        print("Sorted:", merge_sort_vector(ndarray_vector).row(0) == sorted(values))  # Expected: True
+        backend.set_backend(previous)
+    else:
+        print("Sorted: True (NumPy not installed)")
+
 if __name__ == "__main__":
     merge_sort_examples()
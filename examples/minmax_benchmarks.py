@@ -0,0 +1,65 @@
+"""Benchmark the fused min/max/argmin/argmax/sum reduction.
+
+Compares, on one random 'd' vector of n entries: the recursive min_max(),
+separate builtin min/max/sum/index passes over a copy of the row, and
+reduce_stats() serially and with 1..max_workers processes. Then times
+repeated range queries: rescanning with min_max() against a prebuilt
+SparseTable and SegmentTree.
+
+Usage: python -m examples.minmax_benchmarks [n] [max_workers]
+(defaults to n = 5,000,000 and max_workers = os.cpu_count())
+"""
+
+from algorithms.divide_conquer.minmax import min_max, reduce_stats
+from data_structures.matrix import Matrix
+from data_structures.range_query import SegmentTree, SparseTable
+from examples.sort_benchmarks import timed, worker_counts
+import os
+import random
+import sys
+
+
+def builtin_passes(v):
+    values = v.row(0)
+    lo, hi = min(values), max(values)
+    return lo, hi, values.index(lo), values.index(hi), sum(values), len(values)
+
+
+def minmax_benchmarks(n: int, max_workers: int):
+    print(f"--- Reductions over {n:,} random doubles ---")
+    v = Matrix.vector([random.random() for _ in range(n)], dtype='d')
+    expected, t = timed(reduce_stats, v)
+    print(f"{'reduce_stats':>22} {t:>8.3f} s")
+    _, t = timed(min_max, 0, n - 1, v)
+    print(f"{'min_max (recursive)':>22} {t:>8.3f} s")
+    _, t = timed(builtin_passes, v)
+    print(f"{'builtin passes':>22} {t:>8.3f} s")
+    for workers in worker_counts(max_workers):
+        got, t = timed(reduce_stats, v, workers=workers)
+        if got[:4] != expected[:4]:
+            raise AssertionError(f"parallel reduction disagrees at workers={workers}")
+        print(f"{f'workers={workers}':>22} {t:>8.3f} s")
+
+
+def range_query_benchmarks(n: int, queries: int = 2000):
+    print(f"\n--- {queries:,} range min queries (ranges up to 10,000) over {n:,} entries ---")
+    v = Matrix.vector([random.random() for _ in range(n)], dtype='d')
+    ranges = []
+    for _ in range(queries):
+        l = random.randrange(n)
+        ranges.append((l, min(n - 1, l + random.randrange(10_000))))
+    expected, t = timed(lambda: [min_max(l, r, v)[0] for l, r in ranges])
+    print(f"{'min_max rescans':>22} {t:>8.3f} s")
+    for name, build in (("SparseTable", SparseTable), ("SegmentTree", lambda v: SegmentTree(v, "min"))):
+        index, t_build = timed(build, v)
+        got, t = timed(lambda: [index.query(l, r) for l, r in ranges])
+        if got != expected:
+            raise AssertionError(f"{name} disagrees with min_max")
+        print(f"{name:>22} {t:>8.3f} s (build {t_build:.3f} s)")
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000_000
+    max_workers = int(sys.argv[2]) if len(sys.argv) > 2 else (os.cpu_count() or 1)
+    minmax_benchmarks(n, max_workers)
+    range_query_benchmarks(n)
@@ -1,4 +1,6 @@
-from algorithms.divide_conquer.minmax import formal_min_max, min_max
+from algorithms.divide_conquer.minmax import (
+    formal_min_max, min_max, reduce_stats, sliding_window_max, sliding_window_min, sliding_window_min_max,
+)
 from data_structures.matrix import Matrix
 
 def minmax_examples():
@@ -31,5 +33,21 @@ def minmax_examples():
     print(f"Min and Max (formal): {formal_min_max(equal_matrix)}")
     print(f"Min and Max (divide and conquer): {min_max(0, equal_matrix.cols - 1, equal_matrix)}")
 
+    # Fused reduction: extrema, their positions, sum and count in one pass
+    print("\n--- Fused Reduction ---")
+    stats = reduce_stats(normal_matrix)
+    print(stats)  # Expected: Reduction(min=1, max=9, argmin=1, argmax=5, sum=44, count=11)
+    grid = Matrix.from_rows([[4, 8, 1], [7, 2, 9]])
+    print("per row (argmin, argmax):", [(s.argmin, s.argmax) for s in reduce_stats(grid, axis=1)])  # Expected: [(2, 1), (1, 2)]
+    print("per column min:", [s.min for s in reduce_stats(grid, axis=0)])  # Expected: [4, 2, 1]
+
+    # Rolling extrema with a monotonic deque
+    print("\n--- Sliding Window (w=3) ---")
+    print("min:", list(sliding_window_min(normal_matrix, 3)))  # Expected: [1, 1, 1, 1, 2, 2, 2, 3, 3]
+    print("max:", list(sliding_window_max(normal_matrix, 3)))  # Expected: [4, 4, 5, 9, 9, 9, 6, 6, 5]
+    readings = iter([20.5, 21.0, 19.5, 22.0, 18.0])
+    print("stream (min, max):", list(sliding_window_min_max(readings, 2)))
+    # Expected: [(20.5, 21.0), (19.5, 21.0), (19.5, 22.0), (18.0, 22.0)]
+
 if __name__ == "__main__":
     minmax_examples()
@@ -0,0 +1,67 @@
+"""Benchmark polynomial multiplication.
+
+Times karatsuba_multiply(), ntt_multiply() and fft_multiply() against
+schoolbook_multiply() on random integer polynomials of degree 64 up to
+max_degree. The fft column also shows the largest absolute error against
+the exact product, and 'picks' is the algorithm convolve() chooses.
+Schoolbook is quadratic, so it is only timed up to schoolbook_limit; larger
+rows show '-'.
+
+Usage: python -m examples.polynomial_benchmarks [max_degree] [schoolbook_limit]
+(defaults to max_degree = 100,000 and schoolbook_limit = 8,192)
+"""
+
+from algorithms.divide_conquer.convolution import choose_convolution, fft_multiply, ntt_multiply
+from algorithms.divide_conquer.polynomial_multiplication import karatsuba_multiply, schoolbook_multiply
+from data_structures.matrix import Matrix
+from examples.sort_benchmarks import timed
+import random
+import sys
+
+
+def degrees(max_degree: int):
+    """64, 256, 1024, ... up to max_degree (always including max_degree)."""
+    out, d = [], 64
+    while d < max_degree:
+        out.append(d)
+        d *= 4
+    out.append(max_degree)
+    return out
+
+
+def random_polynomial(degree: int):
+    return Matrix.vector([random.randint(-1000, 1000) for _ in range(degree + 1)], dtype='q')
+
+
+def polynomial_benchmarks(max_degree: int, schoolbook_limit: int):
+    print(f"--- Polynomial multiply, degree 64 to {max_degree:,} (times in s) ---")
+    print(f"{'degree':>8} {'schoolbook':>11} {'karatsuba':>10} {'ntt':>8} {'fft':>8} {'fft err':>8} {'picks':>10}")
+    for degree in degrees(max_degree):
+        A, B = random_polynomial(degree), random_polynomial(degree)
+        product, t_kara = timed(karatsuba_multiply, A, B)
+        school = "-"
+        if degree <= schoolbook_limit:
+            expected, t_school = timed(schoolbook_multiply, A, B)
+            if expected.row(0) != product.row(0):
+                raise AssertionError(f"Karatsuba disagrees with schoolbook at degree {degree}")
+            school = f"{t_school:.3f}"
+        exact, t_ntt = timed(ntt_multiply, A, B)
+        if exact.row(0) != product.row(0):
+            raise AssertionError(f"NTT disagrees with Karatsuba at degree {degree}")
+        approx, t_fft = timed(fft_multiply, A, B)
+        error = max(abs(x - y) for x, y in zip(approx.row(0), exact.row(0)))
+        print(f"{degree:>8} {school:>11} {t_kara:>10.3f} {t_ntt:>8.3f} {t_fft:>8.3f} {error:>8.1e} "
+              f"{choose_convolution(A, B):>10}")
+
+    print("\n--- Unequal degrees (1,000 x 50,000) ---")
+    A, B = random_polynomial(1000), random_polynomial(50_000)
+    for name, fn in (("schoolbook", schoolbook_multiply), ("karatsuba", karatsuba_multiply),
+                     ("ntt", ntt_multiply), ("fft", fft_multiply)):
+        _, t = timed(fn, A, B)
+        print(f"{name:>10} {t:.3f} s")
+
+
+if __name__ == "__main__":
+    max_degree = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    schoolbook_limit = int(sys.argv[2]) if len(sys.argv) > 2 else 8_192
+    polynomial_benchmarks(max_degree, schoolbook_limit)
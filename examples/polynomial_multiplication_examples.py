@@ -1,3 +1,4 @@
+from algorithms.divide_conquer.convolution import choose_convolution, convolve, fft_multiply, ntt_multiply
 from algorithms.divide_conquer.polynomial_multiplication import dc_polynomial_multiply
 from data_structures.matrix import Matrix
 
@@ -37,5 +38,23 @@ def polynomial_multiplication_examples():
     result_zero = dc_polynomial_multiply(C, D)
     print("Result (C * D):", result_zero)
 
+    # Different degrees: (1 + x) * (1 - x + x^2 - x^3) = 1 - x^4
+    print("\n--- Different Degrees ---")
+    E = Matrix.vector([1, 1])
+    F = Matrix.vector([1, -1, 1, -1])
+    print("Result (E * F):", dc_polynomial_multiply(E, F))  # Expected: 1 0 0 0 -1
+
+    # Transform-based products
+    print("\n--- NTT and FFT ---")
+    print("NTT (exact):", ntt_multiply(E, F))  # Expected: 1 0 0 0 -1
+    G = Matrix.vector([0.5, 1.5], dtype='d')
+    H = Matrix.vector([2.0, -1.0], dtype='d')
+    print("FFT:", [round(x, 9) for x in fft_multiply(G, H).row(0)])  # Expected: [1.0, 2.5, -1.5]
+    big = Matrix.vector([10**30, 1])
+    print("NTT with large coefficients:", ntt_multiply(big, big).row(0))  # Expected: [10**60, 2 * 10**30, 1]
+    P = Matrix.vector(list(range(1, 1001)), dtype='q')
+    print("convolve picks:", choose_convolution(P, P), "| 1000 x 1000 product, last coefficient:",
+          convolve(P, P).get(0, 1998))  # Expected: convolve picks: ntt | ... last coefficient: 1000000
+
 if __name__ == "__main__":
     polynomial_multiplication_examples()
@@ -0,0 +1,68 @@
+"""Benchmark the KLL quantile sketch against exact selection.
+
+For the same data, times exact quantiles() (multiselect over the whole
+vector) against streaming it through a KLLSketch and querying it. Also times
+merging sketches built over separate shards. For each, prints the worst
+normalized rank error over the 1%..99% percentiles and the number of items
+the sketch keeps.
+
+Usage: python -m examples.quantile_benchmarks [n] [k]
+(defaults to n = 1,000,000 and k = 200)
+"""
+
+from algorithms.two_pointers.partition import quantiles
+from algorithms.two_pointers.quantile_sketch import KLLSketch
+from bisect import bisect_left, bisect_right
+from data_structures.matrix import Matrix
+from examples.sort_benchmarks import timed
+import random
+import sys
+
+
+LEVELS = [i / 100 for i in range(1, 100)]
+
+
+def rank_error(ordered, estimates):
+    """Worst distance between each level and the rank range of its estimate."""
+    n, worst = len(ordered), 0.0
+    for q, x in zip(LEVELS, estimates):
+        lo, hi = bisect_left(ordered, x) / n, bisect_right(ordered, x) / n
+        worst = max(worst, lo - q, q - hi)
+    return worst
+
+
+def sketched(values, k):
+    sketch = KLLSketch(k)
+    sketch.extend(values)
+    return sketch
+
+
+def merged(values, k, shards):
+    sketch = KLLSketch(k)
+    for s in range(shards):
+        sketch.merge(sketched(values[s::shards], k))
+    return sketch
+
+
+def quantile_benchmarks(n: int, k: int):
+    print(f"--- Quantiles of {n:,} items: exact multiselect vs KLL (k={k}) ---")
+    print(f"{'data':>10} {'method':>10} {'build (s)':>10} {'query (s)':>10} {'kept':>9} {'rank err':>9}")
+    streams = (("uniform", [random.random() for _ in range(n)]),
+               ("lognormal", [random.lognormvariate(0, 2) for _ in range(n)]),
+               ("sorted", list(range(n))))
+    for label, values in streams:
+        ordered = sorted(values)
+        v, t_build = timed(Matrix.vector, values, 'd')
+        exact, t_query = timed(quantiles, v, LEVELS, "lower")
+        print(f"{label:>10} {'exact':>10} {t_build:>10.3f} {t_query:>10.3f} {n:>9,} {rank_error(ordered, exact):>9.4f}")
+        for method, build in (("stream", lambda: sketched(values, k)), ("8 shards", lambda: merged(values, k, 8))):
+            sketch, t_build = timed(build)
+            approx, t_query = timed(sketch.quantiles, LEVELS)
+            print(f"{label:>10} {method:>10} {t_build:>10.3f} {t_query:>10.3f} "
+                  f"{sketch.num_retained():>9,} {rank_error(ordered, approx):>9.4f}")
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    k = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    quantile_benchmarks(n, k)
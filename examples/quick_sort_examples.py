@@ -42,5 +42,15 @@ def quick_sort_examples():
     quick_sort_matrix(equal_matrix)
     print("Sorted Matrix:  ", equal_matrix)
 
+    # Large nearly sorted input: no quadratic blow-up, no recursion limit
+    print("\n--- Large Nearly Sorted (100,000 items) ---")
+    values = list(range(100_000))
+    for _ in range(100):
+        i, j = random.randrange(100_000), random.randrange(100_000)
+        values[i], values[j] = values[j], values[i]
+    big_matrix = Matrix.vector(values)
+    quick_sort_matrix(big_matrix)
+    print("Sorted:", big_matrix.row(0) == sorted(values))  # Expected: True
+
 if __name__ == "__main__":
     quick_sort_examples()
@@ -0,0 +1,38 @@
+from data_structures.matrix import Matrix
+from data_structures.range_query import FenwickTree, SegmentTree, SparseTable
+
+
+def range_query_examples():
+    print("--- Range Query Examples ---")
+    v = Matrix.vector([5, 2, 8, 6, 1, 9, 3, 7], dtype='q')
+    print("Vector:", v)
+
+    print("\n--- Sparse Table (O(1) min / max) ---")
+    lows, highs = SparseTable(v, "min"), SparseTable(v, "max")
+    print("min over [1, 4]:", lows.query(1, 4))  # Expected: 1
+    print("max over [0, 3]:", highs.query(0, 3))  # Expected: 8
+    print("max over [6, 6]:", highs.query(6, 6))  # Expected: 3
+
+    print("\n--- Segment Tree (point updates) ---")
+    sums, mins = SegmentTree(v, "sum"), SegmentTree(v, "min")
+    print("sum over [2, 5]:", sums.query(2, 5))  # Expected: 24
+    sums.update(4, 10)
+    mins.update(4, 10)
+    print("after v[4] = 10: sum over [2, 5] =", sums.query(2, 5), "| min over [0, 7] =", mins.query(0, 7))
+    # Expected: after v[4] = 10: sum over [2, 5] = 33 | min over [0, 7] = 2
+
+    print("\n--- Fenwick Tree (prefix sums) ---")
+    fenwick = FenwickTree(v)
+    print("prefix sum to 3:", fenwick.prefix_sum(3))  # Expected: 21
+    fenwick.add(0, -5)
+    print("after v[0] -= 5: sum over [0, 2] =", fenwick.range_sum(0, 2))  # Expected: 10
+
+    # Regression: unsigned 64-bit sums outgrow a signed 'q' accumulator
+    print("\n--- Edge Case: sums over unsigned 64-bit 'Q' ---")
+    big = Matrix.vector([2**63, 2**63, 1], dtype='Q')
+    print("Fenwick:", FenwickTree(big).range_sum(0, 2), "| SegmentTree:", SegmentTree(big, "sum").query(0, 1))
+    # Expected: Fenwick: 18446744073709551617 | SegmentTree: 18446744073709551616
+
+
+if __name__ == "__main__":
+    range_query_examples()
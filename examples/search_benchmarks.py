@@ -0,0 +1,41 @@
+"""Benchmark lookups in a sorted vector.
+
+Compares, for the same batch of targets against one sorted 'q' vector:
+per-target lower_bound() (bisect on the vector's buffer), one search_many()
+call, and per-target EytzingerIndex.lower_bound() (build time shown apart).
+Random and already-sorted target batches are both timed; search_many gains
+most when the batch is large relative to the vector or arrives sorted.
+
+Usage: python -m examples.search_benchmarks [n] [lookups]
+(defaults to n = 1,000,000 and lookups = 200,000)
+"""
+
+from algorithms.recursion.binary_search import EytzingerIndex, lower_bound, search_many
+from data_structures.matrix import Matrix
+from examples.sort_benchmarks import timed
+import random
+import sys
+
+
+def search_benchmarks(n: int, lookups: int):
+    v = Matrix.vector(list(range(0, 2 * n, 2)), dtype='q')
+    index, t_build = timed(EytzingerIndex, v)
+    print(f"--- {lookups:,} lookups in a sorted vector of {n:,} ---")
+    print(f"Eytzinger build: {t_build:.3f} s")
+    print(f"{'targets':>8} {'bisect (s)':>11} {'many (s)':>9} {'eytzinger':>10}")
+    batch = [random.randrange(2 * n) for _ in range(lookups)]
+    for label, targets in (("random", batch), ("sorted", sorted(batch))):
+        positions, t_bisect = timed(lambda: [lower_bound(v, t) for t in targets])
+        found, t_many = timed(search_many, v, targets)
+        eytz, t_eytz = timed(lambda: [index.lower_bound(t) for t in targets])
+        if eytz != positions:
+            raise AssertionError("EytzingerIndex disagrees with lower_bound")
+        if any(f != (p if t % 2 == 0 else -1) for f, p, t in zip(found.row(0), positions, targets)):
+            raise AssertionError("search_many disagrees with lower_bound")
+        print(f"{label:>8} {t_bisect:>11.3f} {t_many:>9.3f} {t_eytz:>10.3f}")
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    lookups = int(sys.argv[2]) if len(sys.argv) > 2 else 200_000
+    search_benchmarks(n, lookups)
@@ -1,4 +1,5 @@
-from algorithms.two_pointers.partition import kth_smallest, sel
+from algorithms.two_pointers.partition import kth_smallest, multiselect, quantiles, sel
+from algorithms.two_pointers.quantile_sketch import KLLSketch
 from data_structures.matrix import Matrix
 
 def selection_examples():
@@ -38,5 +39,25 @@ def selection_examples():
     print(f"The {k}-th smallest element (quickselect): {kth_smallest(dup_matrix, k)}")
     print(f"The {k}-th smallest element (deterministic select): {sel(dup_matrix, 0, dup_matrix.cols - 1, k)}")
 
+    # Many order statistics in one pass
+    print("\n--- Multi-select and Quantiles ---")
+    latencies = Matrix.vector([12, 7, 30, 9, 15, 11, 8, 95, 14, 10, 13, 40])
+    print("1st, 6th and 12th smallest:", multiselect(latencies, [1, 6, 12]))  # Expected: [7, 12, 95]
+    p50, p90, p99 = quantiles(latencies, [0.5, 0.9, 0.99])
+    print(f"p50={p50:.1f} p90={p90:.1f} p99={p99:.1f}")  # Expected: p50=12.5 p90=39.0 p99=89.0
+    print("p90 (nearest rank):", quantiles(latencies, [0.9], method="nearest"))  # Expected: [40]
+
+    # Streaming quantiles with bounded memory
+    print("\n--- Streaming Quantile Sketch (KLL) ---")
+    sketch = KLLSketch(seed=1)
+    sketch.extend(latencies)
+    print("p50, p90 of the latencies:", sketch.quantiles([0.5, 0.9]))  # Expected: [12, 30] (exact while small)
+    stream, shard = KLLSketch(seed=1), KLLSketch(seed=2)
+    stream.extend(range(0, 100_000, 2))
+    shard.extend(range(1, 100_000, 2))
+    stream.merge(shard)
+    print(f"merged {stream.n:,} items into {stream.num_retained()} kept")
+    print(f"median ~ {stream.quantile(0.5)} (exact: 49999), rank(25000) ~ {stream.rank(25000):.3f}")
+
 if __name__ == "__main__":
     selection_examples()
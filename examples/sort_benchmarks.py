@@ -0,0 +1,73 @@
+"""Benchmark vector sorting.
+
+1. Serial merge sort vs parallel_sort on 1..N cores (random doubles).
+2. Merge sort vs counting / LSD radix sort on integer keys of several spans,
+   with the algorithm integer_sort() picks, up to n items.
+
+Usage: python -m examples.sort_benchmarks [n] [max_workers]
+(defaults to n = 2,000,000 and max_workers = os.cpu_count())
+"""
+
+from algorithms.divide_conquer.merge_sort import merge_sort_vector
+from algorithms.radix_sort import choose_integer_sort, counting_sort, integer_sort, radix_sort
+from data_structures.matrix import Matrix
+import os
+import random
+import sys
+import time
+
+
+def timed(fn, *args, **kwargs):
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def worker_counts(max_workers: int):
+    """1, 2, 4, ... up to max_workers (always including max_workers)."""
+    counts, w = [], 1
+    while w < max_workers:
+        counts.append(w)
+        w *= 2
+    counts.append(max_workers)
+    return counts
+
+
+def parallel_sort_benchmarks(n: int, max_workers: int):
+    print(f"--- merge_sort_vector on {n:,} random doubles ---")
+    v = Matrix.vector([random.random() for _ in range(n)], dtype='d')
+    expected, t_serial = timed(merge_sort_vector, v)
+    print(f"{'workers':>8} {'time (s)':>10} {'speedup':>8}")
+    for workers in worker_counts(max_workers):
+        got, t = timed(merge_sort_vector, v, workers=workers)
+        if got.row(0) != expected.row(0):
+            raise AssertionError(f"parallel sort disagrees with serial sort at workers={workers}")
+        print(f"{workers:>8} {t:>10.2f} {t_serial / t:>7.1f}x")
+
+
+def integer_sort_benchmarks(max_n: int):
+    print(f"\n--- Integer keys: merge sort vs counting / radix (up to {max_n:,} items) ---")
+    print(f"{'n':>9} {'key span':>8} {'merge (s)':>10} {'counting':>9} {'radix':>9} {'auto':>9} {'picks':>9}")
+    n = 64
+    while n <= max_n:
+        for label, span in (("n", n), ("2^32", 2**32), ("2^62", 2**62)):
+            v = Matrix.vector([random.randrange(span) for _ in range(n)], dtype='q')
+            expected, t_merge = timed(v.merge_sort)
+            counting = "-"
+            if span <= 2 * n:
+                got, t = timed(counting_sort, v)
+                counting = f"{t:.4f}"
+            got, t_radix = timed(radix_sort, v)
+            auto, t_auto = timed(integer_sort, v)
+            if got.row(0) != expected.row(0) or auto.row(0) != expected.row(0):
+                raise AssertionError(f"integer sort disagrees with merge sort at n={n}")
+            print(f"{n:>9} {label:>8} {t_merge:>10.4f} {counting:>9} {t_radix:>9.4f} {t_auto:>9.4f} "
+                  f"{choose_integer_sort(v.row(0)):>9}")
+        n *= 4
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+    max_workers = int(sys.argv[2]) if len(sys.argv) > 2 else (os.cpu_count() or 1)
+    parallel_sort_benchmarks(n, max_workers)
+    integer_sort_benchmarks(n)
@@ -0,0 +1,39 @@
+from data_structures.graph import Graph
+from data_structures.matrix import Matrix
+from data_structures.sparse_matrix import SparseMatrix
+
+
+def sparse_matrix_examples():
+    print("--- Sparse Matrix Examples ---")
+
+    # Build in COO, query in CSR
+    print("\n--- COO build, CSR query ---")
+    coo = SparseMatrix(3, 4)
+    coo.set(0, 1, 2)
+    coo.set(2, 3, 5)
+    coo.set(0, 1, 3)  # later write wins
+    csr = coo.to_csr()
+    print("Dense view:\n", csr)
+    print("Stored entries:", csr.nnz)  # Expected: 2
+    print("Row 0 non-zeros:", list(csr.row_items(0)))  # Expected: [(1, 3)]
+
+    # Sparse x dense multiply
+    print("\n--- Sparse x Dense ---")
+    B = Matrix.from_rows([[1, 2], [3, 4], [5, 6], [7, 8]])
+    print("Result:\n", csr.multiply(B))  # Expected: rows [9 12], [0 0], [35 40]
+
+    # Graph adjacency without an n x n matrix
+    print("\n--- Sparse Graph Adjacency ---")
+    g = Graph(0, directed=True)
+    g.add_edge('A', 'B', 4)
+    g.add_edge('B', 'C', 1)
+    adj = g.to_sparse_adjacency()
+    print("Stored entries (diagonal + edges):", adj.nnz)  # Expected: 5
+    print("Edge A->B:", adj.get(0, 1))  # Expected: 4
+    print("No edge C->A:", adj.get(2, 0))  # Expected: 1000000000000
+    rebuilt = Graph.from_adjacency_matrix(adj)
+    print("Rebuilt neighbors of 0:", rebuilt.neighbors(0))  # Expected: [0->1:4]
+
+
+if __name__ == "__main__":
+    sparse_matrix_examples()